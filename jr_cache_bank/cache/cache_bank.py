@@ -21,6 +21,7 @@ Methods:
 -----------
     - get: Returns the value associated with the key in the cache bank.
     - set: Sets the value associated with the key in the cache bank.
+    - bulk_call: Calls a function for several arguments through the cache bank.
     - clear: Clears the cache bank.
     - remove: Removes the item associated with the key in the cache bank.
     - items: Returns a list of tuples containing the key-value pairs in the cache bank.
@@ -28,6 +29,7 @@ Methods:
     - values: Returns a list of values in the cache bank.
     - is_full: Returns True if the cache bank is full, False otherwise.
     - is_empty: Returns True if the cache bank is empty, False otherwise.
+    - entry_stats: Returns the number of cached entries of a function and the bytes they hold.
     - print: Prints the cache bank.
     - save: Saves the cache bank to a file.
     - load: Loads the cache bank from a file.
@@ -85,27 +87,27 @@ Example:
 # Imports
 # -------------------------------------------------------------------------------------------------
 
-import json
 import logging
 import os
-from re import L
 import sys
-import io
 import threading
 import asyncio
+import time
+import weakref
 
 from pathlib import Path
 from functools import partial, wraps
 
 from collections import OrderedDict
-from typing import Callable, Any, Dict, List, Optional, Tuple, Union
+from typing import Callable, Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+from weakref import WeakKeyDictionary
 
 # Locals
 from jr_cache_bank.config.setup_logger import setup_logger
 from jr_cache_bank.cache.cache_reporter import CacheReporter
 from jr_cache_bank.cache.cache_enums import CacheType, CacheSize
-from jr_cache_bank.cache.cache_load_comp import LoadersContainer
-from jr_cache_bank.cache.cache_save_comp import ConvertersContainer
+from jr_cache_bank.cache.cache_load_comp import LoadersContainer, _json_loads
+from jr_cache_bank.cache.cache_save_comp import BytesLike, ConvertersContainer
 
 from jr_cache_bank.exceptions.exceptions_cache_bank import (
     CacheBankConstructionError,
@@ -140,6 +142,48 @@ except Exception as e:
     LOGGER.addHandler(handler)
     LOGGER.error(f"Error setting up logger: {e}")
 
+# -------------------------------------------------------------------------------------------------
+# Constants
+# -------------------------------------------------------------------------------------------------
+
+# Cache types whose converter takes a level of compression
+COMPRESSED_CACHE_TYPES: frozenset = frozenset({
+    CacheType.ZLIB,
+    CacheType.GZIP,
+    CacheType.LZ4,
+    CacheType.ZSTD
+})
+# Share of its maximum size a function is trimmed down to, so evictions run in batches
+EVICTION_LOW_WATER: float = 0.9
+# Argument types that are their own key, matched by exact type so subclasses are still normalized
+SCALAR_ARG_TYPES: frozenset = frozenset({int, float, complex, str, bytes, bool, type(None)})
+# Marks the missing keys of a batched lookup, where None is a valid result
+_MISSING: object = object()
+
+# -------------------------------------------------------------------------------------------------
+# Helpers
+# -------------------------------------------------------------------------------------------------
+
+def _hashable_arg(arg: Any) -> Any:
+    """
+    _hashable_arg
+    =============
+    Converts one argument to its key: dictionaries to sorted item tuples, lists and tuples to tuples.
+
+    Arguments:
+        arg (Any) :
+            The argument to convert.
+
+    Returns:
+        Any :
+            The hashable key of the argument.
+    """
+    if isinstance(arg, dict):
+        return tuple(sorted(arg.items()))
+    if isinstance(arg, (list, tuple)):
+        return tuple(arg)
+    return arg
+
 # -------------------------------------------------------------------------------------------------
 # CLasses
 # -------------------------------------------------------------------------------------------------
@@ -201,6 +245,9 @@ class CacheBank:
         filename (str | Path) :
             The name of the file to save the cache bank to.
             - Default is None.
+        min_cost_ns (int) :
+            The minimum run time (nanoseconds) of a wrapped call for its result to be cached.
+            - Default is 0, every result is cached.
     
     Methods:
     ---------
@@ -212,6 +259,8 @@ class CacheBank:
             Clears the cache bank.
         ### remove(key: Any) :
             Removes the item associated with the key in the cache bank.
+        ### bulk_call(func: Callable, args_iter: Iterable) :
+            Calls a function for several arguments through the cache bank.
         ### items() :
             Returns a list of tuples containing the key-value pairs in the cache bank.
         ### keys() :
@@ -222,6 +271,8 @@ class CacheBank:
             Returns True if the cache bank is full, False otherwise.
         ### is_empty() :
             Returns True if the cache bank is empty, False otherwise.
+        ### entry_stats(func: str) :
+            Returns the number of cached entries of a function and the bytes they hold.
         ### save(filename: str | Path | None) :
             Saves the cache bank to a file.
         ### load(filename: str | Path | None) :
@@ -320,7 +371,10 @@ class CacheBank:
         "_cache_type",
         "_converter_container",
         "_loaders_container",
-        "_mutex"
+        "_mutex",
+        "_func_bytes",
+        "_min_cost_ns",
+        "_wrappers"
     )
 
     # -------------
@@ -340,6 +394,9 @@ class CacheBank:
     _converter_container: ConvertersContainer
     _loaders_container: LoadersContainer
     _mutex: Optional[threading.Lock]
+    _func_bytes: Dict[str, List[int]]
+    _min_cost_ns: int
+    _wrappers: WeakKeyDictionary[Callable | partial, weakref.ref]
 
     # -------------
     # Constructor
@@ -355,6 +412,7 @@ class CacheBank:
         cache_bank: Optional[OrderedDict[str, OrderedDict[Tuple, Any]]] = None,
         func_size_dict: Optional[Dict[str, CacheSize]] = None,
         filename: Optional[Union[str, Path]] = None,
+        min_cost_ns: int = 0,
     ):
         """
         __init__
@@ -391,6 +449,10 @@ class CacheBank:
             filename (str | Path) :
                 The name of the file to save the cache bank to.
                 - Default is None.
+            min_cost_ns (int) :
+                The minimum run time (nanoseconds) of a wrapped call for its result to be cached.
+                - Cheaper calls are recomputed instead of filling the cache and triggering evictions.
+                - Default is 0, every result is cached.
         """
         try:
             super().__init__()
@@ -401,12 +463,14 @@ class CacheBank:
             self._converter_container = ConvertersContainer()
             # Initialize the loaders_container
             self._loaders_container = LoadersContainer()
+            # Wrappers made by __call__, both sides held weakly
+            self._wrappers = WeakKeyDictionary()
 
             if filename:
                 self.filename = filename
             else:
                 # Handle filename
-                self.filename = Path(f"jr_cache_bank/cache/dump/cache_bank{cache_type}").resolve()
+                self.filename = Path(f"jr_cache_bank/cache/dump/cache_bank{cache_type}")
 
             if cache_bank is None:
                 self.cache_bank = OrderedDict()
@@ -420,6 +484,7 @@ class CacheBank:
             self._max_func_memory_size = max_func_memory_size
             self.lru = lru
             self.max_file_size = max_file_size
+            self.min_cost_ns = min_cost_ns
             self._mutex= None
             self.cache_type = cache_type
 
@@ -495,6 +560,13 @@ class CacheBank:
         """
         return self._lru
 
+    @property
+    def min_cost_ns(self) -> int:
+        """
+        Returns the minimum run time (nanoseconds) of a wrapped call for its result to be cached.
+        """
+        return self._min_cost_ns
+
     @property
     def filename(self) -> Path:
         """
@@ -509,6 +581,14 @@ class CacheBank:
         """
         return len(self.cache_bank)
 
+    @property
+    def total_memory_bytes(self) -> int:
+        """
+        Returns the tracked memory size of the cache bank, as enforced by `max_total_memory_size`.
+        Read from the per-entry counters, without walking the cached keys and results.
+        """
+        return sys.getsizeof(self._cache_bank) + sum(self._func_mem_size(func) for func in self._cache_bank)
+
     @property
     def cache_type(self) -> CacheType:
         """
@@ -567,6 +647,8 @@ class CacheBank:
                 if not isinstance(val, OrderedDict):
                     raise TypeError("Cache bank values must be OrderedDict.")
             self._cache_bank = value
+            # Entry counters are rebuilt on demand for the new bank
+            self._func_bytes = {}
         except Exception as e:
             LOGGER.error(f"Error '{e.__class__.__name__}' -> setting cache bank: {e}")
             raise CacheBankSetError(f"Error '{e.__class__.__name__}' -> setting cache bank: {e}")
@@ -660,6 +742,21 @@ class CacheBank:
             LOGGER.error(f"Error '{e.__class__.__name__}' -> setting max file size: {e}")
             raise CacheBankSetError(f"Error '{e.__class__.__name__}' -> setting max file size: {e}")
 
+    @min_cost_ns.setter
+    def min_cost_ns(self, value: int) -> None:
+        """
+        Sets the minimum run time (nanoseconds) of a wrapped call for its result to be cached.
+        """
+        try:
+            if not isinstance(value, int) or isinstance(value, bool):
+                raise TypeError("Minimum cost must be an integer.")
+            if value < 0:
+                raise ValueError("Minimum cost must be greater than or equal to 0.")
+            self._min_cost_ns = value
+        except Exception as e:
+            LOGGER.error(f"Error '{e.__class__.__name__}' -> setting min cost: {e}")
+            raise CacheBankSetError(f"Error '{e.__class__.__name__}' -> setting min cost: {e}")
+
     @lru.setter
     def lru(self, value: bool) -> None:
         """
@@ -681,8 +778,8 @@ class CacheBank:
         try:
             if not isinstance(value, (str, Path)):
                 raise TypeError("Filename must be a string or Path object.")
-            self._file_checker(value)
-            self._filename = Path(value).resolve()
+            # The checker already resolved the path
+            self._filename = self._file_checker(value)
         except Exception as e:
             LOGGER.error(f"Error '{e.__class__.__name__}' -> setting filename: {e}")
             raise CacheBankSetError(f"Error '{e.__class__.__name__}' -> setting filename: {e}")
@@ -782,10 +879,12 @@ class CacheBank:
         If the cache bank is full, it removes the least recently used item.
         """
         try:
+            # The counters of a replaced function are rebuilt on demand
+            self._func_bytes.pop(key, None)
             if self.lru:
                 # If the cache bank is full, remove the least recently used item
                 if len(self.cache_bank) >= self.max_bank_size:
-                    self.cache_bank.popitem(last=False)
+                    self._func_bytes.pop(self.cache_bank.popitem(last=False)[0], None)
             
                 # Add the new item to the cache bank
                 self.cache_bank[key] = value
@@ -794,7 +893,7 @@ class CacheBank:
             else:
                 # If the cache bank is full, remove the first item
                 if len(self.cache_bank) >= self.max_bank_size:
-                    self.cache_bank.popitem(last=True)
+                    self._func_bytes.pop(self.cache_bank.popitem(last=True)[0], None)
                 
                 # Add the new item to the cache bank
                 self.cache_bank[key] = value
@@ -811,6 +910,7 @@ class CacheBank:
         try:
             if key in self.cache_bank:
                 del self.cache_bank[key]
+                self._func_bytes.pop(key, None)
             else:
                 raise KeyError(f"Key {key} not found in cache bank.")
         except Exception as e:
@@ -825,6 +925,8 @@ class CacheBank:
         func: Callable | partial, 
         args: Optional[Union[Tuple[Any, ...], List[Any]]] = None,
         kwargs: Optional[Dict[str, Any]] = None,
+        *,
+        func_name: Optional[str] = None,
     ) -> Any:
         """
         get
@@ -839,33 +941,37 @@ class CacheBank:
                 The arguments to the function.
             kwargs (Dict[str, Any]) :
                 The keyword arguments to the function.
+            func_name (str) :
+                The name of the function, when already known, instead of reading it from `func`.
         """
         try:
             # Make the function hashable
-            key: Tuple[Any, ...] = self.make_hashable(func, args, kwargs)
+            key: Tuple[Any, ...] = self.make_hashable(func, args, kwargs, func_name=func_name)
 
             # get func name
-            func_name: str = key[0]
+            func_name = key[0]
 
-            if func_name not in self.cache_bank:
-                LOGGER.debug(f"Function {func_name} not found in cache bank.")
-                return None
-            
-            if key in self.cache_bank[func_name]:
-                with self.mutex:
+            with self.mutex:
+                # Single lookup of the function store, None results are never cached
+                func_cache: Optional[OrderedDict[Tuple, Any]] = self._cache_bank.get(func_name)
+                if func_cache is None:
+                    LOGGER.debug(f"Function {func_name} not found in cache bank.")
+                    return None
+
+                result: Any = func_cache.get(key)
+                if result is not None:
                     # Move the item to the end of the OrderedDict to mark it as recently used
-                    self.cache_bank.move_to_end(func_name)
+                    self._cache_bank.move_to_end(func_name)
                     # Move result to the end of the OrderedDict to mark it as recently used
-                    self.cache_bank[func_name].move_to_end(key)
+                    func_cache.move_to_end(key)
                     # Increment the hit count
                     self._cache_reporter.set_hit(func_name)
-                    # Return result
-                    return self._cache_bank[func_name][key]
-            else:
-                LOGGER.debug(f"Key {key} not found in cache bank.")
-                # Increment the miss count
-                self._cache_reporter.set_miss(func_name)
-                return None
+                    return result
+
+            LOGGER.debug(f"Key {key} not found in cache bank.")
+            # Increment the miss count
+            self._cache_reporter.set_miss(func_name)
+            return None
 
         except Exception as e:
             LOGGER.error(f"Error '{e.__class__.__name__}' -> getting item from cache bank: {e}")
@@ -876,7 +982,9 @@ class CacheBank:
         func: Callable | partial, 
         args: Optional[Union[Tuple[Any, ...], List[Any]]] = None,
         kwargs: Optional[Dict[str, Any]] = None,
-        result: Optional[Any] = None
+        result: Optional[Any] = None,
+        *,
+        func_name: Optional[str] = None,
     ) -> None:
         """
         set
@@ -893,6 +1001,8 @@ class CacheBank:
                 The keyword arguments to the function.
             result (Any) :
                 The result of the function.
+            func_name (str) :
+                The name of the function, when already known, instead of reading it from `func`.
         """
         try:
             # Return if void
@@ -900,10 +1010,10 @@ class CacheBank:
                 return
             
             # Make the function hashable
-            tuple_func: Tuple[Any, ...] = self.make_hashable(func, args, kwargs)
+            tuple_func: Tuple[Any, ...] = self.make_hashable(func, args, kwargs, func_name=func_name)
 
             # get func name
-            func_name: str = tuple_func[0]
+            func_name = tuple_func[0]
 
             with self.mutex:
 
@@ -923,10 +1033,11 @@ class CacheBank:
                     # Check specific func size
                     self._func_specific_mem_checker(func_name)
                 else:
-                    # Check default func size
-                    self._func_memory_checker()
+                    # Check default func size, only the function being set can have grown
+                    self._func_memory_checker(func_name)
 
                 # Update the result in the cache
+                self._track_entry(func_name, tuple_func, result)
                 self.cache_bank[func_name][tuple_func] = result
                 # Move result to recently used
                 self.cache_bank[func_name].move_to_end(tuple_func)
@@ -936,7 +1047,233 @@ class CacheBank:
         except Exception as e:
             LOGGER.error(f"Error '{e.__class__.__name__}' -> setting item in cache bank: {e}")
             raise CacheBankSetError(f"Error '{e.__class__.__name__}' -> setting item in cache bank: {e}")
-    
+
+    def get_many(
+        self,
+        func: Callable | partial,
+        args_iter: Iterable[Any],
+        kwargs: Optional[Dict[str, Any]] = None,
+        default: Any = None,
+    ) -> List[Any]:
+        """
+        get_many
+        ======
+        Returns the values associated with several calls of the same function.
+        Missing keys return `default`, in the same position as their arguments.
+
+        Note:
+        -------
+            - The lock is taken once for the whole batch instead of once per key.
+            - Each item of `args_iter` is the arguments of one call; items that are not
+              a tuple or a list are taken as a single positional argument.
+
+        Arguments:
+            func (Callable | partial) :
+                The function to get the values for.
+            args_iter (Iterable[Any]) :
+                The arguments of each call.
+            kwargs (Dict[str, Any]) :
+                The keyword arguments shared by every call.
+            default (Any) :
+                The value returned for missing keys.
+
+        Returns:
+            out (List[Any]) :
+                The cached values, in the order of `args_iter`.
+        """
+        try:
+            keys: List[Tuple[Any, ...]] = [
+                self.make_hashable(func, self._as_args(args), kwargs) for args in args_iter
+            ]
+
+            if not keys:
+                return []
+
+            # get func name
+            func_name: str = keys[0][0]
+
+            if func_name not in self.cache_bank:
+                LOGGER.debug(f"Function {func_name} not found in cache bank.")
+                return [default] * len(keys)
+
+            results: List[Any] = []
+
+            with self.mutex:
+                func_cache: OrderedDict[Tuple[Any, ...], Any] = self.cache_bank[func_name]
+                hits: int = 0
+
+                for key in keys:
+                    if key in func_cache:
+                        # Move result to the end of the OrderedDict to mark it as recently used
+                        func_cache.move_to_end(key)
+                        results.append(func_cache[key])
+                        hits += 1
+                    else:
+                        results.append(default)
+
+                if hits:
+                    # Move the item to the end of the OrderedDict to mark it as recently used
+                    self.cache_bank.move_to_end(func_name)
+
+                for _ in range(hits):
+                    self._cache_reporter.set_hit(func_name)
+                for _ in range(len(keys) - hits):
+                    self._cache_reporter.set_miss(func_name)
+
+            return results
+
+        except Exception as e:
+            LOGGER.error(f"Error '{e.__class__.__name__}' -> getting items from cache bank: {e}")
+            raise CacheBankGetError(f"Error '{e.__class__.__name__}' -> getting items from cache bank: {e}")
+
+    def set_many(
+        self,
+        func: Callable | partial,
+        args_iter: Iterable[Any],
+        results: Iterable[Any],
+        kwargs: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        set_many
+        ======
+        Sets the values of several calls of the same function.
+        If the cache bank is full, it removes the least recently used items.
+
+        Note:
+        -------
+            - The lock is taken and the memory limits are checked once for the whole batch
+              instead of once per key.
+            - Each item of `args_iter` is the arguments of one call; items that are not
+              a tuple or a list are taken as a single positional argument.
+            - None results are skipped, as in `set`.
+
+        Arguments:
+            func (Callable | partial) :
+                The function to set the values for.
+            args_iter (Iterable[Any]) :
+                The arguments of each call.
+            results (Iterable[Any]) :
+                The result of each call, in the order of `args_iter`.
+            kwargs (Dict[str, Any]) :
+                The keyword arguments shared by every call.
+        """
+        try:
+            entries: List[Tuple[Tuple[Any, ...], Any]] = [
+                (self.make_hashable(func, self._as_args(args), kwargs), result)
+                for args, result in zip(args_iter, results)
+                if result is not None
+            ]
+
+            if not entries:
+                return
+
+            # get func name
+            func_name: str = entries[0][0][0]
+
+            with self.mutex:
+
+                # Add the function entry
+                if func_name not in self.cache_bank:
+                    # Check LRU
+                    self._lru_checker()
+                    # Check and memory total LRU eviction
+                    self._total_memory_checker()
+
+                    self.cache_bank[func_name] = OrderedDict()
+                    self._cache_reporter.add_func(func)
+                    LOGGER.debug(f"Added {func_name} to cache bank.")
+
+                func_cache: OrderedDict[Tuple[Any, ...], Any] = self.cache_bank[func_name]
+
+                # Update the results, moving existing keys to recently used
+                for key, result in entries:
+                    self._track_entry(func_name, key, result)
+                    func_cache[key] = result
+                    func_cache.move_to_end(key)
+                # Move func to recently used
+                self.cache_bank.move_to_end(func_name)
+
+                # Trim once for the whole batch
+                if self.func_size_dict.get(func_name, None) is not None:
+                    self._func_specific_mem_checker(func_name)
+                else:
+                    self._func_memory_checker(func_name)
+
+        except Exception as e:
+            LOGGER.error(f"Error '{e.__class__.__name__}' -> setting items in cache bank: {e}")
+            raise CacheBankSetError(f"Error '{e.__class__.__name__}' -> setting items in cache bank: {e}")
+
+    def bulk_call(
+        self,
+        func: Callable | partial,
+        args_iter: Iterable[Any],
+        kwargs: Optional[Dict[str, Any]] = None,
+    ) -> List[Any]:
+        """
+        bulk_call
+        ======
+        Calls the function for each item of `args_iter` through the cache bank.
+        Cached results are returned from the cache bank, the missing ones are computed and cached.
+
+        Note:
+        -------
+            - The lookups and the stores are batched with `get_many` and `set_many`,
+              so the lock and the memory limits are taken once per batch instead of once per call.
+            - A wrapped function is unwrapped first, so misses call the original function once.
+            - Misses repeated in `args_iter` are computed once.
+            - As in the wrappers, None results and calls cheaper than `min_cost_ns` are not cached.
+            - Each item of `args_iter` is the arguments of one call; items that are not
+              a tuple or a list are taken as a single positional argument.
+
+        Arguments:
+            func (Callable | partial) :
+                The function to call, wrapped or not.
+            args_iter (Iterable[Any]) :
+                The arguments of each call.
+            kwargs (Dict[str, Any]) :
+                The keyword arguments shared by every call.
+
+        Returns:
+            out (List[Any]) :
+                The results, in the order of `args_iter`.
+        """
+        try:
+            func = getattr(func, "__wrapped__", func)
+            if not callable(func):
+                raise TypeError("Function must be callable or partial.")
+
+            calls: List[Tuple[Any, ...] | List[Any]] = [self._as_args(args) for args in args_iter]
+            call_kwargs: Dict[str, Any] = kwargs or {}
+
+            results: List[Any] = self.get_many(func, calls, kwargs, default=_MISSING)
+
+            # Group the misses by key, so repeated arguments are computed once
+            misses: Dict[Tuple[Any, ...], List[int]] = {}
+            for index, result in enumerate(results):
+                if result is _MISSING:
+                    misses.setdefault(self.make_hashable(func, calls[index], kwargs), []).append(index)
+
+            set_calls: List[Tuple[Any, ...] | List[Any]] = []
+            set_results: List[Any] = []
+            for indexes in misses.values():
+                args: Tuple[Any, ...] | List[Any] = calls[indexes[0]]
+                start: int = time.perf_counter_ns()
+                result: Any = func(*args, **call_kwargs)
+                if time.perf_counter_ns() - start >= self._min_cost_ns:
+                    set_calls.append(args)
+                    set_results.append(result)
+                for index in indexes:
+                    results[index] = result
+
+            if set_calls:
+                self.set_many(func, set_calls, set_results, kwargs)
+
+            return results
+
+        except Exception as e:
+            LOGGER.error(f"Error '{e.__class__.__name__}' -> calling function through cache bank: {e}")
+            raise CacheBankUtilsError(f"Error '{e.__class__.__name__}' -> calling function through cache bank: {e}")
+
     def clear(self) -> None:
         """
         clear
@@ -949,6 +1286,7 @@ class CacheBank:
                 self.cache_bank = OrderedDict()
                 self._cache_reporter.clear()
                 self._cache_reporter = CacheReporter()
+                self._wrappers = WeakKeyDictionary()
         except Exception as e:
             LOGGER.error(f"Error '{e.__class__.__name__}' -> clearing cache bank: {e}")
             raise CacheBankUtilsError(f"Error '{e.__class__.__name__}' -> clearing cache bank: {e}")
@@ -1062,9 +1400,11 @@ class CacheBank:
                 self.max_bank_size = 100
                 self.max_file_size = 100000
                 self.lru = True
+                self.min_cost_ns = 0
 
                 self.cache_bank = OrderedDict()
                 self._cache_reporter = CacheReporter()
+                self._wrappers = WeakKeyDictionary()
                 self._cache_type = CacheType.PICKLE
                 self.filename = Path(__file__).parent.parent.parent.resolve().stem + ".pkl"
                 self._mutex = None
@@ -1077,17 +1417,17 @@ class CacheBank:
 
     def get_cache_object_mem_size(self) -> int:
         """
-        Returns the memory size of the cache object.
+        Returns the memory size of the cache object, including every cached key and result.
         """
         try:
-            return sys.getsizeof(self.cache_bank)
+            return self._memory_size_checker(self.cache_bank)
         except Exception as e:
             LOGGER.error(f"Error '{e.__class__.__name__}' -> getting cache object memory size: {e}")
             raise CacheBankUtilsError(f"Error '{e.__class__.__name__}' -> getting cache object memory size: {e}")
 
     def get_func_object_mem_size(self, func:str) -> int:
         """
-        Returns the memory size of the function object.
+        Returns the memory size of the function object, including its cached keys and results.
         """
         try:
             if not func:
@@ -1098,11 +1438,47 @@ class CacheBank:
 
             if func not in self.cache_bank:
                 raise KeyError(f"Function {func} not found in cache bank.")
-            return sys.getsizeof(self.cache_bank[func])
+            return self._memory_size_checker(self.cache_bank[func])
         except Exception as e:
             LOGGER.error(f"Error '{e.__class__.__name__}' -> getting function object memory size: {e}")
             raise CacheBankUtilsError(f"Error '{e.__class__.__name__}' -> getting function object memory size: {e}")
 
+    def entry_stats(self, func: str) -> Dict[str, int]:
+        """
+        entry_stats
+        ===========
+        Returns the number of cached entries of a function and the bytes they hold.
+
+        Note:
+        -------
+            - Byte counts are tracked as entries are set and evicted, so this does not walk the cache.
+            - Counts are rebuilt once if the function's cache was changed outside the bank's methods.
+
+        Arguments:
+            func (str) :
+                The name of the function.
+
+        Returns:
+            Dict[str, int] :
+                `{"entries": ..., "bytes": ...}`
+        """
+        try:
+            if not func:
+                raise ValueError("Function name cannot be None or empty.")
+
+            if not isinstance(func, str):
+                raise TypeError("Function name must be a string.")
+
+            if func not in self.cache_bank:
+                raise KeyError(f"Function {func} not found in cache bank.")
+
+            counters: List[int] = self._func_counters(func)
+
+            return {"entries": counters[0], "bytes": counters[1]}
+        except Exception as e:
+            LOGGER.error(f"Error '{e.__class__.__name__}' -> getting entry stats: {e}")
+            raise CacheBankUtilsError(f"Error '{e.__class__.__name__}' -> getting entry stats: {e}")
+
     def get_total_cache_size(self) -> int:
         """
         Returns the total size of the cache bank.
@@ -1208,6 +1584,8 @@ class CacheBank:
         func: Callable | partial,
         args: Optional[Union[Tuple[Any, ...], List[Any]]] = None,
         kwargs: Optional[Dict[str, Any]] = None,
+        *,
+        func_name: Optional[str] = None,
     ) -> Tuple[Any,...]:
         """
         make_hashable
@@ -1221,33 +1599,31 @@ class CacheBank:
                 The arguments to the function.
             kwargs (Dict[str, Any]) :
                 The keyword arguments to the function.
+            func_name (str) :
+                The name of the function, when already known, instead of reading it from `func`.
         
         Returns:
             out (Tuple[Any, ...]) :
                 A hashable tuple containing the function and its arguments.
         """
         try:
-            if isinstance(func, partial):
-                func_name: str = func.func.__name__
+            if func_name is not None:
+                pass
+            elif isinstance(func, partial):
+                func_name = func.func.__name__
             elif callable(func):
-                func_name: str = func.__name__
+                func_name = func.__name__
             else:
                 raise TypeError("Function must be callable or partial.")
             
-            args_list = []
-
-            if args is not None:
-                for arg in args:
-                    if isinstance(arg, dict):
-                        t_arg = tuple(sorted(arg.items()))
-                        args_list.append(t_arg)
-                    elif isinstance(arg, (list, tuple)):
-                        args_list.append(tuple(arg))
-                    else:
-                        args_list.append(arg)
-
-            # Convert args to a hashable tuple
-            hash_args = tuple(args_list) if args_list else ()        
+            # Convert args to a hashable tuple, scalars are kept without the conversion
+            hash_args: Tuple[Any, ...] = ()
+            if args:
+                hash_args = tuple(args)
+                for arg in hash_args:
+                    if type(arg) not in SCALAR_ARG_TYPES:
+                        hash_args = tuple(map(_hashable_arg, hash_args))
+                        break
         
             if kwargs is not None and not isinstance(kwargs, dict):
                 raise TypeError("Keyword arguments must be a dictionary.")
@@ -1289,8 +1665,6 @@ class CacheBank:
         -------
         - If the file already exists, it will be overwritten.
         """
-        # Make object from self
-        io_buffer = io.BytesIO()
         try:
             if not isinstance(filename, (str, Path, type(None))):
                 raise TypeError("Filename must be a string or Path object.")
@@ -1318,41 +1692,30 @@ class CacheBank:
                     LOGGER.warning(f"File {clean_filename} already exists. Overwriting it.")
             else:
                 LOGGER.info(f"File {clean_filename} does not exist. Creating it.")
-                # Create the file
-                clean_filename.parent.mkdir(parents=True, exist_ok=True)
-                clean_filename.touch()
 
             # Save Handler
             save_func: Callable | None = self.converter_container[self.cache_type]
             if save_func is None:
                 raise TypeError(f"Save function for cache type {self.cache_type} not found.")
             
-            # Convert the cache bank to bytes
-            if self.cache_type in [CacheType.ZLIB, CacheType.GZIP]:
-                io_buffer.write(save_func(self.cache_bank, level_compression))
+            # Convert the cache bank to bytes, written as returned without an intermediate copy
+            if self.cache_type in COMPRESSED_CACHE_TYPES:
+                data: BytesLike = save_func(self.cache_bank, level_compression)
             else:
-                io_buffer.write(save_func(self.cache_bank))
+                data: BytesLike = save_func(self.cache_bank)
 
             # Check file size
-            if len(io_buffer.getvalue()) > self.max_file_size:
-                raise CacheBankSaveError(f"Serialized data size {len(io_buffer.getvalue())} exceeds max_file_size {self.max_file_size}")
+            if len(data) > self.max_file_size:
+                raise CacheBankSaveError(f"Serialized data size {len(data)} exceeds max_file_size {self.max_file_size}")
             
-            # Open the file in write mode
-            with open(clean_filename, "wb") as f:
-                # Check if file is writable
-                if not f.writable():
-                    raise IOError(f"File {clean_filename} is not writable.")
-                
-                with self.mutex:
-                    # Save the cache bank to the file
-                    f.write(io_buffer.getvalue())
-                    LOGGER.info(f"Cache bank saved to {clean_filename}.")
+            with self.mutex:
+                # Save the cache bank to the file, created by the write if missing
+                clean_filename.write_bytes(data)
+                LOGGER.info(f"Cache bank saved to {clean_filename}.")
 
         except Exception as e:
             LOGGER.error(f"Error '{e.__class__.__name__}' -> saving cache bank: {e}")
             raise CacheBankSaveError(f"Error '{e.__class__.__name__}' -> saving cache bank: {e}")
-        finally:
-            io_buffer.close()
 
     def load(self, filename: str | Path | None = None) -> None:
         """
@@ -1433,20 +1796,24 @@ class CacheBank:
             - ../cache/dump/cache_bank.gz
             - ../cache/dump/cache_bank.json
             - ../cache/dump/cache_bank.yaml
+            - ../cache/dump/cache_bank.lz4
+            - ../cache/dump/cache_bank.zst
+            - ../cache/dump/cache_bank.mpk
         """
         try:
             path_list: List[Path] = []
 
             for key in self.converter_container.get_keys():
-                if key in [CacheType.PICKLE, CacheType.JSON, CacheType.YAML, CacheType.ZLIB, CacheType.GZIP]:
+                if key in CacheType:
                     string: str = f"jr_cache_bank/cache/dump/cache_bank{key}"
                     path_list.append(Path(string))
 
             for path in path_list:
-                if path.exists():
-                    os.remove(path)
+                # One unlink per path, no separate existence check
+                try:
+                    path.unlink()
                     LOGGER.debug(f"Cache bank file {path} removed.")
-                else:
+                except FileNotFoundError:
                     LOGGER.debug(f"Cache bank file {path} does not exist, continuing ...")
 
         except Exception as e:
@@ -1502,14 +1869,14 @@ class CacheBank:
     # -------------
     # Helpers
 
-    def _converter_handler(self, level_compression: int) -> bytes:
+    def _converter_handler(self, level_compression: int) -> BytesLike:
         """
         _converter_handler
         ==================
         Handles the conversion of the cache bank to bytes.
         
         Returns:
-            bytes :
+            BytesLike :
                 The converted cache bank.
         """
         try:
@@ -1517,7 +1884,7 @@ class CacheBank:
             if converter_func is None:
                 raise ValueError(f"Converter function for cache type {self.cache_type} not found.")
             # Convert the cache bank to bytes
-            if self.cache_type in [CacheType.ZLIB, CacheType.GZIP]:
+            if self.cache_type in COMPRESSED_CACHE_TYPES:
                 return converter_func(self.cache_bank, level_compression)
             else:
                 return converter_func(self.cache_bank)
@@ -1552,6 +1919,12 @@ class CacheBank:
                 return CacheType.JSON
             elif filename.endswith(".yaml"):
                 return CacheType.YAML
+            elif filename.endswith(".lz4"):
+                return CacheType.LZ4
+            elif filename.endswith(".zst"):
+                return CacheType.ZSTD
+            elif filename.endswith(".mpk"):
+                return CacheType.MSGPACK
             else:
                 return None
             
@@ -1574,11 +1947,8 @@ class CacheBank:
                 The loaded cache bank.
         """
         try:
-            loader_func: Callable | None = self.loaders_container[cache_type]
-            if loader_func is None:
-                raise ValueError(f"Loader function for cache type {cache_type} not found.")
             # Load the cache bank from the file
-            bank: OrderedDict = loader_func(data)
+            bank: OrderedDict = self.loaders_container.dispatch(cache_type, data)
             if not isinstance(bank, OrderedDict):
                 raise TypeError(f"Cache bank must be an OrderedDict, got {type(bank)}.")
             return bank
@@ -1586,11 +1956,15 @@ class CacheBank:
             LOGGER.error(f"Error checking loader handler: {e}")
             raise e
 
-    def _file_checker(self, filename: str | Path) -> None:
+    def _file_checker(self, filename: str | Path) -> Path:
         """
         file_checker
         ============
         Checks if the file follows the security rules.
+
+        Returns:
+            Path :
+                The resolved path of the file.
         """
         try:
             if not isinstance(filename, (str, Path)):
@@ -1611,6 +1985,7 @@ class CacheBank:
             if not filename_path.parent.is_dir():
                 raise NotADirectoryError(f"Parent directory {filename_path.parent} is not a directory.")
 
+            return filename_path
         except Exception as e:
             LOGGER.error(f"Error checking cache bank file: {e}")
             raise e
@@ -1628,9 +2003,9 @@ class CacheBank:
             while len(self.cache_bank) >= self.max_bank_size:
             # If the cache bank is full, remove the least recently used item
                 if self.lru:
-                    self.cache_bank.popitem(last=False)
+                    self._func_bytes.pop(self.cache_bank.popitem(last=False)[0], None)
                 else:
-                    self.cache_bank.popitem(last=True)
+                    self._func_bytes.pop(self.cache_bank.popitem(last=True)[0], None)
 
         except Exception as e:
             LOGGER.error(f"Error checking LRU: {e}")
@@ -1662,25 +2037,13 @@ class CacheBank:
                 return None
              
             func_size: int = self.func_size_dict[key]
-            func_cached: int = self._memory_size_checker(self.cache_bank[key])
+            func_cached: int = self._func_mem_size(key)
             
             if func_cached >= func_size:
                 LOGGER.debug(
                     f"_func_specific_mem_checker - Function {key} size {func_cached} exceeds maximum size {func_size}. Trimming it."
                 )
-
-                while func_cached > func_size:
-                    # If the cache bank is full, remove the least recently used item
-                    if self.lru:
-                        self.cache_bank[key].popitem(last=False)
-                    else:
-                        self.cache_bank[key].popitem(last=True)
-                        
-                    # Recalculate the size of the function for next iteration
-                    func_cached: int = self._memory_size_checker(self.cache_bank[key])
-                    LOGGER.debug(
-                        f"Function {key} size after trimming: {func_cached}"
-                    )
+                self._trim_func(key, func_size)
 
             return None
 
@@ -1688,6 +2051,31 @@ class CacheBank:
             LOGGER.error(f"Error checking function specific memory: {e}")
             raise e
 
+    def _trim_func(self, func_name: str, max_size: int) -> None:
+        """
+        _trim_func
+        ==========
+        Evicts entries of a function until it fits in `EVICTION_LOW_WATER` of its maximum size.
+        Trimming below the limit leaves room for the next inserts, so evictions run in batches
+        instead of on every insert once the function is full.
+
+        Arguments:
+            func_name (str) :
+                The name of the function.
+            max_size (int) :
+                The maximum size of the function.
+        """
+        func_cache: OrderedDict[Tuple[Any, ...], Any] = self.cache_bank[func_name]
+        target: int = int(max_size * EVICTION_LOW_WATER)
+        func_cached: int = self._func_mem_size(func_name)
+
+        while func_cached > target and func_cache:
+            # Remove the least recently used item, or the most recent one without LRU
+            self._untrack_entry(func_name, *func_cache.popitem(last=not self.lru))
+            func_cached = self._func_mem_size(func_name)
+
+        LOGGER.debug(f"Function {func_name} size after trimming: {func_cached}")
+
     def _total_memory_checker(self) ->None:
         """
         _total_memory_checker
@@ -1697,45 +2085,43 @@ class CacheBank:
         If it is, it removes the least recently used item.
         """
         try:
-            total_cache_size: int = self._memory_size_checker(self.cache_bank)
+            total_cache_size: int = self.total_memory_bytes
 
             while total_cache_size >= self.max_total_memory_size:
                 LOGGER.debug(f"_total_memory_checker - Total cache size: {total_cache_size}, Max total memory size: {self.max_total_memory_size}, removing least recently used item.")
 
                 # If the cache bank is full, remove the least recently used item
                 if self.lru:
-                    self.cache_bank.popitem(last=False)
+                    self._func_bytes.pop(self.cache_bank.popitem(last=False)[0], None)
                 else:
-                    self.cache_bank.popitem(last=True)
-                total_cache_size = self._memory_size_checker(self.cache_bank)
+                    self._func_bytes.pop(self.cache_bank.popitem(last=True)[0], None)
+                total_cache_size = self.total_memory_bytes
 
         except Exception as e:
             LOGGER.error(f"Error checking total memory size: {e}")
             raise e
 
-    def _func_memory_checker(self) -> None:
+    def _func_memory_checker(self, func_name: Optional[str] = None) -> None:
         """
         _func_memory_checker
         ====================
         Checks if the memory size of the function is greater than the default maximum size.
         
         If it is, it removes the least recently used item.
+
+        Arguments:
+            func_name (str) :
+                The function to check, the one being set. If None, every function is checked.
         """
         try:
-            for func in self.cache_bank:
-                func_size: int = self._memory_size_checker(self.cache_bank[func])
+            for func in (self.cache_bank if func_name is None else (func_name,)):
+                func_size: int = self._func_mem_size(func)
 
                 if func_size >= self.max_func_memory_size:
                     LOGGER.debug(
                         f"_func_memory_checker - Function {func} size {func_size} exceeds maximum size {self.max_func_memory_size}. Trimming it."
                     )
-                    while func_size > self.max_func_memory_size:
-                        # If the cache bank is full, remove the least recently used item
-                        if self.lru:
-                            self.cache_bank[func].popitem(last=False)
-                        else:
-                            self.cache_bank[func].popitem(last=True)
-                        func_size = self._memory_size_checker(self.cache_bank[func])
+                    self._trim_func(func, self.max_func_memory_size)
                         
         except Exception as e:
             LOGGER.error(f"Error checking function memory size: {e}")
@@ -1783,29 +2169,132 @@ class CacheBank:
         return path
 
     def _memory_size_checker(self, obj, seen=None) -> int:
+        """
+        _memory_size_checker
+        ====================
+        Returns the deep size of an object, following dictionaries, lists, tuples and sets.
+
+        Note:
+        -------
+            - Walks an explicit stack instead of recursing, so there is no Python frame per object
+              and no recursion limit on deep nesting.
+            - Objects are counted once, by id, even when reachable from several places.
+
+        Arguments:
+            obj (Any) :
+                The object to measure.
+            seen (Set[int]) :
+                Ids of the objects already counted, or to leave out.
+
+        Returns:
+            int :
+                The size in bytes.
+        """
         if seen is None:
             seen = set()
-        obj_id = id(obj)
-        # Check if the object has already been seen to avoid infinite recursion
-        if obj_id in seen:
-            return 0
-        # If not add obj to set
-        seen.add(obj_id)
-        # Get the size of the object
-        size = sys.getsizeof(obj)
-        # For nested data
-        if isinstance(obj, dict):
-            # Get values size
-            size += sum(self._memory_size_checker(v, seen) for v in obj.values())
-            # Get keys size
-            size += sum(self._memory_size_checker(k, seen) for k in obj.keys())
-        
-        # If the object is a list, tuple, or set
-        elif isinstance(obj, (list, tuple, set)):
-            # Sum every element
-            size += sum(self._memory_size_checker(i, seen) for i in obj)
+        getsizeof: Callable[[Any], int] = sys.getsizeof
+        mark_seen: Callable[[int], None] = seen.add
+        stack: List[Any] = [obj]
+        size: int = 0
+
+        while stack:
+            obj = stack.pop()
+            obj_id: int = id(obj)
+            # Skip objects already counted, it also avoids infinite loops
+            if obj_id in seen:
+                continue
+            mark_seen(obj_id)
+            size += getsizeof(obj)
+            # For nested data
+            if isinstance(obj, dict):
+                stack.extend(obj.values())
+                stack.extend(obj.keys())
+            elif isinstance(obj, (list, tuple, set)):
+                stack.extend(obj)
         return size
 
+    def _entry_size(self, key: Tuple[Any, ...], value: Any) -> int:
+        """
+        _entry_size
+        ===========
+        Returns the deep size of one cached entry, its key plus its result.
+        The function name shared by every key is left out, `_func_mem_size` counts it once.
+        """
+        return self._memory_size_checker(key, {id(key[0])}) + self._memory_size_checker(value)
+
+    def _func_counters(self, func_name: str) -> List[int]:
+        """
+        _func_counters
+        ==============
+        Returns the `[entries, bytes]` counters of a function,
+        rebuilding them if its cache was changed outside the bank's methods.
+        """
+        func_cache: OrderedDict[Tuple[Any, ...], Any] = self.cache_bank[func_name]
+        counters: List[int] | None = self._func_bytes.get(func_name)
+
+        if counters is None or counters[0] != len(func_cache):
+            counters = [
+                len(func_cache),
+                sum(self._entry_size(key, value) for key, value in func_cache.items())
+            ]
+            self._func_bytes[func_name] = counters
+        return counters
+
+    def _func_mem_size(self, func_name: str) -> int:
+        """
+        _func_mem_size
+        ==============
+        Returns the tracked memory size of a function: its store, its name and its entries.
+        Used by the memory checkers instead of a deep walk of the function's cache.
+        """
+        return (
+            sys.getsizeof(self.cache_bank[func_name])
+            + sys.getsizeof(func_name)
+            + self._func_counters(func_name)[1]
+        )
+
+    def _track_entry(self, func_name: str, key: Tuple[Any, ...], value: Any) -> None:
+        """
+        _track_entry
+        ============
+        Adds an entry about to be stored to the function's counters, replacing the entry it overwrites.
+        """
+        counters: List[int] = self._func_bytes.setdefault(func_name, [0, 0])
+        func_cache: OrderedDict[Tuple[Any, ...], Any] | None = self.cache_bank.get(func_name)
+
+        if func_cache is not None and key in func_cache:
+            counters[1] -= self._entry_size(key, func_cache[key])
+        else:
+            counters[0] += 1
+        counters[1] += self._entry_size(key, value)
+
+    def _untrack_entry(self, func_name: str, key: Tuple[Any, ...], value: Any) -> None:
+        """
+        _untrack_entry
+        ==============
+        Removes an evicted entry from the function's counters.
+        """
+        counters: List[int] | None = self._func_bytes.get(func_name)
+        if counters is not None:
+            counters[0] -= 1
+            counters[1] -= self._entry_size(key, value)
+
+    @staticmethod
+    def _as_args(args: Any) -> Tuple[Any, ...] | List[Any]:
+        """
+        _as_args
+        ========
+        Wraps a single positional argument in a tuple, leaving tuples and lists as they are.
+
+        Arguments:
+            args (Any) :
+                The arguments of one call.
+
+        Returns:
+            Tuple[Any, ...] | List[Any] :
+                The arguments as a sequence.
+        """
+        return args if isinstance(args, (tuple, list)) else (args,)
 
     @staticmethod
     def _dict_sanitizer(data: Dict[str, Any]) -> Dict[str, Any]:
@@ -1843,18 +2332,148 @@ class CacheBank:
     # -------------
     # wrappers
 
-    def wrapper(self, max_size: Optional[CacheSize] = None) -> Callable:
+    def _call_and_set(
+        self,
+        func: Callable | partial,
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+        func_name: Optional[str] = None,
+    ) -> Any:
+        """
+        _call_and_set
+        =============
+        Calls the function on a cache miss and sets the result in the cache bank,
+        unless the call ran for less than `min_cost_ns`.
+
+        Arguments:
+            func (Callable | partial) :
+                The function to call.
+            args (Tuple[Any, ...]) :
+                The arguments to the function.
+            kwargs (Dict[str, Any]) :
+                The keyword arguments to the function.
+            func_name (str) :
+                The name of the function, when already known, instead of reading it from `func`.
+
+        Returns:
+            Any :
+                The result of the function.
+        """
+        if not self._min_cost_ns:
+            result = func(*args, **kwargs)
+            self.set(func, args, kwargs, result, func_name=func_name)
+            return result
+
+        start: int = time.perf_counter_ns()
+        result = func(*args, **kwargs)
+        if time.perf_counter_ns() - start >= self._min_cost_ns:
+            self.set(func, args, kwargs, result, func_name=func_name)
+        return result
+
+    def _register_func(self, func: Callable | partial, max_size: Optional[CacheSize] = None) -> str:
+        """
+        _register_func
+        ==============
+        Validates a function being wrapped and registers its maximum size, once per wrap instead of once per call.
+
+        Arguments:
+            func (Callable | partial) :
+                The function being wrapped.
+            max_size (CacheSize) :
+                The maximum size of the function in the cache bank.
+                If None, the function keeps its current size, or the default one.
+
+        Returns:
+            str :
+                The interned name of the function.
+        """
+        if not callable(func) and not isinstance(func, partial):
+            raise TypeError("Function must be callable or partial.")
+
+        func_name: str = sys.intern(func.func.__name__ if isinstance(func, partial) else func.__name__)
+
+        if max_size is not None:
+            if not isinstance(max_size, CacheSize):
+                raise TypeError("Max size must be an CacheSize.")
+            self.func_size_dict[func_name] = max_size
+        return func_name
+
+    def _fast_wrapper(self, func: Callable | partial, max_size: Optional[CacheSize] = None) -> Callable:
+        """
+        _fast_wrapper
+        =============
+        Creates the single-argument fast path wrapper of `wrapper(fast_path=True)`.
+
+        Note:
+        -------
+            - The key is `(func_name, (arg,))`, the one `make_hashable` builds for a single
+              scalar argument, so `get`, `set` and `bulk_call` share the entries.
+            - Dictionary, list and tuple arguments are normalized by `make_hashable`,
+              so they take the generic path.
+
+        Arguments:
+            func (Callable | partial) :
+                The function to wrap.
+            max_size (CacheSize) :
+                The maximum size of the function in the cache bank.
+
+        Returns:
+            Callable :
+                The wrapped function.
+        """
+        func_name: str = self._register_func(func, max_size)
+
+        @wraps(func)
+        def wrapper(arg):
+            if isinstance(arg, (dict, list, tuple)):
+                args: Tuple[Any, ...] = (arg,)
+                result = self.get(func, args, func_name=func_name)
+                if result is None:
+                    result = self._call_and_set(func, args, {}, func_name)
+                return result
+
+            key: Tuple[Any, ...] = (func_name, (arg,))
+
+            with self.mutex:
+                func_cache: Optional[OrderedDict[Tuple, Any]] = self._cache_bank.get(func_name)
+                if func_cache is not None:
+                    result = func_cache.get(key)
+                    if result is not None:
+                        # Mark the function and the result as recently used
+                        self._cache_bank.move_to_end(func_name)
+                        func_cache.move_to_end(key)
+                        self._cache_reporter.set_hit(func_name)
+                        return result
+                    self._cache_reporter.set_miss(func_name)
+
+            return self._call_and_set(func, (arg,), {}, func_name)
+
+        # Batched calls, see `bulk_call`
+        wrapper.bulk_call = partial(self.bulk_call, func)
+        return wrapper
+
+    def wrapper(self, max_size: Optional[CacheSize] = None, fast_path: bool = False) -> Callable:
         """
         wrapper
         ========
         Creates a wrapper for the function.
         - If the function is already in the cache bank, it returns the result from the cache bank.
         - If the function is not in the cache bank, it calls the function and sets the result in the cache bank.
+        - `wrapped.bulk_call(args_iter)` calls the function for several arguments in one batch.
+
+        Note:
+        -------
+            - `fast_path=True` specializes the wrapper for functions of a single positional argument.
+              The key is built directly, without `make_hashable`, and the function name and size
+              are resolved once when wrapping instead of on every call.
+              Entries, stats and limits are the same as with the generic wrapper.
 
         Arguments:
             max_size (CacheSize) :
                 The maximum size of the function in the cache bank.
                 If None, it will use the default size.
+            fast_path (bool) :
+                Whether to use the single-argument fast path.
 
         Example:
         ```python
@@ -1866,45 +2485,42 @@ class CacheBank:
             def some_function(x, y):
                 return x + y
 
+            # Call it for several arguments in one batch
+            results = some_function.bulk_call([(1, 2), (3, 4)])
+
             # Wrap with specific memory restriction
             @cache.wrapper(max_size=CacheSize.E_128KB)
             def some_function(x, y):
                 return x + y
+
+            # Single-argument fast path
+            @cache.wrapper(fast_path=True)
+            def square(x):
+                return x * x
         ```
         """
         try:
             def inner(func: Callable | partial) -> Callable:
-                @wraps(func)
-                def wrapper(*args, **kwargs):
-                    # Check if the function callable or partial
-                    if not callable(func) and not isinstance(func, partial):
-                        raise TypeError("Function must be callable or partial.")
+                if fast_path:
+                    return self._fast_wrapper(func, max_size)
 
-                    # Get name
-                    if isinstance(func, partial):
-                        func_name: str = func.func.__name__
-                    else:
-                        func_name: str = func.__name__
-
-                    # Set settings func max size
-                    if max_size is not None:
-                        if not isinstance(max_size, CacheSize):
-                            raise TypeError("Max size must be an CacheSize.")
-                        self.func_size_dict[func_name] = max_size
+                func_name: str = self._register_func(func, max_size)
 
+                @wraps(func)
+                def wrapper(*args, **kwargs):
                     # Check if the function is already in the cache bank
                     if func_name in self.cache_bank:
                         # If it is, get the result from the cache bank
-                        result = self.get(func, args, kwargs)
+                        result = self.get(func, args, kwargs, func_name=func_name)
                         # Will return None if no result is found
                         if result is not None:
                             return result
                         
                     # If it is not, call the function and set the result in the cache bank
-                    result = func(*args, **kwargs)
-                    self.set(func, args, kwargs, result)
+                    return self._call_and_set(func, args, kwargs, func_name)
 
-                    return result
+                # Batched calls, see `bulk_call`
+                wrapper.bulk_call = partial(self.bulk_call, func)
                 return wrapper
             return inner
         except Exception as e:
@@ -1946,30 +2562,20 @@ class CacheBank:
                 if not asyncio.iscoroutinefunction(func):
                     raise TypeError("Function must be a coroutine function.")
                     
+                func_name: str = self._register_func(func, max_size)
+
                 @wraps(func)
                 async def wrapper(*args, **kwargs):
-                    
-                    # Get name
-                    func_name: str = func.__name__
-                    if isinstance(func, partial):
-                        func_name: str = func.func.__name__
-
-                    # Set settings func max size
-                    if max_size is not None:
-                        if not isinstance(max_size, CacheSize):
-                            raise TypeError("Max size must be an CacheSize.")
-                        self.func_size_dict[func_name] = max_size
-
                     # Check if the function is already in the cache bank
                     if func_name in self.cache_bank:
                         # If it is, get the result from the cache bank
-                        result = self.get(func, args, kwargs)
+                        result = self.get(func, args, kwargs, func_name=func_name)
                         if result is not None:
                             return result
                         
                     # If it is not, call the function and set the result in the cache bank
                     result = await func(*args, **kwargs)
-                    self.set(func, args, kwargs, result)
+                    self.set(func, args, kwargs, result, func_name=func_name)
                     
                     return result
                 return wrapper
@@ -1989,6 +2595,14 @@ class CacheBank:
         ========
         Calls the wrapper function.
         - If the function is already in the cache bank, it returns the result from the cache bank.
+        - Wrapping the same function again returns the same wrapper, updating its maximum size if given.
+
+        Note:
+        -------
+            - Wrappers are remembered weakly, so a wrapper is reused only while the caller keeps it alive.
+              One-shot calls such as `cache_bank(func)(x)` wrap again each time, which is cheap
+              and shares the same cached entries, as they are keyed by the function name.
+            - Holding the wrapper strongly would keep the function alive, the wrapper references it.
 
         Arguments:
             func (Callable | partial) :
@@ -2012,24 +2626,29 @@ class CacheBank:
 
         """
         try:
-            if not callable(func) and not isinstance(func, partial):
-                raise TypeError("Function must be callable or partial.")
-
-            # Get the function name
-            func_name = func.func.__name__ if isinstance(func, partial) else func.__name__
-
-            # Update func_size_dict if max_size is provided
-            if max_size is not None:
-                if not isinstance(max_size, CacheSize):
-                    raise TypeError("Max size must be a CacheSize.")
-                self.func_size_dict[func_name] = max_size
+            # Update func_size_dict if max_size is provided, also for an already wrapped function
+            self._register_func(func, max_size)
+
+            # Wrapping the same function again returns its wrapper, while that wrapper is alive
+            try:
+                wrapper_ref: Optional[weakref.ref] = self._wrappers.get(func)
+            except TypeError:
+                # Unhashable or not weak referenceable callables are not memoized
+                wrapper_ref = None
+            wrapped: Optional[Callable] = wrapper_ref() if wrapper_ref is not None else None
+            if wrapped is not None:
+                return wrapped
 
             if asyncio.iscoroutinefunction(func):
-                return self.async_wrapper(max_size)(func)
+                wrapped = self.async_wrapper()(func)
             else:
-                if not callable(func) and not isinstance(func, partial):
-                    raise TypeError("Function must be callable or partial.")
-                return self.wrapper(max_size)(func)
+                wrapped = self.wrapper()(func)
+            # The wrapper references the function, so it is held weakly too, or the entry never dies
+            try:
+                self._wrappers[func] = weakref.ref(wrapped)
+            except TypeError:
+                pass
+            return wrapped
         except Exception as e:
             LOGGER.error(f"Error calling wrapper: {e}")
             raise e
@@ -2037,19 +2656,19 @@ class CacheBank:
     # -------------
     # Config
 
-    def config_from_dict(self, data: Dict[str, Any]) -> None:
+    def config_from_dict(self, data: Mapping[str, Any]) -> None:
         """
         config_from_dict
         ================
         Configures the cache bank from a dictionary.
 
         Arguments:
-            data (Dict[str, Any]) :
-                The dictionary to configure the cache bank from.
+            data (Mapping[str, Any]) :
+                The dictionary, or any read-only mapping, to configure the cache bank from.
         
         """
         try:
-            if not isinstance(data, dict):
+            if not isinstance(data, Mapping):
                 raise TypeError("Data must be a dictionary.")
             for key, value in data.items():
                 if hasattr(self, key):
@@ -2074,8 +2693,8 @@ class CacheBank:
         try:
             if not isinstance(data, bytes):
                 raise TypeError("Data must be a bytes object.")
-            # Load the JSON file
-            data_dict: Dict[str, Any] = json.loads(data)
+            # Load the JSON file, with orjson when installed
+            data_dict: Dict[str, Any] = _json_loads(data)
             clean_dict: Dict[str, Any] = CacheBank._dict_sanitizer(data_dict)
             
             self.config_from_dict(clean_dict)
@@ -2086,15 +2705,15 @@ class CacheBank:
     # Static
 
     @staticmethod
-    def static_config_from_dict(data: Dict[str, Any]) -> 'CacheBank':
+    def static_config_from_dict(data: Mapping[str, Any]) -> 'CacheBank':
         """
         static_config_from_dict
         ========================
         Configures the cache bank from a dictionary.
 
         Arguments:
-            data (Dict[str, Any]) :
-                The dictionary to configure the cache bank from.
+            data (Mapping[str, Any]) :
+                The dictionary, or any read-only mapping, to configure the cache bank from.
         
         Returns:
             CacheBank :
@@ -2102,7 +2721,7 @@ class CacheBank:
         
         """
         try:
-            if not isinstance(data, dict):
+            if not isinstance(data, Mapping):
                 raise TypeError("Data must be a dictionary.")
             return CacheBank(**data)
         except Exception as e:
@@ -2128,8 +2747,8 @@ class CacheBank:
         try:
             if not isinstance(data, bytes):
                 raise TypeError("Data must be a bytes object.")
-            # Load the JSON file
-            data_dict: Dict[str, Any] = json.loads(data)
+            # Load the JSON file, with orjson when installed
+            data_dict: Dict[str, Any] = _json_loads(data)
             clean_dict: Dict[str, Any] = CacheBank._dict_sanitizer(data_dict)
 
             return CacheBank(**clean_dict)
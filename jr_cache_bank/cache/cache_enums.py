@@ -23,12 +23,23 @@ class CacheType(StrEnum):
             The cache type is gzip.
         JSON (str) :
             The cache type is json.
+        YAML (str) :
+            The cache type is yaml.
+        LZ4 (str) :
+            The cache type is lz4 frame, requires the optional `lz4` package.
+        ZSTD (str) :
+            The cache type is zstandard, requires the optional `zstandard` package.
+        MSGPACK (str) :
+            The cache type is msgpack, requires the optional `msgpack` package.
     """
     PICKLE = ".pkl"
     ZLIB = ".zlib"
     GZIP = ".gz"
     JSON = ".json"
     YAML = ".yaml"
+    LZ4 = ".lz4"
+    ZSTD = ".zst"
+    MSGPACK = ".mpk"
 
 class CacheSize(IntEnum):
     """
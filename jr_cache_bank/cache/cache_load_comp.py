@@ -3,18 +3,51 @@
 # -------------------------------------------------------------------------------------------------
 
 import gzip
+import io
 import json
+import os
 import yaml
 import zlib
 import logging
 import pickle
+import sys
 
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from ast import literal_eval
 from typing import Any, Callable, Dict, Optional, Tuple
 
 from jr_cache_bank.config.setup_logger import setup_logger
 from jr_cache_bank.cache.cache_enums import CacheType
+from jr_cache_bank.cache.cache_save_comp import MSGPACK_BIG_INT_EXT
+
+# Optional
+try:
+    import lz4.frame as lz4_frame
+except ImportError:
+    lz4_frame = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    # Native JSON decoder
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    # libyaml parser, much faster than the pure Python one
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
 
 # -------------------------------------------------------------------------------------------------
 # Logging
@@ -33,6 +66,57 @@ except Exception as e:
     LOGGER.addHandler(handler)
     LOGGER.error(f"Error setting up logger: {e}")
 
+# -------------------------------------------------------------------------------------------------
+# Constants
+# -------------------------------------------------------------------------------------------------
+
+# Minimum number of cached functions before deserialization is spread over a thread pool
+PARALLEL_DESERIALIZATION_THRESHOLD: int = 8
+# Upper bound of worker threads used for deserialization
+PARALLEL_DESERIALIZATION_MAX_WORKERS: int = 8
+# Loaders that cannot be removed from a LoadersContainer
+DEFAULT_LOADERS: frozenset = frozenset({
+    CacheType.PICKLE, CacheType.ZLIB, CacheType.GZIP, CacheType.JSON, CacheType.YAML,
+    CacheType.LZ4, CacheType.ZSTD, CacheType.MSGPACK
+})
+
+# -------------------------------------------------------------------------------------------------
+# Helpers
+# -------------------------------------------------------------------------------------------------
+
+def _ordered_dict_constructor(loader: Any, node: Any) -> OrderedDict:
+    """
+    Custom constructor for OrderedDict.
+    """
+    return OrderedDict(loader.construct_pairs(node))
+
+# Registered once, instead of on every yaml load
+yaml.add_constructor(
+    "tag:yaml.org,2002:python/object/apply:collections.OrderedDict",
+    _ordered_dict_constructor,
+    Loader=YamlLoader
+)
+
+def _msgpack_ext_hook(code: int, data: bytes) -> Any:
+    """
+    Decodes the msgpack ext types written by the converters, integers wider than 64 bits.
+    """
+    if code == MSGPACK_BIG_INT_EXT:
+        return int(data)
+    return msgpack.ExtType(code, data)
+
+def _json_loads(data: bytes) -> Any:
+    """
+    Parses JSON bytes, with `orjson` when installed.
+    Falls back to the stdlib for what `orjson` rejects, such as integers wider than 64 bits or NaN literals.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
 # -------------------------------------------------------------------------------------------------
 # CLasses
 # -------------------------------------------------------------------------------------------------
@@ -58,6 +142,8 @@ class LoadersContainer:
             Adds a loader to the LoadersContainer.
         ### get_loader(key: str) -> Optional[Callable]:
             Gets a loader by key.
+        ### dispatch(cache_type: str, data: bytes) -> OrderedDict:
+            Loads the data with the loader registered for the cache type.
         ### remove_loader(key: str) -> None:
             Removes a loader from the LoadersContainer.
         ### cleanup() -> None:
@@ -70,6 +156,9 @@ class LoadersContainer:
         - CacheType.GZIP : Loads the cache bank from a gzip object.
         - CacheType.JSON : Loads the cache bank from a json object.
         - CacheType.YAML : Loads the cache bank from a yaml object.
+        - CacheType.LZ4 : Loads the cache bank from a lz4 frame, requires `lz4`.
+        - CacheType.ZSTD : Loads the cache bank from a zstandard frame, requires `zstandard`.
+        - CacheType.MSGPACK : Loads the cache bank from a msgpack object, requires `msgpack`.
 
     """
 
@@ -77,13 +166,15 @@ class LoadersContainer:
     # Slots
 
     __slots__ = (
-        "_loaders"
+        "_loaders",
+        "_deserialize_needed",
     )
 
     # ------------
     # Attributes
 
     _loaders: Dict[str, Callable]
+    _deserialize_needed: bool
 
     # ------------
     # Constructor
@@ -92,6 +183,8 @@ class LoadersContainer:
         Initialize the ConvertersContainer.
         """
         self._loaders: Dict[str, Callable] = self._default_map_loaders()
+        # Loaders that know their data is tuple-keyed can turn this off to skip the key sniffing
+        self._deserialize_needed: bool = True
 
     # ------------
     # Magic Methods
@@ -215,6 +308,32 @@ class LoadersContainer:
             LOGGER.warning(f"Loader '{key}' not found in loaders.")
             raise KeyError(f"Loader '{key}' not found in loaders.")
 
+    def dispatch(self, cache_type: str, data: bytes) -> OrderedDict:
+        """
+        dispatch
+        ========
+        Loads the data with the loader registered for the cache type.
+
+        Note:
+        -------
+        - Fast path for the load handler: a single lookup in the loaders table,
+          without the key validation of `__getitem__`/`get_loader`.
+
+        Arguments:
+            cache_type (str): 
+                The cache type of the data.
+            data (bytes): 
+                The data to load.
+
+        Returns:
+            out (OrderedDict): 
+                The loaded cache bank.
+        """
+        loader: Optional[Callable] = self._loaders.get(cache_type)
+        if loader is None:
+            raise KeyError(f"Loader '{cache_type}' not found in loaders.")
+        return loader(data)
+
     def remove_loader(self, key: str) -> None:
         """
         Remove a loader from the ConvertersContainer.
@@ -225,7 +344,7 @@ class LoadersContainer:
             raise ValueError("Key cannot be empty")
         
         if key in self._loaders:
-            if key not in [CacheType.PICKLE, CacheType.ZLIB, CacheType.GZIP, CacheType.JSON, CacheType.YAML]:
+            if key not in DEFAULT_LOADERS:
                 del self._loaders[key]
             else:
                 LOGGER.warning(f"Loader '{key}' is a default loader and cannot be removed.")
@@ -236,8 +355,7 @@ class LoadersContainer:
         """
         Cleanup the ConvertersContainer.
         """
-        default_keys = {CacheType.PICKLE, CacheType.ZLIB, CacheType.GZIP, CacheType.JSON, CacheType.YAML}
-        keys_to_remove = [k for k in self._loaders.keys() if k not in default_keys]
+        keys_to_remove = [k for k in self._loaders.keys() if k not in DEFAULT_LOADERS]
         for key in keys_to_remove:
             del self._loaders[key]
 
@@ -260,9 +378,101 @@ class LoadersContainer:
         else:
             return (func_name, args, kwargs)
 
+    def _parse_key(self, key: str) -> Optional[Tuple]:
+        """
+        _parse_key
+        ==========
+        Parses a stringified cache key back to its tuple form.
+
+        Arguments:
+            key (str): 
+                The stringified key.
+
+        Returns:
+            out (Optional[Tuple]): 
+                The reconstructed key, or None if the key could not be parsed.
+        """
+        if not isinstance(key, str):
+            raise TypeError(f"Keys of cached function must be a string, got {type(key)}")
+
+        # Parse the stringified tuple
+        try:
+            parsed = literal_eval(key)
+        except (ValueError, SyntaxError) as e:
+            LOGGER.error(f"Error '{e.__class__.__name__}' -> Failed to parse key '{key}': {e}")
+            return None
+
+        if not isinstance(parsed, tuple):
+            raise TypeError(f"Parsed key must be a tuple, got {type(parsed)}")
+
+        # Get each part of the parsed tuple, interning the name repeated by every key of the function
+        parsed_func_name: str = sys.intern(parsed[0]) if isinstance(parsed[0], str) else parsed[0]
+        args: Tuple[Any, ...] = ()
+        kwargs: Dict[str, Any] = {}
+        
+        if len(parsed) == 2:
+            args = parsed[1] if isinstance(parsed[1], tuple) else (parsed[1],)
+        elif len(parsed) == 3:
+            args = parsed[1] if isinstance(parsed[1], tuple) else (parsed[1],)
+            kwargs = parsed[2] if isinstance(parsed[2], dict) else {}
+        
+        # Make key a tuple
+        return self._reconstruct_key(parsed_func_name, args, kwargs)
+
+    def _deserialize_group(
+        self,
+        group: Tuple[str, Dict[str, Any]]
+    ) -> Tuple[str, OrderedDict[Tuple[str, ...], Any]]:
+        """
+        _deserialize_group
+        ==================
+        Deserializes the cached entries of a single function.
+
+        Arguments:
+            group (Tuple[str, Dict[str, Any]]): 
+                The function name and its stringified entries.
+
+        Returns:
+            out (Tuple[str, OrderedDict[Tuple[str, ...], Any]]): 
+                The function name and its entries keyed by tuples.
+        """
+        func_name, ord_dict = group
+        func_name = sys.intern(func_name)
+
+        # Keys and values are paired in C, no per-entry Python loop
+        entries = OrderedDict(zip(map(self._parse_key, ord_dict), ord_dict.values()))
+        # Unparsable keys all collapse into a single None entry
+        entries.pop(None, None)
+
+        return func_name, entries
+
+    def _needs_deserialization(self, data: Dict[str, Dict[Any, Any]]) -> bool:
+        """
+        _needs_deserialization
+        ======================
+        Checks if the keys of the data still have to be converted back to tuples.
+        Only the first cached key is inspected, as all keys of a bank share the same shape.
+
+        Arguments:
+            data (Dict[str, Dict[Any, Any]]): 
+                The data to check.
+
+        Returns:
+            out (bool): 
+                False if the data is already keyed by tuples, True otherwise.
+        """
+        if not self._deserialize_needed:
+            return False
+        
+        for ord_dict in data.values():
+            for first_key in ord_dict:
+                return not isinstance(first_key, tuple)
+        # No keys to sniff, the regular path is trivial
+        return True
+
     def _deserialization(
         self, 
-        data: OrderedDict[str, OrderedDict[str, Any]]
+        data: Dict[str, Dict[str, Any]]
     ) -> OrderedDict[str, OrderedDict[Tuple[str, ...], Any]]:
         """
         _deserialization
@@ -270,51 +480,57 @@ class LoadersContainer:
         Deserializes the cache bank data.
         This method converts the stringified keys back to tuples.
 
+        Note:
+        -------
+        - Functions are independent of each other, so banks with at least
+          `PARALLEL_DESERIALIZATION_THRESHOLD` functions are deserialized in a thread pool.
+        - Input may be plain dicts, the output is always an OrderedDict,
+          as the bank relies on `move_to_end` and `popitem(last=False)` for LRU.
+
         Arguments:
-            data (OrderedDict[str, OrderedDict[str, Any]]): 
+            data (Dict[str, Dict[str, Any]]): 
                 The data to deserialize.
 
         Returns:
             out (OrderedDict[str, OrderedDict[Tuple[str, ...], Any]]): 
                 The deserialized data.
         """
-        # Convert stringified keys back to tuples
-        cache_bank = OrderedDict()
-        
-        for func_name, ord_dict in data.items():
-            cache_bank[func_name] = OrderedDict()
-            # key is a stringified tuple / value is the cached value
-            for key, value in ord_dict.items():
-                if not isinstance(key, str):
-                    raise TypeError(f"Keys of cached function must be a string, got {type(key)}")
-
-                # Parse the stringified tuple
-                try:
-                    parsed = literal_eval(key)
-                except (ValueError, SyntaxError) as e:
-                    LOGGER.error(f"Error '{e.__class__.__name__}' -> Failed to parse key '{key}': {e}")
-                    continue
-
-                if not isinstance(parsed, tuple):
-                    raise TypeError(f"Parsed key must be a tuple, got {type(parsed)}")
-
-                # Get each part of the parsed tuple
-                parsed_func_name: str = parsed[0]
-                args: Tuple[Any, ...] = ()
-                kwargs: Dict[str, Any] = {}
-                
-                if len(parsed) == 2:
-                    args = parsed[1] if isinstance(parsed[1], tuple) else (parsed[1],)
-                elif len(parsed) == 3:
-                    args = parsed[1] if isinstance(parsed[1], tuple) else (parsed[1],)
-                    kwargs = parsed[2] if isinstance(parsed[2], dict) else {}
-                
-                # Make key a tuple
-                new_key = self._reconstruct_key(parsed_func_name, args, kwargs)
-                # Update the key in the cache bank
-                cache_bank[func_name][new_key] = value
-        
-        return cache_bank
+        # Keys are already tuples, only plain dicts are converted
+        if not self._needs_deserialization(data):
+            return OrderedDict(
+                (func_name, ord_dict if isinstance(ord_dict, OrderedDict) else OrderedDict(ord_dict))
+                for func_name, ord_dict in data.items()
+            )
+
+        if len(data) >= PARALLEL_DESERIALIZATION_THRESHOLD:
+            max_workers: int = min(PARALLEL_DESERIALIZATION_MAX_WORKERS, os.cpu_count() or 1)
+            # map keeps the order of the functions
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                return OrderedDict(executor.map(self._deserialize_group, data.items()))
+
+        return OrderedDict(self._deserialize_group(group) for group in data.items())
+
+    def _unpickle(self, data: bytes) -> Any:
+        """
+        _unpickle
+        =========
+        Unpickles the data with the C unpickler.
+
+        Note:
+        -------
+        - `fix_imports=False` skips the Python 2 name mapping, which is never needed for cache banks.
+        - Dumpers should use `pickle.HIGHEST_PROTOCOL` and may run the stream through
+          `pickletools.optimize` to drop unused memo entries, making every load smaller and faster.
+
+        Arguments:
+            data (bytes): 
+                The pickled data.
+
+        Returns:
+            out (Any): 
+                The unpickled object.
+        """
+        return pickle.Unpickler(io.BytesIO(data), fix_imports=False).load()
 
     # ------------
     # Loaders
@@ -325,6 +541,10 @@ class LoadersContainer:
         ============
         Loads the cache bank from a pickle object.
 
+        Note:
+        -------
+        - Errors are not logged here, they propagate to the caller which logs them once.
+
         Arguments:
             data (bytes): 
                 The data to load.
@@ -333,18 +553,14 @@ class LoadersContainer:
             out (OrderedDict) : 
                 The loaded data.
         """
-        try:
-            if not isinstance(data, bytes):
-                raise TypeError("Data must be a bytes object.")
-            # Unpickle the data
-            out = pickle.loads(data)
-            # Check if the data is an OrderedDict
-            if not isinstance(out, OrderedDict):
-                raise TypeError(f"Cache bank must be an OrderedDict, got {type(out)}.")
-            return out
-        except Exception as e:
-            LOGGER.error(f"Error loading pickle: {e}")
-            raise e
+        if not isinstance(data, bytes):
+            raise TypeError("Data must be a bytes object.")
+        # Unpickle the data
+        out = self._unpickle(data)
+        # Check if the data is an OrderedDict
+        if not isinstance(out, OrderedDict):
+            raise TypeError(f"Cache bank must be an OrderedDict, got {type(out)}.")
+        return out
     
     def _load_zlib(self, data: bytes) -> OrderedDict:
         """
@@ -352,6 +568,10 @@ class LoadersContainer:
         ==========
         Loads the cache bank from a zlib object.
 
+        Note:
+        -------
+        - Errors are not logged here, they propagate to the caller which logs them once.
+
         Arguments:
             data (bytes): 
                 The data to load.
@@ -360,18 +580,14 @@ class LoadersContainer:
             OrderedDict: 
                 The loaded data.
         """
-        try:
-            if not isinstance(data, bytes):
-                raise TypeError("Data must be a bytes object.")
-            # Uncompress the data
-            out: OrderedDict = pickle.loads(zlib.decompress(data))
-            # Check if the output is an OrderedDict
-            if not isinstance(out, OrderedDict):
-                raise TypeError(f"Cache bank must be an OrderedDict, got {type(out)}.")
-            return out
-        except Exception as e:
-            LOGGER.error(f"Error loading zlib: {e}")
-            raise e
+        if not isinstance(data, bytes):
+            raise TypeError("Data must be a bytes object.")
+        # Uncompress the data
+        out: OrderedDict = self._unpickle(zlib.decompress(data))
+        # Check if the output is an OrderedDict
+        if not isinstance(out, OrderedDict):
+            raise TypeError(f"Cache bank must be an OrderedDict, got {type(out)}.")
+        return out
 
     def _load_gzip(self, data: bytes) -> OrderedDict:
         """
@@ -379,6 +595,10 @@ class LoadersContainer:
         ==========
         Loads the cache bank from a gzip object.
 
+        Note:
+        -------
+        - Errors are not logged here, they propagate to the caller which logs them once.
+
         Arguments:
             data (bytes): 
                 The data to load.
@@ -387,17 +607,69 @@ class LoadersContainer:
             OrderedDict: 
                 The loaded data.
         """
-        try:
-            if not isinstance(data, bytes):
-                raise TypeError("Data must be a bytes object.")
-            out: OrderedDict = pickle.loads(gzip.decompress(data))
-            # Check if the output is an OrderedDict
-            if not isinstance(out, OrderedDict):
-                raise TypeError(f"Cache bank must be an OrderedDict, got {type(out)}.")
-            return out
-        except Exception as e:
-            LOGGER.error(f"Error loading gzip: {e}")
-            raise e
+        if not isinstance(data, bytes):
+            raise TypeError("Data must be a bytes object.")
+        out: OrderedDict = self._unpickle(gzip.decompress(data))
+        # Check if the output is an OrderedDict
+        if not isinstance(out, OrderedDict):
+            raise TypeError(f"Cache bank must be an OrderedDict, got {type(out)}.")
+        return out
+
+    def _load_lz4(self, data: bytes) -> OrderedDict:
+        """
+        _load_lz4
+        =========
+        Loads the cache bank from a lz4 frame object.
+
+        Note:
+        -------
+        - Errors are not logged here, they propagate to the caller which logs them once.
+
+        Arguments:
+            data (bytes): 
+                The data to load.
+
+        Returns:
+            OrderedDict: 
+                The loaded data.
+        """
+        if lz4_frame is None:
+            raise ImportError("CacheType.LZ4 requires the optional 'lz4' package.")
+        if not isinstance(data, bytes):
+            raise TypeError("Data must be a bytes object.")
+        out: OrderedDict = self._unpickle(lz4_frame.decompress(data))
+        # Check if the output is an OrderedDict
+        if not isinstance(out, OrderedDict):
+            raise TypeError(f"Cache bank must be an OrderedDict, got {type(out)}.")
+        return out
+
+    def _load_zstd(self, data: bytes) -> OrderedDict:
+        """
+        _load_zstd
+        ==========
+        Loads the cache bank from a zstandard frame object.
+
+        Note:
+        -------
+        - Errors are not logged here, they propagate to the caller which logs them once.
+
+        Arguments:
+            data (bytes): 
+                The data to load.
+
+        Returns:
+            OrderedDict: 
+                The loaded data.
+        """
+        if zstandard is None:
+            raise ImportError("CacheType.ZSTD requires the optional 'zstandard' package.")
+        if not isinstance(data, bytes):
+            raise TypeError("Data must be a bytes object.")
+        out: OrderedDict = self._unpickle(zstandard.ZstdDecompressor().decompress(data))
+        # Check if the output is an OrderedDict
+        if not isinstance(out, OrderedDict):
+            raise TypeError(f"Cache bank must be an OrderedDict, got {type(out)}.")
+        return out
 
     def _load_json(self, data: bytes) -> OrderedDict:
         """
@@ -417,14 +689,8 @@ class LoadersContainer:
             if not isinstance(data, bytes):
                 raise TypeError("Data must be a bytes object.")
             
-            # Decode bytes to string
-            json_str = data.decode("utf-8")
-
-            # Load JSON data with custom decoder
-            loaded_data: OrderedDict = json.loads(
-                json_str,
-                object_pairs_hook=OrderedDict
-            )
+            # Plain dicts keep insertion order, the OrderedDict is only built once keys are rebuilt
+            loaded_data: Dict[str, Dict[str, Any]] = _json_loads(data)
 
             # Convert stringified keys back to tuples
             cache_bank = self._deserialization(loaded_data)
@@ -436,7 +702,7 @@ class LoadersContainer:
             return cache_bank
         except Exception as e:
             LOGGER.error(f"Error loading json: {e}")
-            raise e
+            raise
         
     def _load_yaml(self, data: bytes) -> OrderedDict:
         """
@@ -452,25 +718,12 @@ class LoadersContainer:
             OrderedDict: 
                 The loaded data.
         """
-        def ordered_dict_constructor(loader, node):
-            """
-            Custom constructor for OrderedDict.
-            """
-            return OrderedDict(loader.construct_pairs(node))
-    
         try:
-            # Add the custom constructor to the yaml loader
-            yaml.add_constructor(
-                "tag:yaml.org,2002:python/object/apply:collections.OrderedDict",
-                ordered_dict_constructor,
-                Loader=yaml.FullLoader
-            )
-
             if not isinstance(data, bytes):
                 raise TypeError("Data must be a bytes object.")
             
             # Uncompress the data
-            loaded_data: OrderedDict = yaml.load(data, Loader=yaml.FullLoader)
+            loaded_data: OrderedDict = yaml.load(data, Loader=YamlLoader)
 
             # Deserialize the data
             cache_bank = self._deserialization(loaded_data)
@@ -482,7 +735,42 @@ class LoadersContainer:
             return cache_bank
         except Exception as e:
             LOGGER.error(f"Error loading yaml: {e}")
-            raise e
+            raise
+
+    def _load_msgpack(self, data: bytes) -> OrderedDict:
+        """
+        _load_msgpack
+        =============
+        Loads the cache bank from a msgpack object.
+
+        Arguments:
+            data (bytes): 
+                The data to load.
+
+        Returns:
+            OrderedDict: 
+                The loaded data.
+        """
+        try:
+            if msgpack is None:
+                raise ImportError("CacheType.MSGPACK requires the optional 'msgpack' package.")
+            if not isinstance(data, bytes):
+                raise TypeError("Data must be a bytes object.")
+
+            # Plain dicts keep insertion order, the OrderedDict is only built once keys are rebuilt
+            loaded_data: Dict[str, Dict[str, Any]] = msgpack.unpackb(data, raw=False, ext_hook=_msgpack_ext_hook)
+
+            # Convert stringified keys back to tuples
+            cache_bank = self._deserialization(loaded_data)
+
+            # Check if the output is an OrderedDict
+            if not isinstance(cache_bank, OrderedDict):
+                raise TypeError(f"Cache bank must be an OrderedDict, got {type(cache_bank)}.")
+
+            return cache_bank
+        except Exception as e:
+            LOGGER.error(f"Error loading msgpack: {e}")
+            raise
 
     def _default_map_loaders(self) -> Dict[str, Callable]:
         """
@@ -498,7 +786,10 @@ class LoadersContainer:
             CacheType.ZLIB: self._load_zlib,
             CacheType.GZIP: self._load_gzip,
             CacheType.JSON: self._load_json,
-            CacheType.YAML: self._load_yaml
+            CacheType.YAML: self._load_yaml,
+            CacheType.LZ4: self._load_lz4,
+            CacheType.ZSTD: self._load_zstd,
+            CacheType.MSGPACK: self._load_msgpack
         }
         ```
         """
@@ -507,6 +798,9 @@ class LoadersContainer:
             CacheType.ZLIB: self._load_zlib,
             CacheType.GZIP: self._load_gzip,
             CacheType.JSON: self._load_json,
-            CacheType.YAML: self._load_yaml
+            CacheType.YAML: self._load_yaml,
+            CacheType.LZ4: self._load_lz4,
+            CacheType.ZSTD: self._load_zstd,
+            CacheType.MSGPACK: self._load_msgpack
         }
 
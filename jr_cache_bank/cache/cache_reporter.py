@@ -3,12 +3,14 @@
 # -------------------------------------------------------------------------------------------------
 
 import logging
+import sys
 
-from threading import Lock
-from functools import partial
-from typing import Callable, Any, Dict, Optional
+from threading import Lock, local
+from functools import partial, singledispatch
+from typing import Callable, Any, Dict, Iterator, List, Optional, Tuple
 
 # Local
+from jr_cache_bank.cache.cache_rwlock import RWLock
 from jr_cache_bank.config.setup_logger import setup_logger
 from jr_cache_bank.exceptions.exceptions_cache_reporter import (
     CacheReporterConstructionError,
@@ -38,11 +40,210 @@ except Exception as e:
     LOGGER.addHandler(handler)
     LOGGER.error(f"Error setting up logger: {e}")
 
+# -------------------------------------------------------------------------------------------------
+# Constants
+# -------------------------------------------------------------------------------------------------
+
+# Pointer slots of padding around the counters of a thread shard, 8 x 8 bytes = one cache line
+SHARD_PADDING: int = 8
+# Positions of the counters inside a thread shard
+SHARD_HITS: int = SHARD_PADDING
+SHARD_MISSES: int = SHARD_PADDING + 1
+# Padding on both sides keeps the counters off any cache line shared with another allocation
+SHARD_SIZE: int = 2 * SHARD_PADDING + 2
+
+# -------------------------------------------------------------------------------------------------
+# Helpers
+# -------------------------------------------------------------------------------------------------
+
+@singledispatch
+def _name_of(func: Any) -> str:
+    """
+    _name_of
+    ========
+    Resolves the name of a function, dispatching on its type through a single type-map lookup.
+
+    Arguments:
+        func (str | Callable | partial) :
+            The function to resolve.
+
+    Returns:
+        str :
+            The name of the function.
+    """
+    if callable(func):
+        return func.__name__
+    raise TypeError("Function must be callable or partial.")
+
+@_name_of.register
+def _(func: str) -> str:
+    return func
+
+@_name_of.register
+def _(func: partial) -> str:
+    return func.func.__name__
+
 # -------------------------------------------------------------------------------------------------
 # CLasses
 # -------------------------------------------------------------------------------------------------
 
 
+class FuncStats:
+    """
+    FuncStats
+    =========
+    The statistics of a single function tracked by the cache reporter.
+
+    Notes:
+    -----
+        - Fields are slots, which are smaller than a dict per function and are read without hashing.
+        - Rates are computed when read, so recording an event is pure integer arithmetic.
+        - Supports read-only mapping access (`stats["hits"]`, `items()`) for dict-style callers.
+
+    Attributes:
+        hits (int) :
+            The number of cache hits.
+        misses (int) :
+            The number of cache misses.
+        total (int) :
+            The number of cache accesses.
+        hit_rate (float) :
+            The hit rate of the function.
+        miss_rate (float) :
+            The miss rate of the function.
+    """
+
+    # -------------
+    # Slots
+
+    __slots__ = (
+        "hits",
+        "misses",
+        "total"
+    )
+
+    # Fields exposed through the mapping access, rates included
+    FIELDS: Tuple[str, ...] = ("hits", "misses", "total", "hit_rate", "miss_rate")
+
+    # -------------
+    # Attributes
+
+    hits: int
+    misses: int
+    total: int
+
+    # -------------
+    # Constructor
+
+    def __init__(
+        self,
+        hits: int = 0,
+        misses: int = 0,
+        total: int = 0
+    ) -> None:
+        """
+        __init__
+        ======
+        Constructor for the FuncStats class.
+        """
+        self.hits = hits
+        self.misses = misses
+        self.total = total
+
+    # -------------
+    # Properties
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Returns the hit rate of the function.
+        """
+        return self.hits / self.total if self.total else 0.0
+
+    @property
+    def miss_rate(self) -> float:
+        """
+        Returns the miss rate of the function.
+        """
+        return self.misses / self.total if self.total else 0.0
+
+    # -------------
+    # Magic Methods
+
+    def __getitem__(self, key: str) -> Any:
+        """
+        Returns the field named by the key.
+        """
+        if key not in self.FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        """
+        Iterates over the field names.
+        """
+        return iter(self.FIELDS)
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Compares the fields with another FuncStats or a dict.
+        """
+        if isinstance(other, (FuncStats, dict)):
+            return self.as_dict() == dict(other.items())
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        """
+        Returns a string representation of the stats.
+        """
+        return f"FuncStats({self.as_dict()})"
+
+    # -------------
+    # Methods
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        """
+        items
+        =====
+        Iterates over the `(field, value)` pairs.
+        """
+        return ((key, getattr(self, key)) for key in self.FIELDS)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        as_dict
+        =======
+        Returns the stats as a new dictionary.
+
+        Returns:
+            Dict[str, Any] :
+                The stats keyed by field name.
+        """
+        return {key: getattr(self, key) for key in self.FIELDS}
+
+    @classmethod
+    def from_value(cls, value: "FuncStats | Dict[str, Any]") -> "FuncStats":
+        """
+        from_value
+        ==========
+        Builds the stats from a dictionary, or returns them unchanged if they already are stats.
+
+        Arguments:
+            value (FuncStats | Dict[str, Any]) :
+                The stats or a dictionary with any of the stats fields.
+                Rates are derived from the counts, given rates are ignored.
+
+        Returns:
+            FuncStats :
+                The stats.
+        """
+        if isinstance(value, cls):
+            return value
+        if not isinstance(value, dict):
+            raise TypeError("Value must be a dictionary.")
+        return cls(**{key: value[key] for key in cls.__slots__ if key in value})
+
+
 class CacheReporter:
     """
     CacheReporter
@@ -53,6 +254,12 @@ class CacheReporter:
     Notes:
     -----
         - The cache reporter is thread-safe and can be used in a multi-threaded environment.
+        - Global hits/misses are sharded per thread: each thread only bumps its own shard,
+          without synchronization, and reads sum the shards.
+        - The mutex is a reader/writer lock: the `print_*` methods share the read side,
+          so monitoring readers do not serialize each other.
+        - Per-event stats updates only take `_stats_lock`, a plain C-level `Lock`,
+          instead of the write side of the Python-level reader/writer lock.
 
     Attributes:
         total (int) :
@@ -65,7 +272,7 @@ class CacheReporter:
             The hit rate of the cache.
         miss_rate (float) :
             The miss rate of the cache.
-        funcs (Dict[str, Dict[str, Any]]) :
+        funcs (Dict[str, FuncStats]) :
             A dictionary containing the functions used in the cache.
 
     Methods:
@@ -98,25 +305,29 @@ class CacheReporter:
     # Slots
 
     __slots__ = (
-        "_total",
         "_hits",
         "_misses",
+        "_tls",
+        "_shards",
         "_hit_rate",
         "_miss_rate",
         "_funcs",
-        "_mutex"
+        "_mutex",
+        "_stats_lock"
     )
 
     # -------------
     # Attributes
 
-    _total: int
     _hits: int
     _misses: int
+    _tls: local
+    _shards: List[List[int]]
     _hit_rate: float
     _miss_rate: float
-    _funcs: Dict[str, Dict[str, Any]]
-    _mutex: Optional[Lock]
+    _funcs: Dict[str, FuncStats]
+    _mutex: RWLock
+    _stats_lock: Lock
 
     # -------------
     # Constructor
@@ -128,14 +339,16 @@ class CacheReporter:
         Constructor for the CacheReporter class.
         """
         try:
-            super().__init__()
-            self._total = 0
+            self._tls = local()
+            self._shards = []
+            # Eager, a lazy check-then-create could hand two threads different locks
+            self._mutex = RWLock()
+            self._stats_lock = Lock()
             self.hits = 0
             self.misses = 0
             self.hit_rate = 0.0
             self.miss_rate = 0.0
             self.funcs = {}
-            self._mutex = None
         except Exception as e:
             LOGGER.error(f"Error '{e.__class__.__name__}' -> initializing cache reporter: {e}")
             raise CacheReporterConstructionError(
@@ -150,23 +363,21 @@ class CacheReporter:
         """
         Returns the total number of cache accesses.
         """
-        if not hasattr(self, '_total'):
-            self._total = 0
-        return self._total
+        return self.hits + self.misses
 
     @property
     def hits(self) -> int:
         """
         Returns the total number of cache hits.
         """
-        return self._hits
+        return self._hits + self._shard_sum(SHARD_HITS)
     
     @property
     def misses(self) -> int:
         """
         Returns the total number of cache misses.
         """
-        return self._misses
+        return self._misses + self._shard_sum(SHARD_MISSES)
     
     @property
     def hit_rate(self) -> float:
@@ -174,13 +385,10 @@ class CacheReporter:
         Returns the hit rate of the cache.
         """
         try:
-            if self._total == 0:
-                self._hit_rate = 0.0
-            else:
-                self._hit_rate = self.hits / self._total
-            if self._hit_rate < 0.0 or self._hit_rate > 1.0:
-                raise ValueError("Hit rate must be between 0.0 and 1.0.")
-            return self._hit_rate
+            # Computed on demand, each shard sum is read once
+            hits: int = self.hits
+            total: int = hits + self.misses
+            return hits / total if total else 0.0
         except Exception as e:
             LOGGER.error(f"Error '{e.__class__.__name__}' -> getting 'hit_rate' from cache reporter: {e}")
             raise CacheReporterPropertyError(
@@ -193,13 +401,10 @@ class CacheReporter:
         Returns the miss rate of the cache.
         """
         try:
-            if self._total == 0:
-                self._miss_rate = 0.0
-            else:
-                self._miss_rate = self.misses / self._total
-            if self._miss_rate < 0.0 or self._miss_rate > 1.0:
-                raise ValueError("Miss rate must be between 0.0 and 1.0.")
-            return self._miss_rate
+            # Computed on demand, each shard sum is read once
+            misses: int = self.misses
+            total: int = misses + self.hits
+            return misses / total if total else 0.0
         except Exception as e:
             LOGGER.error(f"Error '{e.__class__.__name__}' -> getting 'miss_rate' from cache reporter: {e}")
             raise CacheReporterPropertyError(
@@ -207,19 +412,17 @@ class CacheReporter:
             ) from e
 
     @property
-    def funcs(self) -> Dict[str, Dict[str, Any]]:
+    def funcs(self) -> Dict[str, FuncStats]:
         """
         Returns the functions used in the cache.
         """
         return self._funcs
     
     @property
-    def mutex(self) -> Lock:
+    def mutex(self) -> RWLock:
         """
         Returns the mutex used for thread safety.
         """
-        if self._mutex is None:
-            self._mutex = Lock()
         return self._mutex
 
     @property
@@ -242,7 +445,8 @@ class CacheReporter:
                 raise TypeError("Hits must be an integer.")
             if value < 0:
                 raise ValueError("Hits must be greater than or equal to 0.")
-            self._hits = value
+            # Shards are never written by readers, the base absorbs their current sum
+            self._hits = value - self._shard_sum(SHARD_HITS)
         except Exception as e:
             LOGGER.error(f"Error '{e.__class__.__name__}' -> setting 'hits' in cache reporter: {e}")
             raise CacheReporterPropertyError(
@@ -259,7 +463,8 @@ class CacheReporter:
                 raise TypeError("Misses must be an integer.")
             if value < 0:
                 raise ValueError("Misses must be greater than or equal to 0.")
-            self._misses = value
+            # Shards are never written by readers, the base absorbs their current sum
+            self._misses = value - self._shard_sum(SHARD_MISSES)
         except Exception as e:
             LOGGER.error(f"Error '{e.__class__.__name__}' -> setting 'misses' in cache reporter: {e}")
             raise CacheReporterPropertyError(
@@ -301,14 +506,14 @@ class CacheReporter:
             ) from e
 
     @funcs.setter
-    def funcs(self, value: Dict[str, Dict[str, Any]]) -> None:
+    def funcs(self, value: Dict[str, FuncStats | Dict[str, Any]]) -> None:
         """
         Sets the functions used in the cache.
         """
         try:
             if not isinstance(value, dict):
                 raise TypeError("Functions must be a dictionary.")
-            self._funcs = value
+            self._funcs = {name: FuncStats.from_value(stats) for name, stats in value.items()}
         except Exception as e:
             LOGGER.error(f"Error '{e.__class__.__name__}' -> setting 'funcs' in cache reporter: {e}")
             raise CacheReporterPropertyError(
@@ -344,24 +549,24 @@ class CacheReporter:
                 f"Error '{e.__class__.__name__}' -> checking if key is in cache reporter: {e}"
             ) from e
         
-    def __getitem__(self, key: str) -> Dict[str, Any]:
+    def __getitem__(self, key: str) -> FuncStats:
         """
         Returns the value associated with the key in the cache reporter.
         """
         try:
             if not isinstance(key, str):
                 raise TypeError("Key must be a string.")
-            if key in self.funcs:
-                return self.funcs[key]
-            else:
+            stats: Optional[FuncStats] = self.funcs.get(key)
+            if stats is None:
                 raise KeyError(f"Key {key} not found in cache reporter.")
+            return stats
         except Exception as e:
             LOGGER.error(f"Error '{e.__class__.__name__}' -> getting item from cache reporter: {e}")
             raise CacheReporterMagicMethodError(
                 f"Error '{e.__class__.__name__}' -> getting item from cache reporter: {e}"
             ) from e
         
-    def __setitem__(self, key: str, value: Dict[str, Any]) -> None:
+    def __setitem__(self, key: str, value: FuncStats | Dict[str, Any]) -> None:
         """
         Sets the value associated with the key in the cache reporter.
         """
@@ -370,9 +575,7 @@ class CacheReporter:
                 raise TypeError("Key must be a string.")
             if key in self.funcs:
                 LOGGER.warning(f"Key {key} already exists in cache reporter.")
-            if not isinstance(value, dict):
-                raise TypeError("Value must be a dictionary.")
-            self.funcs[key] = value
+            self.funcs[key] = FuncStats.from_value(value)
         except Exception as e:
             LOGGER.error(f"Error '{e.__class__.__name__}' -> setting item in cache reporter: {e}")
             raise CacheReporterMagicMethodError(
@@ -386,9 +589,7 @@ class CacheReporter:
         try:
             if not isinstance(key, str):
                 raise TypeError("Key must be a string.")
-            if key in self.funcs:
-                del self.funcs[key]
-            else:
+            if self.funcs.pop(key, None) is None:
                 raise KeyError(f"Key {key} not found in cache reporter.")
         except Exception as e:
             LOGGER.error(f"Error '{e.__class__.__name__}' -> deleting item from cache reporter: {e}")
@@ -417,7 +618,8 @@ class CacheReporter:
                 return
             
             with self.mutex:
-                self.funcs[func_name] = {}
+                # Interned keys let later lookups match by identity
+                self.funcs[sys.intern(func_name)] = FuncStats()
         except Exception as e:
             LOGGER.error(f"Error '{e.__class__.__name__}' -> adding function to cache reporter: {e}")
             raise CacheReporterAddFunctionError(
@@ -464,23 +666,16 @@ class CacheReporter:
             # Get the function name
             func_name: str = self._extract_name(func)
 
-            if func in self.funcs:
-                with self.mutex:
-                    self.funcs[func_name]["hits"] = self.funcs[func_name].setdefault("hits", 0) + 1
-                    self.funcs[func_name]["total"] = self.funcs[func_name].setdefault("total", 0) + 1
-                    self.hits += 1
-
-                    # Calculate rate
-                    if self.funcs[func_name]["total"] > 0:
-                        hit_rate: float = self.funcs[func_name]["hits"] / self.funcs[func_name]["total"]
-                    else:
-                        hit_rate: float = 0.0
-
-                    # Update the hit rate
-                    self.funcs[func_name]["hit_rate"] = hit_rate
+            with self._stats_lock:
+                # Single lookup, also covers a concurrent removal
+                stats: Optional[FuncStats] = self.funcs.get(func_name)
+                if stats is None:
+                    return
+                stats.hits += 1
+                stats.total += 1
 
-                    # Update Total
-                    self._total += 1          
+            # Thread own shard, no lock needed
+            self._bump_hits()
 
         except Exception as e:
             LOGGER.error(f"Error '{e.__class__.__name__}' -> setting hit for function in cache reporter: {e}")
@@ -502,23 +697,16 @@ class CacheReporter:
             # Get the function name
             func_name: str = self._extract_name(func)
 
-            if func_name in self.funcs:
-                with self.mutex:
-                    self.funcs[func_name]["misses"] = self.funcs[func_name].setdefault("misses", 0) + 1
-                    self.funcs[func_name]["total"] = self.funcs[func_name].setdefault("total", 0) + 1
-                    self.misses += 1
-
-                    # Calculate rate
-                    if self.funcs[func_name]["total"] > 0:
-                        miss_rate: float = self.funcs[func_name]["misses"] / self.funcs[func_name]["total"]
-                    else:
-                        miss_rate: float = 0.0
+            with self._stats_lock:
+                # Single lookup, also covers a concurrent removal
+                stats: Optional[FuncStats] = self.funcs.get(func_name)
+                if stats is None:
+                    return
+                stats.misses += 1
+                stats.total += 1
 
-                    # Update the miss rate
-                    self.funcs[func_name]["miss_rate"] = miss_rate
-
-                    # Update Total
-                    self._total += 1
+            # Thread own shard, no lock needed
+            self._bump_misses()
 
         except Exception as e:
             LOGGER.error(f"Error '{e.__class__.__name__}' -> setting miss for function in cache reporter: {e}")
@@ -532,6 +720,11 @@ class CacheReporter:
         ====
         Returns the value associated with the function in the cache reporter.
 
+        Note:
+        -------
+        - No lock is taken, a single dict lookup is atomic under the GIL.
+          The returned stats may reflect an update that is still in progress in another thread.
+
         Arguments:
             func (str | Callable | partial)) :
                 The function to get the value for.
@@ -548,19 +741,18 @@ class CacheReporter:
             if not isinstance(func_name, str):
                 raise TypeError("Key must be a string.")
             
-            if func_name in self.funcs:
-                with self.mutex:
-                    return self.funcs[func_name]
-            else:
+            stats: Optional[FuncStats] = self.funcs.get(func_name)
+            if stats is None:
                 LOGGER.warning(f"Function {func_name} not found in cache reporter.")
                 return None
+            return stats.as_dict()
         except Exception as e:
             LOGGER.error(f"Error '{e.__class__.__name__}' -> getting item from cache reporter: {e}")
             raise CacheReporterGetFunctionError(
                 f"Error '{e.__class__.__name__}' -> getting item from cache reporter: {e}"
             ) from e
         
-    def set(self, func: str | Callable | partial, value: Dict[str, Any]) -> None:
+    def set(self, func: str | Callable | partial, value: FuncStats | Dict[str, Any]) -> None:
         """
         set
         ===
@@ -569,7 +761,7 @@ class CacheReporter:
         Arguments:
             func (str | Callable | partial) :
                 The function to set the value for.
-            value (Dict[str, Any]) :
+            value (FuncStats | Dict[str, Any]) :
                 The value to set for the function.
         """
         try:
@@ -577,8 +769,9 @@ class CacheReporter:
             func_name: str = self._extract_name(func)
 
             if func_name in self.funcs:
+                stats: FuncStats = FuncStats.from_value(value)
                 with self.mutex:
-                    self.funcs[func_name] = value
+                    self.funcs[func_name] = stats
             else:
                 raise KeyError(f"Function {func_name} not found in cache reporter.")
         except Exception as e:
@@ -650,23 +843,21 @@ class CacheReporter:
         Prints the report for a function in the cache reporter.
 
         Arguments:
-            func (Callable) :
+            func (str | Callable | partial) :
                 The function to print the report for.
         """
         try:
-            if isinstance(func, partial):
-                func_name:str = func.func.__name__
-            elif callable(func):
-                func_name:str = func.__name__
-            else:
-                raise TypeError("Function must be callable or partial.")
-            
-            if func in self.funcs:
-                with self.mutex:
-                    string: str = f"Function {func_name}:\n"
-                    for key, value in self.funcs[func_name].items():
-                        string += f"{key}: {value}\n"
-                print(string)
+            # Get the function name
+            func_name: str = self._extract_name(func)
+
+            stats: Optional[FuncStats] = self.funcs.get(func_name)
+            if stats is not None:
+                # Single record, no lock needed to snapshot it
+                parts: List[str] = [f"Function {func_name}:"]
+                parts.extend(f"{key}: {value}" for key, value in stats.as_dict().items())
+                # Joined once, trailing newline kept
+                parts.append("")
+                print("\n".join(parts))
             else:
                 LOGGER.warning(f"Function {func_name} not found in cache reporter.")
         except Exception as e:
@@ -682,20 +873,20 @@ class CacheReporter:
         Prints the full report for all functions in the cache reporter.
         """
         try:
-            string: str = "Full Function Reports:\n"
-            string += f"Total: {self.total}\n"
-            string += f"Hits: {self.hits}\n"
-            string += f"Misses: {self.misses}\n"
-            string += f"Hit Rate: {self.hit_rate:.2f}\n"
-            string += f"Miss Rate: {self.miss_rate:.2f}\n"
-            string += "Functions:\n"
-
-            with self.mutex:
-                for key, value in self.funcs.items():
-                    string += f"\t{key}:\n"
-                    for k, v in value.items():
-                        string += f"\t{k}: {v}\n"
-            print(string)
+            parts: List[str] = self._report_header("Full Function Reports:")
+
+            # Copy under the lock, format outside of it
+            with self.mutex.read_lock():
+                snapshot: List[Tuple[str, Dict[str, Any]]] = [
+                    (key, value.as_dict()) for key, value in self.funcs.items()
+                ]
+
+            for key, value in snapshot:
+                parts.append(f"\t{key}:")
+                parts.extend(f"\t{k}: {v}" for k, v in value.items())
+            # Joined once, trailing newline kept
+            parts.append("")
+            print("\n".join(parts))
         except Exception as e:
             LOGGER.error(f"Error '{e.__class__.__name__}' -> printing full function reports: {e}")
             raise CacheReporterUtilsError(
@@ -709,19 +900,15 @@ class CacheReporter:
         Prints the report for the cache reporter.
         """
         try:
-            string: str = "Cache Reporter:\n"
-            string += f"Total: {self.total}\n"
-            string += f"Hits: {self.hits}\n"
-            string += f"Misses: {self.misses}\n"
-            string += f"Hit Rate: {self.hit_rate:.2f}\n"
-            string += f"Miss Rate: {self.miss_rate:.2f}\n"
-            string += "Functions:\n"
-
-            with self.mutex:
-                for key, _ in self.funcs.items():
-                    string += f"\t{key}\n"
-
-            print(string)
+            parts: List[str] = self._report_header("Cache Reporter:")
+
+            # Copy under the lock, format outside of it
+            with self.mutex.read_lock():
+                names: List[str] = list(self.funcs)
+            parts.extend(f"\t{key}" for key in names)
+            # Joined once, trailing newline kept
+            parts.append("")
+            print("\n".join(parts))
         except Exception as e:
             LOGGER.error(f"Error '{e.__class__.__name__}' -> printing report: {e}")
             raise CacheReporterUtilsError(
@@ -743,6 +930,30 @@ class CacheReporter:
     # -------------
     # Helpers
 
+    def _report_header(self, title: str) -> List[str]:
+        """
+        _report_header
+        ==============
+        Builds the header lines shared by the printed reports.
+
+        Arguments:
+            title (str) :
+                The first line of the report.
+
+        Returns:
+            List[str] :
+                The header lines, without newlines.
+        """
+        return [
+            title,
+            f"Total: {self.total}",
+            f"Hits: {self.hits}",
+            f"Misses: {self.misses}",
+            f"Hit Rate: {self.hit_rate:.2f}",
+            f"Miss Rate: {self.miss_rate:.2f}",
+            "Functions:"
+        ]
+
     def _extract_name(self, func: str | Callable | partial) -> str:
         """
         _extract_name
@@ -759,9 +970,68 @@ class CacheReporter:
         """
         if isinstance(func, str):
             return func
-        elif isinstance(func, partial):
-            return func.func.__name__
-        elif callable(func):
-            return func.__name__
-        else:
-            raise TypeError("Function must be callable or partial.")
+        return _name_of(func)
+
+    def _shard(self) -> List[int]:
+        """
+        _shard
+        ======
+        Returns the shard of the calling thread, registering it on first use.
+
+        Note:
+        -------
+        - The shard is a padded list with the hits at `SHARD_HITS` and the misses at `SHARD_MISSES`.
+          The padding keeps the counters of different threads on different cache lines,
+          so writers on separate cores do not invalidate each other (false sharing).
+
+        Returns:
+            List[int] :
+                The shard of the calling thread.
+        """
+        shard: Optional[List[int]] = getattr(self._tls, "shard", None)
+        if shard is None:
+            shard = [0] * SHARD_SIZE
+            self._tls.shard = shard
+            with self.mutex:
+                self._shards.append(shard)
+        return shard
+
+    def _bump_hits(self) -> None:
+        """
+        _bump_hits
+        ==========
+        Increments the hits of the calling thread shard, skipping the validated `hits` setter.
+        """
+        try:
+            self._tls.shard[SHARD_HITS] += 1
+        except AttributeError:
+            # First event of this thread
+            self._shard()[SHARD_HITS] += 1
+
+    def _bump_misses(self) -> None:
+        """
+        _bump_misses
+        ============
+        Increments the misses of the calling thread shard, skipping the validated `misses` setter.
+        """
+        try:
+            self._tls.shard[SHARD_MISSES] += 1
+        except AttributeError:
+            # First event of this thread
+            self._shard()[SHARD_MISSES] += 1
+
+    def _shard_sum(self, index: int) -> int:
+        """
+        _shard_sum
+        ==========
+        Sums a counter over all thread shards.
+
+        Arguments:
+            index (int) :
+                `SHARD_HITS` or `SHARD_MISSES`.
+
+        Returns:
+            int :
+                The summed counter.
+        """
+        return sum(shard[index] for shard in self._shards)
@@ -0,0 +1,155 @@
+# -------------------------------------------------------------------------------------------------
+# Imports
+# -------------------------------------------------------------------------------------------------
+
+from contextlib import contextmanager
+from threading import Condition, Lock
+from typing import Iterator
+
+# -------------------------------------------------------------------------------------------------
+# CLasses
+# -------------------------------------------------------------------------------------------------
+
+
+class RWLock:
+    """
+    RWLock
+    ======
+    A reader/writer lock: any number of readers may hold it at once, writers hold it alone.
+
+    Notes:
+    -----
+        - Writers are preferred: once a writer waits, new readers queue behind it,
+          so a steady stream of readers cannot starve writers.
+        - Using the lock directly as a context manager (`with lock:`) takes the write side,
+          making it a drop-in replacement for `threading.Lock`.
+
+    Methods:
+    ---------
+        ### read_lock() :
+            Context manager holding the lock in shared (read) mode.
+        ### write_lock() :
+            Context manager holding the lock in exclusive (write) mode.
+    """
+
+    # -------------
+    # Slots
+
+    __slots__ = (
+        "_condition",
+        "_readers",
+        "_writer",
+        "_writers_waiting"
+    )
+
+    # -------------
+    # Attributes
+
+    _condition: Condition
+    _readers: int
+    _writer: bool
+    _writers_waiting: int
+
+    # -------------
+    # Constructor
+
+    def __init__(self) -> None:
+        """
+        __init__
+        ======
+        Constructor for the RWLock class.
+        """
+        self._condition = Condition(Lock())
+        self._readers = 0
+        self._writer = False
+        self._writers_waiting = 0
+
+    # -------------
+    # Magic Methods
+
+    def __enter__(self) -> "RWLock":
+        """
+        Acquires the write side of the lock.
+        """
+        self.acquire_write()
+        return self
+
+    def __exit__(self, *args) -> None:
+        """
+        Releases the write side of the lock.
+        """
+        self.release_write()
+
+    # -------------
+    # Methods
+
+    def acquire_read(self) -> None:
+        """
+        acquire_read
+        ============
+        Acquires the lock in shared mode.
+        """
+        with self._condition:
+            while self._writer or self._writers_waiting:
+                self._condition.wait()
+            self._readers += 1
+
+    def release_read(self) -> None:
+        """
+        release_read
+        ============
+        Releases the shared mode of the lock.
+        """
+        with self._condition:
+            self._readers -= 1
+            if self._readers == 0:
+                self._condition.notify_all()
+
+    def acquire_write(self) -> None:
+        """
+        acquire_write
+        =============
+        Acquires the lock in exclusive mode.
+        """
+        with self._condition:
+            self._writers_waiting += 1
+            while self._writer or self._readers:
+                self._condition.wait()
+            self._writers_waiting -= 1
+            self._writer = True
+
+    def release_write(self) -> None:
+        """
+        release_write
+        =============
+        Releases the exclusive mode of the lock.
+        """
+        with self._condition:
+            self._writer = False
+            self._condition.notify_all()
+
+    @contextmanager
+    def read_lock(self) -> Iterator[None]:
+        """
+        read_lock
+        =========
+        Context manager holding the lock in shared mode.
+        """
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write_lock(self) -> Iterator[None]:
+        """
+        write_lock
+        ==========
+        Context manager holding the lock in exclusive mode.
+        """
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
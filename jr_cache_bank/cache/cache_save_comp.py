@@ -2,19 +2,58 @@
 # Imports
 # -------------------------------------------------------------------------------------------------
 
-import gzip
+import io
 import json
+import os
 import yaml
 import zlib
 import logging
 import pickle
+import pickletools
 
-from collections import OrderedDict
-from typing import Any, Callable, Dict, Optional, Tuple
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from threading import local
+from typing import Any, Callable, Dict, Optional, Tuple, Union
 
 from jr_cache_bank.config.setup_logger import setup_logger
 from jr_cache_bank.cache.cache_enums import CacheType
 
+# Optional
+try:
+    # ISA-L deflate, SIMD accelerated and stream compatible with zlib
+    from isal import isal_zlib as fast_zlib
+except ImportError:
+    fast_zlib = None
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:
+    lz4_frame = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    # Native JSON encoder, emits utf-8 bytes directly
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # libyaml emitter, much faster than the pure Python one
+    from yaml import CSafeDumper as YamlDumper
+except ImportError:
+    from yaml import SafeDumper as YamlDumper
+
 # -------------------------------------------------------------------------------------------------
 # Logging
 # -------------------------------------------------------------------------------------------------
@@ -32,10 +71,267 @@ except Exception as e:
     LOGGER.addHandler(handler)
     LOGGER.error(f"Error setting up logger: {e}")
 
+# -------------------------------------------------------------------------------------------------
+# Constants
+# -------------------------------------------------------------------------------------------------
+
+# Protocol 5 (PEP 574) frames large bytes-like payloads and is the most compact available
+PICKLE_PROTOCOL: int = pickle.HIGHEST_PROTOCOL
+# Size of the chunks fed to the compressors while pickling
+STREAM_CHUNK_SIZE: int = 128 * 1024
+# zlib window bits producing a gzip container
+GZIP_WBITS: int = 31
+# Highest compression level supported by ISA-L
+FAST_ZLIB_MAX_LEVEL: int = 3
+# Compression level ranges of the optional codecs
+LZ4_MAX_LEVEL: int = 16
+ZSTD_MAX_LEVEL: int = 22
+# Pickles larger than this are compressed on several threads (gzip members / zstd workers)
+PARALLEL_COMPRESSION_CHUNK_SIZE: int = 4 * 1024 * 1024
+# Upper bound of worker threads used for compression
+PARALLEL_COMPRESSION_MAX_WORKERS: int = 8
+# Converters that cannot be removed from a ConvertersContainer
+DEFAULT_CONVERTERS: frozenset = frozenset({
+    CacheType.PICKLE, CacheType.ZLIB, CacheType.GZIP, CacheType.JSON, CacheType.YAML,
+    CacheType.LZ4, CacheType.ZSTD, CacheType.MSGPACK
+})
+# msgpack ext type holding the decimal digits of integers wider than 64 bits
+MSGPACK_BIG_INT_EXT: int = 1
+# What converters return, written to the file as is
+BytesLike = Union[bytes, bytearray, memoryview]
+
+# -------------------------------------------------------------------------------------------------
+# Helpers
+# -------------------------------------------------------------------------------------------------
+
+def _ordered_dict_representer(dumper: Any, data: OrderedDict) -> Any:
+    """
+    Custom representer for OrderedDict.
+    Converts OrderedDict to a regular dictionary for YAML serialization,
+    stringifying tuple keys on the way -> will be deserialized later.
+    """
+    return dumper.represent_dict(
+        (repr(key) if isinstance(key, tuple) else key, value) for key, value in data.items()
+    )
+
+def _keys_already_str(ord_dict: Dict[Any, Any]) -> bool:
+    """
+    Checks if the keys of a function's cache are already strings, sampling the first key.
+    """
+    return isinstance(next(iter(ord_dict), None), str)
+
+def _json_default(obj: Any) -> Any:
+    """
+    Custom serializer for non-serializable objects.
+    """
+    if isinstance(obj, tuple):
+        return {"__tuple__": list(obj)}  # Mark tuples for decoding
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def _msgpack_big_ints(obj: Any) -> Any:
+    """
+    Replaces the integers msgpack cannot pack, wider than 64 bits, with a `MSGPACK_BIG_INT_EXT` ext type.
+    Tuples become lists, as msgpack packs them anyway.
+    """
+    if type(obj) is int:
+        if -(1 << 63) <= obj < (1 << 64):
+            return obj
+        return msgpack.ExtType(MSGPACK_BIG_INT_EXT, str(obj).encode("ascii"))
+    if isinstance(obj, dict):
+        return {_msgpack_big_ints(key): _msgpack_big_ints(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_msgpack_big_ints(item) for item in obj]
+    return obj
+
+def _json_dumps(obj: Any) -> bytes:
+    """
+    Serializes an object to utf-8 JSON bytes, with `orjson` when installed.
+    Falls back to the stdlib for what `orjson` rejects, such as integers wider than 64 bits.
+    `orjson` also writes NaN and infinities as null, so any null output is redone by the stdlib,
+    which keeps them. None results are never cached, so this is rare.
+    """
+    if orjson is not None:
+        try:
+            data: bytes = orjson.dumps(obj, default=_json_default)
+        except orjson.JSONEncodeError:
+            pass
+        else:
+            if b"null" not in data:
+                return data
+    return json.dumps(obj, default=_json_default).encode("utf-8")
+
 # -------------------------------------------------------------------------------------------------
 # CLasses
 # -------------------------------------------------------------------------------------------------
 
+class _CacheBankDumper(YamlDumper):
+    """
+    _CacheBankDumper
+    ================
+    YAML dumper for cache banks, emitting OrderedDicts with their tuple keys stringified.
+    Subclassed so the representer is not registered on the shared PyYAML dumper.
+    """
+
+# Registered once, instead of on every yaml save
+_CacheBankDumper.add_representer(OrderedDict, _ordered_dict_representer)
+
+class _StreamingCompressor(io.RawIOBase):
+    """
+    _StreamingCompressor
+    ====================
+    A raw writer that compresses everything written to it.
+    Lets the pickler stream into the compressor, so the full pickle is never held in memory.
+
+    Attributes:
+        output (bytearray) :
+            The compressed data written so far.
+    """
+
+    def __init__(self, compressor: Any) -> None:
+        """
+        Initialize the _StreamingCompressor.
+
+        Args:
+            compressor (Any): A `zlib.compressobj` compressor.
+        """
+        super().__init__()
+        self._compressor = compressor
+        self.output: bytearray = bytearray()
+
+    def writable(self) -> bool:
+        """
+        The stream is always writable.
+        """
+        return True
+
+    def write(self, data: bytes) -> int:
+        """
+        Compresses a chunk of data.
+
+        Args:
+            data (bytes): The chunk to compress.
+
+        Returns:
+            out (int): The number of bytes consumed.
+        """
+        self.output += self._compressor.compress(data)
+        return len(data)
+
+    def finish(self) -> memoryview:
+        """
+        Flushes the compressor and returns the compressed data, without copying it.
+
+        Returns:
+            out (memoryview): The compressed data.
+        """
+        self.output += self._compressor.flush()
+        return memoryview(self.output)
+
+
+class _ParallelGzipCompressor(io.RawIOBase):
+    """
+    _ParallelGzipCompressor
+    =======================
+    A raw writer that compresses everything written to it as gzip, pigz style.
+    Data is cut into `PARALLEL_COMPRESSION_CHUNK_SIZE` blocks compressed as separate gzip members on a thread pool,
+    their concatenation is a regular multi-member gzip file.
+
+    Note:
+    -------
+    - Data smaller than one block is compressed inline as a single member, no thread pool is started.
+    - At most two blocks per worker are in flight, so memory stays bounded while pickling.
+
+    Attributes:
+        output (bytearray) :
+            The compressed data written so far.
+    """
+
+    def __init__(self, compressor_factory: Callable[[], Any]) -> None:
+        """
+        Initialize the _ParallelGzipCompressor.
+
+        Args:
+            compressor_factory (Callable[[], Any]): Creates a gzip `compressobj`, one is used per member.
+        """
+        super().__init__()
+        self._compressor_factory = compressor_factory
+        self._pending: bytearray = bytearray()
+        self._in_flight: deque[Future] = deque()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._max_in_flight: int = 0
+        self.output: bytearray = bytearray()
+
+    def writable(self) -> bool:
+        """
+        The stream is always writable.
+        """
+        return True
+
+    def write(self, data: bytes) -> int:
+        """
+        Buffers a chunk of data, submitting every full block for compression.
+
+        Args:
+            data (bytes): The chunk to compress.
+
+        Returns:
+            out (int): The number of bytes consumed.
+        """
+        self._pending += data
+        while len(self._pending) >= PARALLEL_COMPRESSION_CHUNK_SIZE:
+            block = bytes(self._pending[:PARALLEL_COMPRESSION_CHUNK_SIZE])
+            del self._pending[:PARALLEL_COMPRESSION_CHUNK_SIZE]
+            self._submit(block)
+        return len(data)
+
+    def finish(self) -> memoryview:
+        """
+        Compresses what is left and returns the compressed data, without copying it.
+
+        Returns:
+            out (memoryview): The compressed data.
+        """
+        if self._executor is None:
+            self.output += self._compress_member(bytes(self._pending))
+        else:
+            if self._pending:
+                self._submit(bytes(self._pending))
+            while self._in_flight:
+                self.output += self._in_flight.popleft().result()
+            self.close()
+        self._pending.clear()
+        return memoryview(self.output)
+
+    def close(self) -> None:
+        """
+        Shuts the thread pool down, if one was started.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+        super().close()
+
+    def _submit(self, block: bytes) -> None:
+        """
+        Submits a block for compression, collecting finished members in order.
+        """
+        if self._executor is None:
+            max_workers: int = min(PARALLEL_COMPRESSION_MAX_WORKERS, os.cpu_count() or 1)
+            self._executor = ThreadPoolExecutor(max_workers=max_workers)
+            self._max_in_flight = 2 * max_workers
+
+        self._in_flight.append(self._executor.submit(self._compress_member, block))
+        while len(self._in_flight) > self._max_in_flight:
+            self.output += self._in_flight.popleft().result()
+
+    def _compress_member(self, block: bytes) -> bytes:
+        """
+        Compresses a block as a complete gzip member, zlib and ISA-L release the GIL meanwhile.
+        """
+        compressor = self._compressor_factory()
+        return compressor.compress(block) + compressor.flush()
+
+
 class ConvertersContainer:
     """
     ConvertersContainer
@@ -47,6 +343,9 @@ class ConvertersContainer:
         converters (Dict[str, Callable]) :
             A dictionary of the different converters used in the cache bank.
             The keys are the names of the converters and the values are the converter functions.
+        optimize_pickle (bool) :
+            Runs `CacheType.PICKLE` output through `pickletools.optimize`, dropping unused memo opcodes.
+            Off by default: files get smaller, but saving is several times slower.
 
     Methods:
     -----------------
@@ -64,29 +363,44 @@ class ConvertersContainer:
         - CacheType.PICKLE : Converts the cache bank to a pickle object.
         - CacheType.ZLIB : Converts the cache bank to a zlib object.
         - CacheType.GZIP : Converts the cache bank to a gzip object.
+          (ZLIB and GZIP use ISA-L when the optional `isal` package is installed)
         - CacheType.JSON : Converts the cache bank to a json object.
         - CacheType.YAML : Converts the cache bank to a yaml object.
+        - CacheType.LZ4 : Converts the cache bank to a lz4 frame, requires `lz4`.
+        - CacheType.ZSTD : Converts the cache bank to a zstandard frame, requires `zstandard`.
+        - CacheType.MSGPACK : Converts the cache bank to a msgpack object, requires `msgpack`.
     """
 
     # ------------
     # Slots
 
     __slots__ = (
-        "_converters"
+        "_converters",
+        "_compressors",
+        "optimize_pickle"
     )
 
     # ------------
     # Attributes
 
     _converters: Dict[str, Callable]
+    _compressors: local
+    optimize_pickle: bool
 
     # ------------
     # Constructor
-    def __init__(self):
+    def __init__(self, optimize_pickle: bool = False):
         """
         Initialize the ConvertersContainer.
+
+        Arguments:
+            optimize_pickle (bool) :
+                Whether to optimize `CacheType.PICKLE` output, see the class attributes.
         """
         self._converters: Dict[str, Callable] = self._default_map_converters()
+        # Per-thread reusable compressors, they are not safe to share between threads
+        self._compressors: local = local()
+        self.optimize_pickle: bool = optimize_pickle
 
     # ------------
     # Magic Methods
@@ -98,7 +412,7 @@ class ConvertersContainer:
         Returns:
             out (str): The string representation of the ConvertersContainer.
         """
-        return f"ConvertersContainer({self.converters})"
+        return f"ConvertersContainer({self._converters})"
     
     def __len__(self) -> int:
         """
@@ -107,7 +421,7 @@ class ConvertersContainer:
         Returns:
             out (int): The number of converters in the container.
         """
-        return len(self.converters)
+        return len(self._converters)
 
     def __getitem__(self, name: str) -> Optional[Callable]:
         """
@@ -122,7 +436,7 @@ class ConvertersContainer:
         if not isinstance(name, str):
             raise TypeError("Name must be a string.")
         
-        return self.converters.get(name)
+        return self._converters.get(name)
     
     def __setitem__(self, name: str, converter: Callable):
         """
@@ -137,7 +451,7 @@ class ConvertersContainer:
         if not callable(converter):
             raise TypeError("Converter must be callable.")
         
-        self.converters[name] = converter
+        self._converters[name] = converter
     
     def __delitem__(self, name: str):
         """
@@ -149,8 +463,8 @@ class ConvertersContainer:
         if not isinstance(name, str):
             raise TypeError("Name must be a string.")
         
-        if name in self.converters:
-            del self.converters[name]
+        if name in self._converters:
+            del self._converters[name]
         else:
             raise KeyError(f"Converter '{name}' not found in ConvertersContainer.")
 
@@ -197,7 +511,7 @@ class ConvertersContainer:
             raise TypeError("Converter must be callable.")
         if not isinstance(name, str):
             raise TypeError("Name must be a string.")
-        self.converters[name] = converter
+        self._converters[name] = converter
 
     def get_converter(self, name: str) -> Optional[Callable]:
         """
@@ -212,7 +526,7 @@ class ConvertersContainer:
         if not isinstance(name, str):
             raise TypeError("Name must be a string.")
         
-        return self.converters.get(name)    
+        return self._converters.get(name)
     
     def remove_converter(self, name: str):
         """
@@ -224,19 +538,19 @@ class ConvertersContainer:
         if not isinstance(name, str):
             raise TypeError("Name must be a string.")
         
-        if name in [CacheType.PICKLE, CacheType.ZLIB, CacheType.GZIP]:
+        if name in DEFAULT_CONVERTERS:
             raise ValueError("Cannot remove default converters.")
         
-        if name in self.converters:
-            del self.converters[name]
+        if name in self._converters:
+            del self._converters[name]
 
     def clear_converters(self):
         """
         Clear all non-default converters from the container.
         """
-        for key, _ in self.converters.items():
-            if key not in [CacheType.PICKLE, CacheType.ZLIB, CacheType.GZIP, CacheType.JSON, CacheType.YAML]:
-                del self.converters[key]
+        # Collected first, the dict cannot change size while being iterated
+        for key in [key for key in self._converters if key not in DEFAULT_CONVERTERS]:
+            del self._converters[key]
 
         # Converters
 
@@ -250,7 +564,7 @@ class ConvertersContainer:
             out (list) :
                 The keys of the converters in the container.
         """
-        return list(self.converters.keys())
+        return list(self._converters.keys())
 
     # ------------
     # Helpers
@@ -264,6 +578,11 @@ class ConvertersContainer:
         ============================
         Converts the keys of the cache bank from tuples to strings.
 
+        Note:
+        -------
+        - Returns a new cache bank, the given one is left untouched.
+        - Functions whose keys are already strings are reused as they are, without a copy.
+
         Arguments:
             cache_bank([str, OrderedDict[Tuple, Any]]) :
                 The cache bank to convert.
@@ -272,13 +591,145 @@ class ConvertersContainer:
             out (OrderedDict[str, OrderedDict[str, Any]]) :
                 The converted cache bank.
         """
-        for func_name, ord_dict in cache_bank.items():
-            cache_bank[func_name] = OrderedDict()
-            for key, value in ord_dict.items():
-                str_key = str(key)  # Convert tuple key to string -> will be deserialized later
-                cache_bank[func_name][str_key] = value 
-                    
-        return cache_bank   
+        # Tuple keys are stringified -> will be deserialized later
+        # repr is what str gives for a tuple, without going through object.__str__ first
+        return OrderedDict(
+            (
+                func_name,
+                ord_dict if _keys_already_str(ord_dict)
+                else OrderedDict(zip(map(repr, ord_dict), ord_dict.values()))
+            )
+            for func_name, ord_dict in cache_bank.items()
+        )
+
+    def _pickle(self, cache_bank: OrderedDict) -> bytes:
+        """
+        _pickle
+        =======
+        Pickles the cache bank with `PICKLE_PROTOCOL`.
+
+        Arguments:
+            cache_bank (OrderedDict) :
+                The cache bank to pickle.
+
+        Returns:
+            out (bytes) :
+                The pickled data.
+        """
+        return pickle.dumps(cache_bank, protocol=PICKLE_PROTOCOL)
+
+    def _pickle_compressed(self, cache_bank: OrderedDict, compressor: Any) -> memoryview:
+        """
+        _pickle_compressed
+        ==================
+        Pickles the cache bank straight into a compressor, in `STREAM_CHUNK_SIZE` chunks.
+
+        Note:
+        -------
+        - Peak memory is the compressed output plus one chunk, instead of the full pickle plus its compressed copy.
+
+        Arguments:
+            cache_bank (OrderedDict) :
+                The cache bank to pickle.
+            compressor (Any) :
+                A compressor from `_compressobj`.
+
+        Returns:
+            out (memoryview) :
+                The compressed pickled data.
+        """
+        return self._pickle_to_sink(cache_bank, _StreamingCompressor(compressor))
+
+    def _pickle_to_sink(
+        self,
+        cache_bank: OrderedDict,
+        sink: Union[_StreamingCompressor, _ParallelGzipCompressor]
+    ) -> memoryview:
+        """
+        _pickle_to_sink
+        ===============
+        Pickles the cache bank into a compressing sink, in `STREAM_CHUNK_SIZE` chunks.
+
+        Arguments:
+            cache_bank (OrderedDict) :
+                The cache bank to pickle.
+            sink (_StreamingCompressor | _ParallelGzipCompressor) :
+                The sink compressing the pickle.
+
+        Returns:
+            out (memoryview) :
+                The compressed pickled data.
+        """
+        writer = io.BufferedWriter(sink, buffer_size=STREAM_CHUNK_SIZE)
+        try:
+            pickle.dump(cache_bank, writer, protocol=PICKLE_PROTOCOL)
+            writer.flush()
+            return sink.finish()
+        finally:
+            # Also closes the sink, stopping its thread pool if pickling failed
+            writer.close()
+
+    def _compressobj(self, level_compression: int, wbits: int = zlib.MAX_WBITS) -> Any:
+        """
+        _compressobj
+        ============
+        Creates a deflate compressor, backed by ISA-L when `isal` is installed.
+
+        Note:
+        -------
+        - ISA-L levels go from 0 to `FAST_ZLIB_MAX_LEVEL`, higher levels are clamped.
+        - Level 0 always uses the stdlib, as it means stored (uncompressed) blocks only there.
+
+        Arguments:
+            level_compression (int) :
+                The level of compression to use.
+            wbits (int) :
+                The window bits, `GZIP_WBITS` for a gzip container.
+
+        Returns:
+            out (Any) :
+                The compressor.
+        """
+        if fast_zlib is not None and level_compression > 0:
+            return fast_zlib.compressobj(
+                min(level_compression, FAST_ZLIB_MAX_LEVEL),
+                fast_zlib.DEFLATED,
+                wbits
+            )
+        return zlib.compressobj(level_compression, zlib.DEFLATED, wbits)
+
+    def _zstd_compressor(self, level_compression: int, threads: int = 0) -> Any:
+        """
+        _zstd_compressor
+        ================
+        Returns a zstandard compressor for the level, reused across calls of the same thread.
+
+        Note:
+        -------
+        - Building a `ZstdCompressor` allocates its context, reusing it is several times faster for small banks.
+        - zlib compressors are not pooled, `compressobj().copy()` measured slower than a fresh `compressobj()`.
+
+        Arguments:
+            level_compression (int) :
+                The level of compression to use.
+            threads (int) :
+                Worker threads of the compressor, 0 compresses on the calling thread.
+
+        Returns:
+            out (Any) :
+                The compressor.
+        """
+        pool: Optional[Dict[int, Any]] = getattr(self._compressors, "zstd", None)
+        if pool is None:
+            pool = self._compressors.zstd = {}
+
+        compressor = pool.get((level_compression, threads))
+        if compressor is None:
+            compressor = pool[(level_compression, threads)] = zstandard.ZstdCompressor(
+                level=level_compression,
+                threads=threads
+            )
+        return compressor
 
     # ------------
     # Converters
@@ -289,18 +740,25 @@ class ConvertersContainer:
         ============
         Converts the cache bank to a pickle object.
 
+        Note:
+        -------
+        - With `optimize_pickle`, the pickle is passed through `pickletools.optimize`.
+          It is not applied to the compressed types, where it barely changes the output size.
+
         Arguments:
             cache_bank (OrderedDict) :
                 The cache bank to convert.
         """
         try:
-            pickle_data: bytes = pickle.dumps(cache_bank)
+            pickle_data: bytes = self._pickle(cache_bank)
+            if self.optimize_pickle:
+                pickle_data = pickletools.optimize(pickle_data)
             return pickle_data
         except Exception as e:
-            LOGGER.error(f"Error making pickle: {e}")
+            LOGGER.error("Error making pickle: %s", e)
             raise e
     
-    def _make_zlib(self, cache_bank: OrderedDict, level_compression: int = 1) -> bytes:
+    def _make_zlib(self, cache_bank: OrderedDict, level_compression: int = 1) -> BytesLike:
         """
         _make_zlib
         ==========
@@ -320,22 +778,25 @@ class ConvertersContainer:
             if level_compression < 0 or level_compression > 9:
                 raise ValueError("Level of compression must be between 0 and 9.")
             
-            zlib_data: bytes = zlib.compress(pickle.dumps(cache_bank), level_compression)
-            # Check if data is bytes
-            if not isinstance(zlib_data, bytes):
-                raise TypeError("Compressed data must result in a bytes object.")
-            
-            return zlib_data
+            return self._pickle_compressed(
+                cache_bank,
+                self._compressobj(level_compression)
+            )
         except Exception as e:
-            LOGGER.error(f"Error making zlib: {e}")
+            LOGGER.error("Error making zlib: %s", e)
             raise e
 
-    def _make_gzip(self, cache_bank: OrderedDict, level_compression: int = 1) -> bytes:
+    def _make_gzip(self, cache_bank: OrderedDict, level_compression: int = 1) -> BytesLike:
         """
         _make_gzip
         ==========
         Converts the cache bank to a gzip object.
 
+        Note:
+        -------
+        - Pickles larger than `PARALLEL_COMPRESSION_CHUNK_SIZE` are compressed in parallel,
+          as a multi-member gzip file which any gzip reader decompresses as one.
+
         Arguments:
             cache_bank (OrderedDict) :
                 The cache bank to convert.
@@ -351,13 +812,76 @@ class ConvertersContainer:
                 raise ValueError("Level of compression must be between 0 and 9.")
             
             # Compress the data
-            gzip_data: bytes = gzip.compress(pickle.dumps(cache_bank), level_compression)
-            if not isinstance(gzip_data, bytes):
-                raise TypeError("Compressed data must result in a bytes object.")
-            
-            return gzip_data
+            return self._pickle_to_sink(
+                cache_bank,
+                _ParallelGzipCompressor(partial(self._compressobj, level_compression, GZIP_WBITS))
+            )
         except Exception as e:
-            LOGGER.error(f"Error making gzip: {e}")
+            LOGGER.error("Error making gzip: %s", e)
+            raise e
+
+    def _make_lz4(self, cache_bank: OrderedDict, level_compression: int = 1) -> bytes:
+        """
+        _make_lz4
+        =========
+        Converts the cache bank to a lz4 frame object.
+
+        Arguments:
+            cache_bank (OrderedDict) :
+                The cache bank to convert.
+            level_compression (int) :
+                The level of compression to use, from 0 to `LZ4_MAX_LEVEL`.
+                - Default is 1.
+        """
+        try:
+            if lz4_frame is None:
+                raise ImportError("CacheType.LZ4 requires the optional 'lz4' package.")
+            # Check level of compression
+            if not isinstance(level_compression, int):
+                raise TypeError("Level of compression must be an integer.")
+            if level_compression < 0 or level_compression > LZ4_MAX_LEVEL:
+                raise ValueError(f"Level of compression must be between 0 and {LZ4_MAX_LEVEL}.")
+
+            return lz4_frame.compress(self._pickle(cache_bank), compression_level=level_compression)
+        except Exception as e:
+            LOGGER.error("Error making lz4: %s", e)
+            raise e
+
+    def _make_zstd(self, cache_bank: OrderedDict, level_compression: int = 3) -> bytes:
+        """
+        _make_zstd
+        ==========
+        Converts the cache bank to a zstandard frame object.
+
+        Note:
+        -------
+        - Pickles larger than `PARALLEL_COMPRESSION_CHUNK_SIZE` are compressed by zstandard worker threads,
+          the output is still a single regular frame.
+
+        Arguments:
+            cache_bank (OrderedDict) :
+                The cache bank to convert.
+            level_compression (int) :
+                The level of compression to use, from 1 to `ZSTD_MAX_LEVEL`.
+                - Default is 3.
+        """
+        try:
+            if zstandard is None:
+                raise ImportError("CacheType.ZSTD requires the optional 'zstandard' package.")
+            # Check level of compression
+            if not isinstance(level_compression, int):
+                raise TypeError("Level of compression must be an integer.")
+            if level_compression < 1 or level_compression > ZSTD_MAX_LEVEL:
+                raise ValueError(f"Level of compression must be between 1 and {ZSTD_MAX_LEVEL}.")
+
+            pickle_data: bytes = self._pickle(cache_bank)
+            threads: int = 0
+            if len(pickle_data) > PARALLEL_COMPRESSION_CHUNK_SIZE:
+                threads = min(PARALLEL_COMPRESSION_MAX_WORKERS, os.cpu_count() or 1)
+
+            return self._zstd_compressor(level_compression, threads).compress(pickle_data)
+        except Exception as e:
+            LOGGER.error("Error making zstd: %s", e)
             raise e
 
     def _make_json(self, cache_bank: OrderedDict[str, OrderedDict[Tuple, Any]]) -> bytes:
@@ -374,28 +898,14 @@ class ConvertersContainer:
             out (bytes) :
                 The json data.
         """
-        def custom_serializer(obj):
-            """
-            Custom serializer for non-serializable objects.
-            """
-            if isinstance(obj, tuple):
-                return {"__tuple__": list(obj)}  # Mark tuples for decoding
-            raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
-        
         try:
             # Convert tuple keys to strings
             serializable_cache_bank = self._convert_tuple_key_to_string(cache_bank)
             
             # Serialize the cache_bank to JSON
-            json_data: str = json.dumps(serializable_cache_bank, default=custom_serializer)
-            byte_json_data: bytes = json_data.encode("utf-8")
-            
-            if not isinstance(byte_json_data, bytes):
-                raise TypeError("JSON data must result in a bytes object.")
-            
-            return byte_json_data
+            return _json_dumps(serializable_cache_bank)
         except Exception as e:
-            LOGGER.error(f"Error making json: {e}")
+            LOGGER.error("Error making json: %s", e)
             raise e
 
     def _make_yaml(self, cache_bank: OrderedDict) -> bytes:
@@ -412,33 +922,49 @@ class ConvertersContainer:
             out (bytes) :
                 The yaml data.
         """
-        def ordered_dict_representer(dumper, data):
-            """
-            Custom representer for OrderedDict.
-            Converts OrderedDict to a regular dictionary for YAML serialization.
-            """
-            return dumper.represent_dict(data.items())
-        
         try:
-            # Register the custom representer for OrderedDict
-            yaml.add_representer(OrderedDict, ordered_dict_representer, Dumper=yaml.SafeDumper)
-
-            # Convert tuple keys to strings
-            serializable_cache_bank = self._convert_tuple_key_to_string(cache_bank)
+            # Serialize the cache bank to YAML, tuple keys are stringified by the dumper
+            byte_yaml_data: bytes = yaml.dump(cache_bank, Dumper=_CacheBankDumper, encoding="utf-8")
 
-            # Serialize the cache bank to YAML
-            yaml_data: str = yaml.dump(serializable_cache_bank, Dumper=yaml.SafeDumper)
-
-            byte_yaml_data: bytes = yaml_data.encode("utf-8")
-
-            if not isinstance(byte_yaml_data, bytes):
-                raise TypeError("YAML data must result in a bytes object.")
             if not byte_yaml_data:
                 raise ValueError("YAML data must not be empty.")
             
             return byte_yaml_data
         except Exception as e:
-            LOGGER.error(f"Error making yaml: {e}")
+            LOGGER.error("Error making yaml: %s", e)
+            raise e
+
+    def _make_msgpack(self, cache_bank: OrderedDict[str, OrderedDict[Tuple, Any]]) -> bytes:
+        """
+        _make_msgpack
+        =============
+        Converts the cache bank to a msgpack object.
+
+        Note:
+        -------
+        - Keys are stringified like for json, msgpack maps keep the order of the functions and entries.
+        - Integers wider than 64 bits are packed as a `MSGPACK_BIG_INT_EXT` ext type.
+          The bank is only walked for them when packing overflows.
+
+        Arguments:
+            cache_bank (OrderedDict) :
+                The cache bank to convert.
+
+        Returns:
+            out (bytes) :
+                The msgpack data.
+        """
+        try:
+            if msgpack is None:
+                raise ImportError("CacheType.MSGPACK requires the optional 'msgpack' package.")
+
+            data: OrderedDict[str, OrderedDict[str, Any]] = self._convert_tuple_key_to_string(cache_bank)
+            try:
+                return msgpack.packb(data, use_bin_type=True)
+            except OverflowError:
+                return msgpack.packb(_msgpack_big_ints(data), use_bin_type=True)
+        except Exception as e:
+            LOGGER.error("Error making msgpack: %s", e)
             raise e
 
     def _default_map_converters(self) -> Dict[str, Callable]:
@@ -455,7 +981,10 @@ class ConvertersContainer:
             CacheType.ZLIB: self._make_zlib,
             CacheType.GZIP: self._make_gzip,
             CacheType.JSON: self._make_json,
-            CacheType.YAML: self._make_yaml
+            CacheType.YAML: self._make_yaml,
+            CacheType.LZ4: self._make_lz4,
+            CacheType.ZSTD: self._make_zstd,
+            CacheType.MSGPACK: self._make_msgpack
         }
         ```
         """
@@ -464,6 +993,9 @@ class ConvertersContainer:
             CacheType.ZLIB: self._make_zlib,
             CacheType.GZIP: self._make_gzip,
             CacheType.JSON: self._make_json,
-            CacheType.YAML: self._make_yaml
+            CacheType.YAML: self._make_yaml,
+            CacheType.LZ4: self._make_lz4,
+            CacheType.ZSTD: self._make_zstd,
+            CacheType.MSGPACK: self._make_msgpack
         }
 
@@ -6,6 +6,7 @@ import logging.config
 import logging
 import yaml
 
+from functools import lru_cache
 from pathlib import Path
 
 # ------------------------------------------------------
@@ -30,6 +31,7 @@ class LoggerSetupError(Exception):
 # ------------------------------------------------------
 
 
+@lru_cache(maxsize=None)
 def setup_logger(
     path: Path = YAML_FILE_PATH,
     name: str = "default_logger",
@@ -40,6 +42,11 @@ def setup_logger(
     The logger configuration is loaded from a YAML file.
     The YAML file should be located in the same directory as this script.
 
+    Notes
+    -----------
+        - Results are cached per (path, name, level): the YAML file is read, parsed and
+          applied only on the first call, later calls return the same logger.
+
     Arguments
     -----------
         path (Path) : Path to the YAML file containing the logger configuration.
@@ -1,55 +1,55 @@
 class CacheBankException(Exception):
     """Base class for all exceptions related to the Cache Bank."""
-    pass
+    __slots__ = ()
 
 class CacheBankConstructionError(CacheBankException):
     """Raised when there is an error in constructing the Cache Bank."""
-    pass
+    __slots__ = ()
 
 class CacheBankGetError(CacheBankException):
     """Raised when there is an error in getting data from the Cache Bank."""
-    pass
+    __slots__ = ()
 
 class CacheBankSetError(CacheBankException):
     """Raised when there is an error in setting data in the Cache Bank."""
-    pass
+    __slots__ = ()
 
 class CacheBankMagicMethodError(CacheBankException):
     """Raised when there is an error related to the magic methods in the Cache Bank."""
-    pass
+    __slots__ = ()
 
 class CacheBankUtilsError(CacheBankException):
     """Raised when there is an error in the utility functions of the Cache Bank."""
-    pass
+    __slots__ = ()
 
 class CacheBankMakeHashableError(CacheBankException):
     """Raised when there is an error in making an object hashable for the Cache Bank."""
-    pass
+    __slots__ = ()
 
 class CacheBankSaveError(CacheBankException):
     """Raised when there is an error in saving data to the Cache Bank."""
-    pass
+    __slots__ = ()
 
 class CacheBankLoadError(CacheBankException):
     """Raised when there is an error in loading data from the Cache Bank."""
-    pass
+    __slots__ = ()
 
 class CacheBankRemoveError(CacheBankException):
     """Raised when there is an error in removing data from the Cache Bank."""
-    pass
+    __slots__ = ()
 
 class CacheBankWrapperError(CacheBankException):
     """Raised when there is an error in the Cache Bank wrapper."""
-    pass
+    __slots__ = ()
 
 class CacheBankConfigError(CacheBankException):
     """Raised when there is an error in the configuration of the Cache Bank."""
-    pass
+    __slots__ = ()
 
 class CacheBankAsyncSaveError(CacheBankException):
     """Raised when there is an error in asynchronously saving data to the Cache Bank."""
-    pass
+    __slots__ = ()
 
 class CacheBankAsyncLoadError(CacheBankException):
     """Raised when there is an error in asynchronously loading data from the Cache Bank."""
-    pass
\ No newline at end of file
+    __slots__ = ()
\ No newline at end of file
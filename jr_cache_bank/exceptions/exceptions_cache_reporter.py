@@ -1,35 +1,35 @@
 class CacheReporterException(Exception):
     """Base class for exceptions in this module."""
-    pass
+    __slots__ = ()
 
 class CacheReporterConstructionError(CacheReporterException):
     """Exception raised for errors in the construction of the cache reporter."""
-    pass
+    __slots__ = ()
 
 class CacheReporterPropertyError(CacheReporterException):
     """Exception raised for errors in getting data from the cache."""
-    pass
+    __slots__ = ()
 
 class CacheReporterMagicMethodError(CacheReporterException):
     """Exception raised for errors in the magic methods of the cache reporter."""
-    pass
+    __slots__ = ()
 
 class CacheReporterAddFunctionError(CacheReporterException):
     """Exception raised for errors in the add function of the cache reporter."""
-    pass
+    __slots__ = ()
 
 class CacheReporterDellFunctionError(CacheReporterException):
     """Exception raised for errors in the delete function of the cache reporter."""
-    pass
+    __slots__ = ()
 
 class CacheReporterGetFunctionError(CacheReporterException):
     """Exception raised for errors in the get function of the cache reporter."""
-    pass
+    __slots__ = ()
 
 class CacheReporterSetFunctionError(CacheReporterException):
     """Exception raised for errors in the set function of the cache reporter."""
-    pass
+    __slots__ = ()
 
 class CacheReporterUtilsError(CacheReporterException):
     """Exception raised for errors in the utils of the cache reporter."""
-    pass
+    __slots__ = ()
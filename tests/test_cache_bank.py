@@ -3,22 +3,29 @@
 # -------------------------------------------------------------------------------------------------
 
 from pathlib import Path
-import pytest
+import gc
+import math
 import sys
-import os
-import json
+import weakref
+import pytest
 
-from typing import Callable, Final
+from typing import Any, Callable, Final, List, Mapping
+from types import MappingProxyType
+from importlib.util import find_spec
 from collections import OrderedDict
+from enum import Enum
 # Local imports
 from jr_cache_bank.cache.cache_bank import CacheBank, CacheType
 from jr_cache_bank.cache.cache_enums import CacheSize
+from jr_cache_bank.cache import cache_save_comp
+from jr_cache_bank.cache.cache_load_comp import DEFAULT_LOADERS, LoadersContainer
 from jr_cache_bank.exceptions.exceptions_cache_bank import (
     CacheBankConstructionError,
     CacheBankSetError,
     CacheBankMakeHashableError,
     CacheBankSaveError,
     CacheBankLoadError,
+    CacheBankUtilsError,
 )
 
 # -------------------------------------------------------------------------------------------------
@@ -48,6 +55,13 @@ def cached_square(cache_bank) -> Callable:
         return x * x
     return square
 
+@pytest.fixture
+def warmed_square(cached_square) -> Callable:
+    """Fixture to create a cached square function, already called for 0 to 4."""
+    for i in range(5):
+        cached_square(i)
+    return cached_square
+
 @pytest.fixture
 def uncached_cube() -> Callable:
     """Fixture to create a function that cubes a number without caching."""
@@ -63,113 +77,88 @@ def cached_cube(cache_bank) -> Callable:
         return x * x * x
     return cube
 
-@pytest.fixture
-def config_dict() -> dict:
-    """Fixture to create a configuration dictionary for testing."""
-    return {
-        "max_bank_size": 100,
-        "lru": True,
-        "max_file_size": 100000,
-        "cache_type": CacheType.PICKLE,
-        "cache_bank": OrderedDict({}),
-        "filename": "my_cache.pkl",
-        "max_total_memory_size": CacheSize.E_10MB,
-        "max_func_memory_size": CacheSize.E_10KB,
-    }
+@pytest.fixture(scope="module")
+def save_dir(tmp_path_factory) -> Path:
+    """Fixture to create one directory shared by the save tests of the module."""
+    return tmp_path_factory.mktemp("cache_saves")
 
 
 # -------------------------------------------------------------------------------------------------
 # Test Cases
 # -------------------------------------------------------------------------------------------------
 
-INT_MAX_BANK_SIZE_ERRORS: Final = [
-    # max_bank_size (int), lru (bool), max_file_size (int), cache_type (CacheType), cache_bank (dict), filename (str |Path)
-    ("",True, 1000, CacheType.PICKLE),
-    (0,True, 1000, CacheType.PICKLE),
-    (-1,True, 1000, CacheType.PICKLE),
-    ([],True, 1000, CacheType.PICKLE),
-    ({},True, 1000, CacheType.PICKLE),
-    ((),True, 1000, CacheType.PICKLE),
-]
-
-INIT_LRU_ERRORS: Final = [
-    # max_bank_size (int), lru (bool), max_file_size (int), cache_type (CacheType), cache_bank (dict), filename (str |Path)
-    (100,100, 1000, CacheType.PICKLE),
-    (100,"100", 1000, CacheType.PICKLE),
-    (100,[], 1000, CacheType.PICKLE),
-    (100,{}, 1000, CacheType.PICKLE),
-    (100,(), 1000, CacheType.PICKLE),
-]
-
-INIT_MAX_FILE_SIZE_ERRORS: Final = [
-    # max_bank_size (int), lru (bool), max_file_size (int), cache_type (CacheType), cache_bank (dict), filename (str |Path)
-    (100,True, "", CacheType.PICKLE),
-    (100,True, 0, CacheType.PICKLE),
-    (100,True, -1, CacheType.PICKLE),
-    (100,True, [], CacheType.PICKLE),
-    (100,True, {}, CacheType.PICKLE),
-    (100,True, (), CacheType.PICKLE)
-]
-
-INIT_CACHE_TYPE_ERRORS: Final = [
-    # max_bank_size (int), lru (bool), max_file_size (int), cache_type (CacheType), cache_bank (dict), filename (str |Path)
-    (100,True, 1000, 100),
-    (100,True, 1000, ""),
-    (100,True, 1000, []),
-    (100,True, 1000, {}),
-    (100,True, 1000, ())
-]
-
-INIT_CACHE_BANK_ERRORS: Final = [
-    # max_bank_size (int), lru (bool), max_file_size (int), cache_type (CacheType), cache_bank (dict), filename (str |Path)
-    (100,True, 1000, CacheType.PICKLE, 100),
-    (100,True, 1000, CacheType.PICKLE, ""),
-    (100,True, 1000, CacheType.PICKLE, []),
-    (100,True, 1000, CacheType.PICKLE, 5.5),
-    (100,True, 1000, CacheType.PICKLE, ())
-]
-
-INIT_FILENAME_ERRORS: Final = [
+CONFIG_DICT: Final[Mapping[str, Any]] = MappingProxyType({
+    "max_bank_size": 100,
+    "lru": True,
+    "max_file_size": 100000,
+    "cache_type": CacheType.PICKLE,
+    "cache_bank": OrderedDict({}),
+    "filename": "my_cache.pkl",
+    "max_total_memory_size": CacheSize.E_10MB,
+    "max_func_memory_size": CacheSize.E_10KB,
+})
+
+INIT_VALID_KWARGS: Final = {
+    "max_bank_size": 100,
+    "lru": True,
+    "max_file_size": 1000,
+    "cache_type": CacheType.PICKLE,
+}
+
+INIT_ERRORS: Final = (
+    # field (str), invalid value (Any) -> replaces the field in INIT_VALID_KWARGS
+    *[("max_bank_size", value) for value in ("", 0, -1, [], {}, ())],
+    *[("lru", value) for value in (100, "100", [], {}, ())],
+    *[("max_file_size", value) for value in ("", 0, -1, [], {}, ())],
+    *[("cache_type", value) for value in (100, "", [], {}, ())],
+    *[("cache_bank", value) for value in (100, "", [], 5.5, ())],
+    *[("max_total_memory_size", value) for value in (-1, {}, [], (), 0, "100")],
+    *[("max_func_memory_size", value) for value in (-1, {}, [], (), 0, "100")],
+    *[("min_cost_ns", value) for value in (-1, 5.5, True, "100")],
+)
+
+INIT_FILENAME_ERRORS: Final = (
     # max_bank_size (int), lru (bool), max_file_size (int), cache_type (CacheType), cache_bank (dict), filename (str |Path)
     (100,True, 1000, CacheType.PICKLE, OrderedDict({}), 100),
     (100,True, 1000, CacheType.PICKLE, OrderedDict({}), ""),
     (100,True, 1000, CacheType.PICKLE, OrderedDict({}), []),
     (100,True, 1000, CacheType.PICKLE, OrderedDict({}), {}),
     (100,True, 1000, CacheType.PICKLE, OrderedDict({}), ()),
-    (100,True, 1000, CacheType.PICKLE, OrderedDict({}), 5.5)
-]
-
-INIT_MAX_TOTAL_MEMORY_ERRORS: Final = [
-    # max_total_memory
-    -1, {}, [], (), 0, "100"
-]
-
-INIT_MAX_FUNC_MEMORY_SIZE_ERRORS: Final = [
-    # max_func_memory_size
-    -1, {}, [], (), 0, "100"
-]
-
-SETTER_MAX_BANK_SIZE_ERRORS: Final = [-1, {}, [], (), "-1"]
-
-SETTER_LRU_ERRORS: Final = [100, {}, [], (), "100"]
-
-SETTER_MAX_FILE_SIZE_ERRORS: Final = [-1, {}, [], (), "100"]
-
-SETTER_CACHE_TYPE_ERRORS: Final = [100, {}, [], (), 0]
-
-SETTER_CACHE_BANK_ERRORS: Final = [100, True, [], (), 0]
+    (100,True, 1000, CacheType.PICKLE, OrderedDict({}), 5.5),
+)
 
-SETTER_FILENAME_ERRORS: Final = [100, True, {}, [], 0, ""]
+SETTER_ERRORS: Final = (
+    # field (str), invalid value (Any)
+    *[("max_bank_size", value) for value in (-1, {}, [], (), "-1")],
+    *[("lru", value) for value in (100, {}, [], (), "100")],
+    *[("max_file_size", value) for value in (-1, {}, [], (), "100")],
+    *[("cache_type", value) for value in (100, {}, [], (), 0)],
+    *[("cache_bank", value) for value in (100, True, [], (), 0)],
+    *[("filename", value) for value in (100, True, {}, [], 0, "")],
+    *[("min_cost_ns", value) for value in (-1, 5.5, True, "100")],
+)
 
-SAVE_CACHE_TYPES_VARS: Final = [
+SAVE_CACHE_TYPES_VARS: Final = (
     (CacheType.PICKLE, ".pkl"), 
     (CacheType.GZIP,  ".gz"),
     (CacheType.ZLIB, ".zlib"),
     (CacheType.JSON, ".json"),
-    (CacheType.YAML, ".yaml")
-]
+    (CacheType.YAML, ".yaml"),
+    pytest.param(
+        CacheType.LZ4, ".lz4",
+        marks=pytest.mark.skipif(find_spec("lz4") is None, reason="lz4 is not installed")
+    ),
+    pytest.param(
+        CacheType.ZSTD, ".zst",
+        marks=pytest.mark.skipif(find_spec("zstandard") is None, reason="zstandard is not installed")
+    ),
+    pytest.param(
+        CacheType.MSGPACK, ".mpk",
+        marks=pytest.mark.skipif(find_spec("msgpack") is None, reason="msgpack is not installed")
+    ),
+)
 
-MAKE_HASHABLE_ERRORS: Final = [
+MAKE_HASHABLE_ERRORS: Final = (
     # function (Callable), args (tuple), kwargs (dict)
     (None, None, None),
     ("", None, None),
@@ -179,8 +168,16 @@ MAKE_HASHABLE_ERRORS: Final = [
     (1, None, None),
     (1.0, None, None),
     (True, None, None),
-    (False, None, None)
-]
+    (False, None, None),
+)
+
+def _param_id(value: Any) -> str:
+    """Short test id: the repr of scalars, the member name of enums and the type name of anything else."""
+    if isinstance(value, Enum):
+        return value.name
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return repr(value)
+    return type(value).__name__
 
 # -------------------------------------------------------------------------------------------------
 # Edge Tests
@@ -197,64 +194,21 @@ def test_cache_bank_init(cache_bank):
     assert cache_bank.cache_type == CacheType.PICKLE
 
 @pytest.mark.parametrize(
-    "max_bank_size, lru, max_file_size, cache_type",
-    INIT_MAX_FILE_SIZE_ERRORS
+    "field, value",
+    INIT_ERRORS,
+    ids=_param_id
 )
-def test_init_max_file_size_errors(max_bank_size, lru, max_file_size, cache_type):
-    """Test the initialization of the CacheBank class with invalid max_file_size."""
+def test_init_errors(field, value):
+    """Test the initialization of the CacheBank class with an invalid argument."""
     with pytest.raises(CacheBankConstructionError):
-        CacheBank(max_bank_size=max_bank_size, lru=lru, max_file_size=max_file_size, cache_type=cache_type)
-
-@pytest.mark.parametrize(
-    "max_bank_size, lru, max_file_size, cache_type",
-    INIT_LRU_ERRORS
-)
-def test_init_lru_errors(max_bank_size, lru, max_file_size, cache_type):
-    """Test the initialization of the CacheBank class with invalid lru."""
-    with pytest.raises(CacheBankConstructionError):
-        CacheBank(max_bank_size=max_bank_size, lru=lru, max_file_size=max_file_size, cache_type=cache_type)
-
-@pytest.mark.parametrize(
-    "max_bank_size, lru, max_file_size, cache_type",
-    INIT_CACHE_TYPE_ERRORS
-)
-def test_init_cache_type_errors(max_bank_size, lru, max_file_size, cache_type):
-    """Test the initialization of the CacheBank class with invalid cache_type."""
-    with pytest.raises(CacheBankConstructionError):
-        CacheBank(max_bank_size=max_bank_size, lru=lru, max_file_size=max_file_size, cache_type=cache_type)
-
-@pytest.mark.parametrize(
-    "max_bank_size, lru, max_file_size, cache_type, var_cache_bank",
-    INIT_CACHE_BANK_ERRORS
-)
-def test_init_cache_bank_errors(max_bank_size, lru, max_file_size, cache_type, var_cache_bank):
-    """Test the initialization of the CacheBank class with invalid cache_bank."""
-    with pytest.raises(CacheBankConstructionError):
-        CacheBank(max_bank_size=max_bank_size, lru=lru, max_file_size=max_file_size, cache_type=cache_type, cache_bank=var_cache_bank)
-
-@pytest.mark.parametrize(
-    "max_total_memory_size",
-    INIT_MAX_TOTAL_MEMORY_ERRORS
-)
-def test_init_max_total_memory_errors(max_total_memory_size):
-    """Test the initialization of the CacheBank class with invalid max_total_memory_size."""
-    with pytest.raises(CacheBankConstructionError):
-        CacheBank(max_total_memory_size=max_total_memory_size)
-
-@pytest.mark.parametrize(
-    "max_func_memory_size",
-    INIT_MAX_FUNC_MEMORY_SIZE_ERRORS
-)
-def test_init_max_func_memory_size_errors(max_func_memory_size):
-    """Test the initialization of the CacheBank class with invalid max_func_memory_size."""
-    with pytest.raises(CacheBankConstructionError):
-        CacheBank(max_func_memory_size=max_func_memory_size)
+        CacheBank(**{**INIT_VALID_KWARGS, field: value})
 
 # Filename Tests
 
 @pytest.mark.parametrize(
     "filename",
-    INIT_FILENAME_ERRORS
+    INIT_FILENAME_ERRORS,
+    ids=_param_id
 )
 def test_save_filename_errors(cache_bank, filename):
     """Test the save method of the CacheBank class with invalid filename."""
@@ -263,7 +217,8 @@ def test_save_filename_errors(cache_bank, filename):
 
 @pytest.mark.parametrize(
     "filename",
-    INIT_FILENAME_ERRORS
+    INIT_FILENAME_ERRORS,
+    ids=_param_id
 )
 def test_load_filename_errors(cache_bank, filename):
     """Test the load method of the CacheBank class with invalid filename."""
@@ -274,77 +229,42 @@ def test_load_filename_errors(cache_bank, filename):
 
 @pytest.mark.parametrize(
     "function, args, kwargs",
-    MAKE_HASHABLE_ERRORS
+    MAKE_HASHABLE_ERRORS,
+    ids=_param_id
 )
 def test_make_hashable_errors(cache_bank, function, args, kwargs):
     """Test the make_hashable method of the CacheBank class with invalid inputs."""
     with pytest.raises(CacheBankMakeHashableError):
         cache_bank.make_hashable(function, args, kwargs)
 
-# Setters Tests
-
-@pytest.mark.parametrize(
-    "max_bank_size",
-    SETTER_MAX_BANK_SIZE_ERRORS
-)
-def test_setter_max_bank_size_errors(cache_bank, max_bank_size):
-    """Test the setter for max_bank_size with invalid values."""
-    with pytest.raises(CacheBankSetError):
-        cache_bank.max_bank_size = max_bank_size
-
-@pytest.mark.parametrize(
-    "lru",
-    SETTER_LRU_ERRORS
-)
-def test_setter_lru_errors(cache_bank, lru):
-    """Test the setter for lru with invalid values."""
-    with pytest.raises(CacheBankSetError):
-        cache_bank.lru = lru
+def test_make_hashable_args(cache_bank, uncached_square):
+    """Test that scalar arguments are kept and container arguments are normalized."""
+    assert cache_bank.make_hashable(uncached_square, (1, "a", None)) == ("square", (1, "a", None))
+    assert cache_bank.make_hashable(uncached_square, [1, [2, 3], {"b": 2, "a": 1}]) == (
+        "square", (1, (2, 3), (("a", 1), ("b", 2)))
+    )
 
-@pytest.mark.parametrize(
-    "max_file_size",
-    SETTER_MAX_FILE_SIZE_ERRORS
-)
-def test_setter_max_file_size_errors(cache_bank, max_file_size):
-    """Test the setter for max_file_size with invalid values."""
-    with pytest.raises(CacheBankSetError):
-        cache_bank.max_file_size = max_file_size
-
-@pytest.mark.parametrize(
-    "cache_type",
-    SETTER_CACHE_TYPE_ERRORS
-)
-def test_setter_cache_type_errors(cache_bank, cache_type):
-    """Test the setter for cache_type with invalid values."""
-    with pytest.raises(CacheBankSetError):
-        cache_bank.cache_type = cache_type
-
-@pytest.mark.parametrize(
-    "var_cache_bank",
-    SETTER_CACHE_BANK_ERRORS
-)
-def test_setter_cache_bank_errors(cache_bank, var_cache_bank):
-    """Test the setter for cache_bank with invalid values."""
-    with pytest.raises(CacheBankSetError):
-        cache_bank.cache_bank = cache_bank
+# Setters Tests
 
 @pytest.mark.parametrize(
-    "filename",
-    SETTER_FILENAME_ERRORS
+    "field, value",
+    SETTER_ERRORS,
+    ids=_param_id
 )
-def test_setter_filename_errors(cache_bank, filename):
-    """Test the setter for filename with invalid values."""
+def test_setter_errors(cache_bank, field, value):
+    """Test the setters of the CacheBank class with invalid values."""
     with pytest.raises(CacheBankSetError):
-        cache_bank.filename = filename
+        setattr(cache_bank, field, value)
 
 @pytest.mark.parametrize(
     "filename",
-    INIT_FILENAME_ERRORS
+    [case[-1] for case in INIT_FILENAME_ERRORS],
+    ids=_param_id
 )
 def test_file_validator(cache_bank, filename):
-    """Test the file validator method of the CacheBank class with invalid filename."""
-    with pytest.raises(Exception):
-        cache_bank.file_validator(filename)
+    """Test the file checker of the CacheBank class with invalid filename."""
+    with pytest.raises((TypeError, ValueError)):
+        cache_bank._file_checker(filename)
 
 
 # -------------------------------------------------------------------------------------------------
@@ -354,30 +274,99 @@ def test_file_validator(cache_bank, filename):
 def test_cache_function(cache_bank, uncached_square):
     """Test the cache decorator."""
 
-    for i in range(5):
-        result:int = uncached_square(i)
-        cache_bank.set(uncached_square, args=(i,), kwargs={}, result=result)
+    results: List[int] = [uncached_square(i) for i in range(5)]
+    cache_bank.set_many(uncached_square, range(5), results)
 
-    for i in range(5):
-        result: int = uncached_square(i)
-        cached_result:int = cache_bank.get(uncached_square, args=(i,), kwargs={})
-        assert result == cached_result
+    assert cache_bank.get_many(uncached_square, range(5)) == results
+    assert cache_bank.get_many(uncached_square, range(5, 7)) == [None, None]
+    # Batched keys match the single-call ones
+    assert cache_bank.get(uncached_square, args=(3,)) == results[3]
     
     # Clear the cache bank
     cache_bank.clear()
     # Reset the cache bank to default values
     cache_bank.reset_default()
     
+def test_bulk_call(cache_bank, cached_square):
+    """Test the batched call through the cache bank."""
+    cached_square(2)
+
+    assert cache_bank.bulk_call(cached_square, range(5)) == [i * i for i in range(5)]
+    assert cache_bank.cached_reporter.hits == 1
+    assert len(cache_bank.cache_bank["square"]) == 5
+
+    # Every result is cached now
+    assert cached_square.bulk_call(range(5)) == [i * i for i in range(5)]
+    assert cache_bank.cached_reporter.hits == 6
+
+    # Repeated misses are computed once, None results are returned but not cached
+    calls: List[int] = []
+    def maybe_square(x: int) -> int | None:
+        calls.append(x)
+        return x * x if x else None
+
+    assert cache_bank.bulk_call(maybe_square, [3, 3, 0, 0, 3]) == [9, 9, None, None, 9]
+    assert calls == [3, 0]
+    assert list(cache_bank.cache_bank["maybe_square"].values()) == [9]
+
+    # Calls cheaper than min_cost_ns are not cached, as in the wrappers
+    cache_bank.min_cost_ns = 10 ** 12
+    assert cache_bank.bulk_call(maybe_square, [4, 4]) == [16, 16]
+    assert calls == [3, 0, 4]
+    assert cache_bank.get(maybe_square, args=(4,)) is None
+
+    # Clear the cache bank
+    cache_bank.clear()
+    # Reset the cache bank to default values
+    cache_bank.reset_default()
+
+def test_cache_wrapper_fast_path(cache_bank):
+    """Test that the fast path wrapper shares entries and stats with the generic one."""
+    @cache_bank.wrapper(fast_path=True)
+    def square(x):
+        return x * x
+
+    assert [square(i) for i in range(5)] == [i * i for i in range(5)]
+    assert [square(i) for i in range(5)] == [i * i for i in range(5)]
+    assert cache_bank.cached_reporter.hits == 5
+    assert cache_bank.get(square, args=(3,)) == 9
+
+    # Container arguments take the generic path
+    @cache_bank.wrapper(fast_path=True)
+    def total(values):
+        return sum(values)
+
+    assert total([1, 2, 3]) == 6
+    assert total([1, 2, 3]) == 6
+    assert cache_bank.get(total, args=([1, 2, 3],)) == 6
+
+    # Reset the cache bank to default values
+    cache_bank.reset_default()
+
+def test_cache_wrapper_min_cost(cache_bank, uncached_square):
+    """Test that calls cheaper than min_cost_ns are not cached."""
+    cache_bank.min_cost_ns = 10 ** 12
+    cached_square = cache_bank.wrapper()(uncached_square)
+    fast_square = cache_bank.wrapper(fast_path=True)(uncached_square)
+
+    assert [cached_square(i) for i in range(5)] == [fast_square(i) for i in range(5)]
+    assert "square" not in cache_bank.cache_bank
+
+    cache_bank.min_cost_ns = 0
+    cached_square(2)
+    assert cache_bank.get(uncached_square, args=(2,)) == 4
+
+    # Reset the cache bank to default values
+    cache_bank.reset_default()
+
 def test_cache_function_with_kwargs(cache_bank, uncached_square):
     """Test the cache decorator with keyword arguments."""
+    keys = [cache_bank.make_hashable(uncached_square, kwargs={"x": i}) for i in range(5)]
     for i in range(5):
-        result:int = uncached_square(i)
-        cache_bank.set(uncached_square, kwargs={"x": i}, result=result)
+        cache_bank.set(uncached_square, kwargs={"x": i}, result=uncached_square(i))
 
-    for i in range(5):
-        result: int = uncached_square(i)
-        cached_result:int = cache_bank.get(uncached_square, kwargs={"x": i})
-        assert result == cached_result
+    assert cache_bank.get(uncached_square, kwargs={"x": 3}) == 9
+    assert cache_bank.cache_bank[keys[0][0]] == {key: i * i for i, key in enumerate(keys)}
 
     # Clear the cache bank
     cache_bank.clear()
@@ -392,8 +381,6 @@ def test_cache_wrapper(cache_bank, cached_square):
     for i in range(10):
         cached_square(i)
 
-    print(f"Cache Report: {cache_bank.print_cache_report()}")
-
     assert cache_bank.cached_reporter.hits == 5
     assert cache_bank.cached_reporter.misses == 9
 
@@ -413,8 +400,64 @@ def test_cache_callable(cache_bank, uncached_square):
 
     assert cache_bank.get(uncached_square, args=(1,), kwargs={}) == 1
     assert cache_bank.get(uncached_square, args=(2,), kwargs={}) == 4
-    
-    print(f"Cache Report: {cache_bank.print_cache_report()}")
+
+    # Wrapping again returns the same wrapper, updating the size
+    assert cache_bank(uncached_square, CacheSize.E_1KB) is wrapped_func
+    assert cache_bank.func_size_dict["square"] == CacheSize.E_1KB
+
+    # Clear the cache bank
+    cache_bank.clear()
+    # Reset the cache bank to default values
+    cache_bank.reset_default()
+
+def test_cache_callable_one_shot(cache_bank, uncached_square):
+    """Test that one-shot calls through the cache bank share the cached entries."""
+    assert cache_bank(uncached_square)(3) == 9
+    assert cache_bank(uncached_square)(3) == 9
+    assert cache_bank(uncached_square)(4) == 16
+
+    assert cache_bank.cached_reporter.hits == 1
+    assert len(cache_bank.cache_bank["square"]) == 2
+
+    # Clear the cache bank
+    cache_bank.clear()
+    # Reset the cache bank to default values
+    cache_bank.reset_default()
+
+def test_cache_callable_releases_functions(cache_bank):
+    """Test that wrapping functions through the cache bank does not keep them alive."""
+    funcs: List[weakref.ref] = []
+    for i in range(50):
+        def square(x: int) -> int:
+            return x * x
+        square.__name__ = f"square_{i}"
+        cache_bank(square)(i)
+        funcs.append(weakref.ref(square))
+    del square
+
+    cache_bank.clear()
+    gc.collect()
+
+    assert all(func() is None for func in funcs)
+    assert len(cache_bank._wrappers) == 0
+
+    # Reset the cache bank to default values
+    cache_bank.reset_default()
+
+def test_cache_callable_interned_name(cache_bank):
+    """Test that wrapping a function keys the cache bank with its interned name."""
+    def square(x: int) -> int:
+        return x * x
+    # Build the name at runtime, so it is not interned by the compiler
+    name: str = "".join(["square", "_dynamic"])
+    square.__name__ = name
+
+    wrapped_func: Callable = cache_bank(square)
+    wrapped_func(2)
+
+    assert next(iter(cache_bank.cache_bank)) is sys.intern("square_dynamic")
+    # The wrapped function itself is left untouched
+    assert square.__name__ is name
 
     # Clear the cache bank
     cache_bank.clear()
@@ -431,13 +474,7 @@ def test_save_cache_bank(cache_bank, tmp_path, uncached_square):
 
     cache_bank.save(temp_file)
 
-    try:
-        with open(temp_file, "rb") as f:
-            data = f.read()
-            assert data is not None
-    except FileNotFoundError as e:
-        print("File not found, skipping test.")
-        raise e
+    assert temp_file.stat().st_size > 0
     
 def test_load_cache_bank(cache_bank, tmp_path, uncached_square):
 
@@ -448,9 +485,7 @@ def test_load_cache_bank(cache_bank, tmp_path, uncached_square):
 
     cache_bank.save(temp_file)
 
-    with open(temp_file, "rb") as f:
-        data = f.read()
-        assert data is not None
+    assert temp_file.stat().st_size > 0
     
     cache_bank.clear()
 
@@ -463,21 +498,21 @@ def test_load_cache_bank(cache_bank, tmp_path, uncached_square):
 
 @pytest.mark.parametrize(
     "cache_type, suffix",
-    SAVE_CACHE_TYPES_VARS
+    SAVE_CACHE_TYPES_VARS,
+    ids=_param_id
 )
-def test_save_cache_bank_with_different_types(cache_bank, tmp_path, uncached_square, cache_type, suffix):
+def test_save_cache_bank_with_different_types(cache_bank, save_dir, uncached_square, cache_type, suffix):
     """Test the save method of the CacheBank class with different cache types."""
     cache_bank.cache_type = cache_type
-    temp_file = tmp_path / f"test_file{suffix}"
+    # Each cache type writes its own suffix, so the cases never share a file
+    temp_file = save_dir / f"test_file{suffix}"
     
     cache_bank.set(uncached_square, args=(1,), kwargs={}, result=1)
     cache_bank.set(uncached_square, args=(2,), kwargs={}, result=4)
 
     cache_bank.save(temp_file)
 
-    with open(temp_file, "rb") as f:
-        data = f.read()
-        assert data is not None
+    assert temp_file.stat().st_size > 0
     
     # Clear the cache bank
     cache_bank.clear()
@@ -495,38 +530,305 @@ def test_save_cache_bank_with_different_types(cache_bank, tmp_path, uncached_squ
     # Reset the cache bank to default values
     cache_bank.reset_default()
 
+@pytest.mark.parametrize(
+    "cache_type, suffix",
+    [(CacheType.JSON, ".json"), (CacheType.YAML, ".yaml")],
+    ids=_param_id
+)
+def test_load_cache_bank_many_functions(cache_bank, tmp_path, cache_type, suffix):
+    """Test loading a cache bank with enough functions to use the parallel deserialization."""
+    cache_bank.cache_type = cache_type
+    temp_file = tmp_path / f"test_many{suffix}"
+
+    funcs = []
+    for n in range(10):
+        def func(x):
+            return x + 1
+        func.__name__ = f"func_{n}"
+        funcs.append(func)
+        cache_bank.set(func, args=(n,), kwargs={}, result=n + 1)
+
+    cache_bank.save(temp_file)
+    cache_bank.clear()
+    cache_bank.load(temp_file)
+
+    # Order of the functions must be kept
+    assert cache_bank.keys() == [f"func_{n}" for n in range(10)]
+    for n, func in enumerate(funcs):
+        assert cache_bank.get(func, args=(n,), kwargs={}) == n + 1
+
+    # Reset the cache bank to default values
+    cache_bank.reset_default()
+
+def test_save_json_non_finite_floats(cache_bank, tmp_path):
+    """Test that NaN and infinite results survive a JSON round trip."""
+    cache_bank.cache_type = CacheType.JSON
+    temp_file = tmp_path / "test_non_finite.json"
+
+    def identity(x: float) -> float:
+        return x
+
+    for n, value in enumerate((float("nan"), float("inf"), float("-inf"))):
+        cache_bank.set(identity, args=(n,), kwargs={}, result=value)
+
+    cache_bank.save(temp_file)
+    cache_bank.clear()
+    cache_bank.load(temp_file)
+
+    assert math.isnan(cache_bank.get(identity, args=(0,), kwargs={}))
+    assert cache_bank.get(identity, args=(1,), kwargs={}) == float("inf")
+    assert cache_bank.get(identity, args=(2,), kwargs={}) == float("-inf")
+
+    # Reset the cache bank to default values
+    cache_bank.reset_default()
+
+@pytest.mark.skipif(find_spec("msgpack") is None, reason="msgpack is not installed")
+def test_save_msgpack_big_ints(cache_bank, tmp_path, uncached_square):
+    """Test that integers wider than 64 bits survive a msgpack round trip."""
+    cache_bank.cache_type = CacheType.MSGPACK
+    temp_file = tmp_path / "test_big_ints.mpk"
+
+    cache_bank.set(uncached_square, args=(10 ** 15,), kwargs={}, result=10 ** 30)
+    cache_bank.set(uncached_square, args=(2,), kwargs={}, result=[-(10 ** 30), 4])
+
+    cache_bank.save(temp_file)
+    cache_bank.clear()
+    cache_bank.load(temp_file)
+
+    assert cache_bank.get(uncached_square, args=(10 ** 15,), kwargs={}) == 10 ** 30
+    assert cache_bank.get(uncached_square, args=(2,), kwargs={}) == [-(10 ** 30), 4]
+
+    # Reset the cache bank to default values
+    cache_bank.reset_default()
+
+def test_deserialization_returns_ordered_dicts(cache_bank):
+    """Test that tuple-keyed data is returned as nested OrderedDicts, whichever mapping the parser built."""
+    loaders = cache_bank.loaders_container
+    data = {"square": {("square", (2,)): 4}}
+
+    for deserialize_needed in (True, False):
+        # The flag can be turned off per container
+        loaders._deserialize_needed = deserialize_needed
+        bank = loaders._deserialization(data)
+
+        assert type(bank) is OrderedDict
+        assert type(bank["square"]) is OrderedDict
+        assert bank == data
+
+    loaders._deserialize_needed = True
+    # Other containers keep the default
+    assert LoadersContainer()._deserialize_needed is True
+
+def test_clear_converters(cache_bank):
+    """Test that clearing the converters removes only the custom ones."""
+    converters = cache_bank.converter_container
+    converters.add_converter("custom", lambda cache_bank: b"")
+
+    with pytest.raises(ValueError):
+        converters.remove_converter(CacheType.JSON)
+
+    converters.clear_converters()
+    assert "custom" not in converters.converters
+    assert CacheType.JSON in converters.converters
+
+def test_cleanup_loaders(cache_bank):
+    """Test that cleaning up the loaders removes only the custom ones."""
+    loaders = cache_bank.loaders_container
+    loaders["custom"] = lambda data: OrderedDict()
+
+    # Default loaders are kept
+    loaders.remove_loader(CacheType.JSON)
+    assert CacheType.JSON in loaders.loaders
+
+    loaders.cleanup()
+    assert "custom" not in loaders.loaders
+    assert set(loaders.loaders) == set(DEFAULT_LOADERS)
+
+@pytest.mark.parametrize(
+    "cache_type, suffix",
+    [
+        (CacheType.GZIP, ".gz"),
+        pytest.param(
+            CacheType.ZSTD, ".zst",
+            marks=pytest.mark.skipif(find_spec("zstandard") is None, reason="zstandard is not installed")
+        )
+    ],
+    ids=_param_id
+)
+def test_save_parallel_compression(cache_bank, tmp_path, uncached_square, monkeypatch, cache_type, suffix):
+    """Test saving and loading a cache bank large enough to be compressed in parallel."""
+    monkeypatch.setattr(cache_save_comp, "PARALLEL_COMPRESSION_CHUNK_SIZE", 128)
+    cache_bank.cache_type = cache_type
+    temp_file = tmp_path / f"test_parallel{suffix}"
+
+    keys = [cache_bank.make_hashable(uncached_square, (i,), {}) for i in range(50)]
+    for i in range(50):
+        cache_bank.set(uncached_square, args=(i,), kwargs={}, result=i * i)
+
+    cache_bank.save(temp_file)
+    cache_bank.clear()
+    cache_bank.load(temp_file)
+
+    assert cache_bank.cache_bank[keys[0][0]] == {key: i * i for i, key in enumerate(keys)}
+
+    # Reset the cache bank to default values
+    cache_bank.reset_default()
+
+def test_save_optimized_pickle(cache_bank, tmp_path, uncached_square):
+    """Test saving and loading an optimized pickle."""
+    cache_bank.converter_container.optimize_pickle = True
+    temp_file = tmp_path / "test_optimized.pkl"
+
+    keys = [cache_bank.make_hashable(uncached_square, (i,), {}) for i in range(10)]
+    for i in range(10):
+        cache_bank.set(uncached_square, args=(i,), kwargs={}, result=i * i)
+
+    cache_bank.save(temp_file)
+    cache_bank.clear()
+    cache_bank.load(temp_file)
+
+    assert cache_bank.cache_bank[keys[0][0]] == {key: i * i for i, key in enumerate(keys)}
+
+    # Reset the cache bank to default values
+    cache_bank.converter_container.optimize_pickle = False
+    cache_bank.reset_default()
+
+@pytest.mark.parametrize(
+    "cache_type, suffix",
+    [(CacheType.JSON, ".json"), (CacheType.YAML, ".yaml")],
+    ids=_param_id
+)
+def test_save_keeps_cache_bank_keys(cache_bank, tmp_path, uncached_square, cache_type, suffix):
+    """Test that saving to a text format does not stringify the keys of the live cache bank."""
+    cache_bank.cache_type = cache_type
+    cache_bank.set(uncached_square, args=(3,), kwargs={}, result=9)
+
+    cache_bank.save(tmp_path / f"test_keys{suffix}")
+
+    # The cache bank must still be usable after the save
+    assert cache_bank.get(uncached_square, args=(3,), kwargs={}) == 9
+
+    # Reset the cache bank to default values
+    cache_bank.reset_default()
+
 
 # -------------------------------------------------------------------------------------------------
 # Functionality Tests
 # ------------------------------------------------------------------------------------------------- 
 
-def test_keys(cache_bank, cached_square):
+def test_keys(cache_bank, warmed_square):
     """Test the keys method of the CacheBank class."""
-    for i in range(5):
-        cached_square(i)
-
     keys = cache_bank.keys()
     assert len(keys) == 1
 
-    print("Keys in the cache bank:")
-    for i in keys:
-        print(f"Key: {i}")
-    
     # Clear the cache bank
     cache_bank.clear()
 
-def test_values(cache_bank, cached_square):
+def test_values(cache_bank, warmed_square):
     """Test the values method of the CacheBank class."""
-    for i in range(5):
-        cached_square(i)
+    values = cache_bank.values()
+    assert len(values) == 1
 
+    actual: dict = {}
+    for dc in values:
+        actual.update(dc)
+    assert actual == {('square', (i,)): i * i for i in range(5)}
+
+    # Clear the cache bank
+    cache_bank.clear()
+
+    # Reset the cache bank to default values
+    cache_bank.reset_default()
+
+@pytest.mark.parametrize(
+    "cache_type, suffix",
+    [
+        (CacheType.GZIP, ".gz"),
+        pytest.param(
+            CacheType.ZSTD, ".zst",
+            marks=pytest.mark.skipif(find_spec("zstandard") is None, reason="zstandard is not installed")
+        )
+    ],
+    ids=_param_id
+)
+def test_save_parallel_compression(cache_bank, tmp_path, uncached_square, monkeypatch, cache_type, suffix):
+    """Test saving and loading a cache bank large enough to be compressed in parallel."""
+    monkeypatch.setattr(cache_save_comp, "PARALLEL_COMPRESSION_CHUNK_SIZE", 128)
+    cache_bank.cache_type = cache_type
+    temp_file = tmp_path / f"test_parallel{suffix}"
+
+    keys = [cache_bank.make_hashable(uncached_square, (i,), {}) for i in range(50)]
+    for i in range(50):
+        cache_bank.set(uncached_square, args=(i,), kwargs={}, result=i * i)
+
+    cache_bank.save(temp_file)
+    cache_bank.clear()
+    cache_bank.load(temp_file)
+
+    assert cache_bank.cache_bank[keys[0][0]] == {key: i * i for i, key in enumerate(keys)}
+
+    # Reset the cache bank to default values
+    cache_bank.reset_default()
+
+def test_save_optimized_pickle(cache_bank, tmp_path, uncached_square):
+    """Test saving and loading an optimized pickle."""
+    cache_bank.converter_container.optimize_pickle = True
+    temp_file = tmp_path / "test_optimized.pkl"
+
+    keys = [cache_bank.make_hashable(uncached_square, (i,), {}) for i in range(10)]
+    for i in range(10):
+        cache_bank.set(uncached_square, args=(i,), kwargs={}, result=i * i)
+
+    cache_bank.save(temp_file)
+    cache_bank.clear()
+    cache_bank.load(temp_file)
+
+    assert cache_bank.cache_bank[keys[0][0]] == {key: i * i for i, key in enumerate(keys)}
+
+    # Reset the cache bank to default values
+    cache_bank.converter_container.optimize_pickle = False
+    cache_bank.reset_default()
+
+@pytest.mark.parametrize(
+    "cache_type, suffix",
+    [(CacheType.JSON, ".json"), (CacheType.YAML, ".yaml")],
+    ids=_param_id
+)
+def test_save_keeps_cache_bank_keys(cache_bank, tmp_path, uncached_square, cache_type, suffix):
+    """Test that saving to a text format does not stringify the keys of the live cache bank."""
+    cache_bank.cache_type = cache_type
+    cache_bank.set(uncached_square, args=(3,), kwargs={}, result=9)
+
+    cache_bank.save(tmp_path / f"test_keys{suffix}")
+
+    # The cache bank must still be usable after the save
+    assert cache_bank.get(uncached_square, args=(3,), kwargs={}) == 9
+
+    # Reset the cache bank to default values
+    cache_bank.reset_default()
+
+
+# -------------------------------------------------------------------------------------------------
+# Functionality Tests
+# ------------------------------------------------------------------------------------------------- 
+
+def test_keys(cache_bank, warmed_square):
+    """Test the keys method of the CacheBank class."""
+    keys = cache_bank.keys()
+    assert len(keys) == 1
+
+    # Clear the cache bank
+    cache_bank.clear()
+
+def test_values(cache_bank, warmed_square):
+    """Test the values method of the CacheBank class."""
     values = cache_bank.values()
     assert len(values) == 1
 
-    print("Values in the cache bank:")
-    for i, dc in enumerate(values):
-        print(f"Value: {dc}")
-        assert dc[('square', (i,))] == i * i 
+    actual: dict = {}
+    for dc in values:
+        actual.update(dc)
+    assert actual == {('square', (i,)): i * i for i in range(5)}
 
     # Clear the cache bank
     cache_bank.clear()
@@ -534,11 +836,28 @@ def test_values(cache_bank, cached_square):
     # Reset the cache bank to default values
     cache_bank.reset_default()
 
-def test_clear(cache_bank, cached_square):
-    """Test the clear method of the CacheBank class."""
-    for i in range(5):
-        cached_square(i)
+def test_entry_stats(cache_bank, uncached_square):
+    """Test that entry_stats tracks sets and evictions without walking the cache."""
+    cache_bank.set_many(uncached_square, range(5), [i * i for i in range(5)])
+    stats = cache_bank.entry_stats("square")
+    assert stats["entries"] == 5
+
+    # Overwriting a key keeps the entry count
+    cache_bank.set(uncached_square, args=(0,), result=0)
+    assert cache_bank.entry_stats("square") == stats
+
+    # The tracked counters match a full recount
+    cache_bank._func_bytes.clear()
+    assert cache_bank.entry_stats("square") == stats
+
+    with pytest.raises(CacheBankUtilsError):
+        cache_bank.entry_stats("missing")
 
+    # Reset the cache bank to default values
+    cache_bank.reset_default()
+
+def test_clear(cache_bank, warmed_square):
+    """Test the clear method of the CacheBank class."""
     assert len(cache_bank.cache_bank) == 1
 
     cache_bank.clear()
@@ -548,8 +867,6 @@ def test_clear(cache_bank, cached_square):
     assert cache_bank.cached_reporter.misses == 0
     assert cache_bank.cached_reporter.total == 0
 
-    print("Cache bank cleared.")
-
 def test_is_empty(cache_bank, cached_square):
     """Test the is_empty method of the CacheBank class."""
     assert cache_bank.is_empty() is True
@@ -563,8 +880,6 @@ def test_is_empty(cache_bank, cached_square):
 
     assert cache_bank.is_empty() is True
 
-    print("Cache bank is empty.")
-
 def test_is_full(cache_bank, cached_square):
     """Test the is_full method of the CacheBank class."""
     assert cache_bank.is_full() is False
@@ -583,8 +898,6 @@ def test_is_full(cache_bank, cached_square):
     # Reset the cache bank
     cache_bank.reset_default()
 
-    print("Cache bank is full.")
-
 def test_lru(cache_bank, cached_square, cached_cube):
     """Test the LRU (Least Recently Used) functionality of the CacheBank class."""
     # Set the maximum size of the cache bank to 5
@@ -604,9 +917,6 @@ def test_lru(cache_bank, cached_square, cached_cube):
     for i in range(5):
         cached_cube(i)
 
-    print("Cache bank after adding more elements:")
-    cache_bank.print_full_report()
-
     # Check if length of cache bank is equal to max bank size
     assert len(cache_bank.cache_bank) == 1
     # Check if the least recently used item (0) is removed
@@ -630,7 +940,7 @@ def test_func_mem_lru(cache_bank, cached_square):
 # Config Tests
 # -------------------------------------------------------------------------------------------------
 
-def test_static_config_dict(config_dict):
+def test_static_config_dict(config_dict=CONFIG_DICT):
     """Test the static config dictionary of the CacheBank class."""
 
     cache: CacheBank = CacheBank.static_config_from_dict(config_dict) 
@@ -644,10 +954,10 @@ def test_static_config_dict(config_dict):
     assert cache.max_total_memory_size == CacheSize.E_10MB, f"max_total_memory_size not set correctly, got {cache.max_total_memory_size}, expected CacheSize.E_10MB"
     assert cache.max_func_memory_size == CacheSize.E_10KB , f"max_func_memory_size not set correctly, got {cache.max_func_memory_size}, expected CacheSize.E_10KB"
 
-def test_static_config_json(config_dict):
+def test_static_config_json(config_dict=CONFIG_DICT):
     """Test the static config JSON method of the CacheBank class."""
 
-    json_data: bytes = json.dumps(config_dict, ).encode("utf-8")
+    json_data: bytes = cache_save_comp._json_dumps(dict(config_dict))
 
     cache: CacheBank = CacheBank.static_config_from_json(json_data) 
 
@@ -660,12 +970,12 @@ def test_static_config_json(config_dict):
     assert cache.max_total_memory_size == CacheSize.E_10MB, f"max_total_memory_size not set correctly, got {cache.max_total_memory_size}, expected CacheSize.E_10MB"
     assert cache.max_func_memory_size == CacheSize.E_10KB , f"max_func_memory_size not set correctly, got {cache.max_func_memory_size}, expected CacheSize.E_10KB"
 
-def test_config_dict(config_dict):
+def test_config_dict(config_dict=CONFIG_DICT):
     """Test the config dictionary method of the CacheBank class."""
     cache_bank: CacheBank = CacheBank()
     cache_bank.config_from_dict(config_dict)
 
-    assert isinstance(config_dict, dict) , "config_dict is not a dictionary"
+    assert isinstance(config_dict, Mapping) , "config_dict is not a mapping"
     assert config_dict["max_bank_size"] == 100 , f"max_bank_size not set correctly, got {config_dict['max_bank_size']}, expected 100"
     assert config_dict["lru"] is True , f"lru not set correctly, got {config_dict['lru']}, expected True"
     assert config_dict["max_file_size"] == 100000 , f"max_file_size not set correctly, got {config_dict['max_file_size']}, expected 100000"
@@ -674,10 +984,10 @@ def test_config_dict(config_dict):
     assert config_dict["max_total_memory_size"] == CacheSize.E_10MB, f"max_total_memory_size not set correctly, got {config_dict['max_total_memory_size']}, expected CacheSize.E_10MB"
     assert config_dict["max_func_memory_size"] == CacheSize.E_10KB , f"max_func_memory_size not set correctly, got {config_dict['max_func_memory_size']}, expected CacheSize.E_10KB"
 
-def test_config_json(config_dict):
+def test_config_json(config_dict=CONFIG_DICT):
     """Test the config JSON method of the CacheBank class."""
     cache_bank: CacheBank = CacheBank()
-    json_data: bytes = json.dumps(config_dict).encode("utf-8")
+    json_data: bytes = cache_save_comp._json_dumps(dict(config_dict))
     cache_bank.config_from_json(json_data)
 
     assert isinstance(json_data, bytes) , "json_data is not a bytes object"
@@ -2,6 +2,7 @@
 # Imports
 # -------------------------------------------------------------------------------------------------
 
+import logging
 import pytest
 import sys
 import os
@@ -10,7 +11,7 @@ import json
 from typing import Callable, Final
 from collections import OrderedDict
 # Local imports
-from jr_cache_bank.cache.cache_bank import CacheBank, CacheType
+from jr_cache_bank.cache.cache_bank import CacheBank, CacheType, EVICTION_LOW_WATER
 from jr_cache_bank.cache.cache_enums import CacheSize
 from jr_cache_bank.exceptions.exceptions_cache_bank import (
     CacheBankConstructionError,
@@ -21,28 +22,37 @@ from jr_cache_bank.exceptions.exceptions_cache_bank import (
 )
 from tests.test_cache_bank import cached_cube
 
+# -------------------------------------------------------------------------------------------------
+# Logging
+# -------------------------------------------------------------------------------------------------
+
+# Reports are only built when shown, with --log-cli-level=DEBUG
+LOGGER = logging.getLogger(__name__)
+
 # -------------------------------------------------------------------------------------------------
 # Fixtures
 # -------------------------------------------------------------------------------------------------
 
-@pytest.fixture
-def cache_bank():
-    """Fixture to create a CacheBank instance for testing."""
-    cache_bank: CacheBank = CacheBank()
-    # Reset the cache bank to default values
+@pytest.fixture(scope="session")
+def cache_bank() -> CacheBank:
+    """Fixture to create the CacheBank instance shared by the LRU tests."""
+    return CacheBank()
+
+@pytest.fixture(autouse=True)
+def _reset_cache_bank(cache_bank, tmp_path) -> None:
+    """Fixture emptying the shared cache bank before each test, saving under the test's temporary directory."""
     cache_bank.clear()
+    # Reset the cache bank to default values
     cache_bank.reset_default()
-    cache_bank.remove_files()
-    return cache_bank
+    cache_bank.max_total_memory_size = CacheSize.E_10MB
+    cache_bank.max_func_memory_size = CacheSize.E_16KB
+    cache_bank.func_size_dict = {}
+    cache_bank.filename = tmp_path / "cache_bank.pkl"
 
 @pytest.fixture
 def square_function():
     """A simple function to be used for testing."""
     def square(x: int) -> int:
-        if not isinstance(x, int):
-            raise TypeError("Input must be an integer")
-        if x < 0:
-            raise ValueError("Input must be a non-negative integer")
         return x * x
     return square
 
@@ -50,10 +60,6 @@ def square_function():
 def cube_function():
     """A simple function to be used for testing."""
     def cube(x: int) -> int:
-        if not isinstance(x, int):
-            raise TypeError("Input must be an integer")
-        if x < 0:
-            raise ValueError("Input must be a non-negative integer")
         return x * x * x
     return cube
 
@@ -61,8 +67,6 @@ def cube_function():
 def sum_function():
     """A simple function to be used for testing."""
     def sum_func(x: int, y: int) -> int:
-        if not isinstance(x, int) or not isinstance(y, int):
-            raise TypeError("Inputs must be integers")
         return x + y
     return sum_func
 
@@ -70,11 +74,12 @@ def sum_function():
 # Tests
 # -------------------------------------------------------------------------------------------------
 
-def test_cache_bank_lru(cache_bank: CacheBank, square_function, cube_function, sum_function) -> None:
+@pytest.mark.parametrize("max_bank_size", [1, 2, 3])
+def test_cache_bank_lru(cache_bank: CacheBank, square_function, cube_function, sum_function, max_bank_size: int) -> None:
     """Test the LRU cache functionality of CacheBank."""
 
     # Set Maximum bank size
-    cache_bank.max_bank_size = 2
+    cache_bank.max_bank_size = max_bank_size
 
     # Set cache type to LRU
     cache_bank.lru = True
@@ -85,25 +90,27 @@ def test_cache_bank_lru(cache_bank: CacheBank, square_function, cube_function, s
     cached_cube: Callable = cache_bank(cube_function)
 
     # Test caching functionality
-    for i in range(10):
-        _ = cached_square(i)
+    _ = list(map(cached_square, range(10)))
 
-    for i in range(10):
-        _ = cached_cube(i)
+    _ = list(map(cached_cube, range(10)))
 
-    cache_bank.print_full_report()
+    if LOGGER.isEnabledFor(logging.DEBUG):
+        cache_bank.print_full_report()
 
     # Check if the cache size is correct
-    assert cache_bank.bank_length == 2, "Cache size should be 2 after adding 2 funcs."
+    assert cache_bank.bank_length == min(2, max_bank_size), \
+        "Cache size should be capped by the maximum bank size after adding 2 funcs."
 
     # add one more item to exceed the cache size
     cached_sum: Callable = cache_bank(sum_function)
     _ = cached_sum(1, 2)
 
-    cache_bank.print_full_report()
+    if LOGGER.isEnabledFor(logging.DEBUG):
+        cache_bank.print_full_report()
 
-    # Check if the cache size is still 10 (LRU eviction should occur)
-    assert cache_bank.bank_length == 2, "Cache size should still be 2 after adding 3 items."
+    # Check if the cache size is still capped (LRU eviction should occur)
+    assert cache_bank.bank_length == min(3, max_bank_size), \
+        "Cache size should still be capped by the maximum bank size after adding 3 funcs."
 
 
 def test_cache_bank_total_mem_lru(cache_bank: CacheBank, square_function, cube_function, sum_function) -> None:
@@ -126,18 +133,15 @@ def test_cache_bank_total_mem_lru(cache_bank: CacheBank, square_function, cube_f
     cached_cube: Callable = cache_bank(cube_function)
     cached_sum: Callable = cache_bank(sum_function)
 
-    print("Total memory size of the cache bank before:", sys.getsizeof(cache_bank.cache_bank))
+    LOGGER.debug(f"Total memory size of the cache bank before: {cache_bank.total_memory_bytes}")
 
-    for i in range(200):
-        _ = cached_square(i)
+    _ = list(map(cached_square, range(200)))
 
-    for i in range(200):
-        _ = cached_cube(i)
+    _ = list(map(cached_cube, range(200)))
 
-    for i in range(200):
-        _ = cached_sum(i, i + 1)
+    _ = list(map(cached_sum, range(200), range(1, 201)))
         
-    assert sys.getsizeof(cache_bank.cache_bank) <= cache_bank.max_total_memory_size.value, \
+    assert cache_bank.total_memory_bytes <= cache_bank.max_total_memory_size.value, \
         "Total memory size of the cache bank should not exceed the maximum limit."
     
 
@@ -153,10 +157,9 @@ def test_cache_bank_default_mem_func_lru(cache_bank: CacheBank, square_function)
     # wrap the square function with the cache bank
     cached_square: Callable = cache_bank(square_function)
 
-    for i in range(200):
-        _ = cached_square(i)
+    _ = list(map(cached_square, range(200)))
     
-    assert sys.getsizeof(cache_bank.cache_bank) <= cache_bank.max_func_memory_size, \
+    assert cache_bank.get_func_object_mem_size("square") <= cache_bank.max_func_memory_size, \
         "Total func memory size of the cache bank should not exceed the maximum limit."
     
     assert len(cache_bank.cache_bank["square"]) < 200, \
@@ -172,20 +175,15 @@ def test_cache_bank_specific_mem_func_lru(cache_bank: CacheBank, square_function
     # Set cache type to LRU
     cache_bank.lru = True
 
-    # Set the maximum memory size for the square function
-    cache_bank(square_function, CacheSize.E_1KB)  
-
-    # wrap the square function with the cache bank
-    cached_square: Callable = cache_bank(square_function)
-
-    for i in range(5):
-        _ = cached_square(i)
+    # wrap the square function with the cache bank, with a specific maximum memory size
+    cached_square: Callable = cache_bank(square_function, CacheSize.E_1KB)
 
-    cache_bank.print()
+    _ = list(map(cached_square, range(5)))
 
-    print(cache_bank.func_size_dict)
-
-    print("Total memory size of the cache bank after:", sys.getsizeof(cache_bank.cache_bank["square"]))
+    if LOGGER.isEnabledFor(logging.DEBUG):
+        cache_bank.print()
+        LOGGER.debug(f"Function sizes: {cache_bank.func_size_dict}")
+        LOGGER.debug(f"Total memory size of the cache bank after: {sys.getsizeof(cache_bank.cache_bank['square'])}")
     
     assert len(cache_bank.cache_bank["square"]) < 5, \
         "Cache size for square_function should be less than 5 after LRU eviction."
@@ -203,19 +201,35 @@ def test_cache_bank_wrap_specific_mem_func_lru(cache_bank: CacheBank) -> None:
     @cache_bank.wrapper(CacheSize.E_1KB)
     def square(x: int) -> int:
         """A simple square function."""
-        if not isinstance(x, int):
-            raise TypeError("Input must be an integer")
-        if x < 0:
-            raise ValueError("Input must be a non-negative integer")
         return x * x
 
-    for i in range(5):
-        _ = square(i)
-
-    cache_bank.print()
+    _ = list(map(square, range(5)))
 
-    print(cache_bank.func_size_dict)
+    if LOGGER.isEnabledFor(logging.DEBUG):
+        cache_bank.print()
+        LOGGER.debug(f"Function sizes: {cache_bank.func_size_dict}")
 
     assert len(cache_bank.cache_bank["square"]) < 5, \
         "Cache size for square_function should be less than 5 after LRU eviction."
   
+
+
+def test_cache_bank_batch_eviction_lru(cache_bank: CacheBank, square_function) -> None:
+    """Test that an over-limit function is trimmed down to the low-water mark in one batch."""
+
+    # Set cache type to LRU
+    cache_bank.lru = True
+
+    cached_square: Callable = cache_bank(square_function, CacheSize.E_8KB)
+
+    _ = list(map(cached_square, range(50)))
+
+    limit: int = cache_bank._func_mem_size("square")
+    cache_bank._trim_func("square", limit)
+
+    assert cache_bank._func_mem_size("square") <= int(limit * EVICTION_LOW_WATER), \
+        "Function size should drop to the low-water mark after trimming."
+    assert ("square", (49,)) in cache_bank.cache_bank["square"], \
+        "The most recent entry should survive the eviction."
+    assert ("square", (0,)) not in cache_bank.cache_bank["square"], \
+        "The oldest entry should be evicted first."
@@ -0,0 +1,85 @@
+# -------------------------------------------------------------------------------------------------
+# Imports
+# -------------------------------------------------------------------------------------------------
+
+import pytest
+
+from functools import partial
+
+# Local imports
+from jr_cache_bank.cache.cache_reporter import CacheReporter
+
+# -------------------------------------------------------------------------------------------------
+# Fixtures
+# -------------------------------------------------------------------------------------------------
+
+@pytest.fixture
+def reporter():
+    """Fixture to create a CacheReporter instance for testing."""
+    return CacheReporter()
+
+def square(x: int) -> int:
+    """A simple function to be tracked by the reporter."""
+    return x * x
+
+# -------------------------------------------------------------------------------------------------
+# Tests
+# -------------------------------------------------------------------------------------------------
+
+@pytest.mark.parametrize("func", [square, partial(square), "square"])
+def test_set_hit_with_callable(reporter, func):
+    """Test that hits are recorded whether the function is passed as a callable, partial or name."""
+    reporter.add_func(square)
+    reporter.set_hit(func)
+
+    assert reporter.funcs["square"]["hits"] == 1
+    assert reporter.hits == 1
+    assert reporter.total == 1
+
+@pytest.mark.parametrize("func", [square, partial(square), "square"])
+def test_set_miss_with_callable(reporter, func):
+    """Test that misses are recorded whether the function is passed as a callable, partial or name."""
+    reporter.add_func(square)
+    reporter.set_miss(func)
+
+    assert reporter.funcs["square"]["misses"] == 1
+    assert reporter.misses == 1
+    assert reporter.total == 1
+
+def test_print_func_report_with_callable(reporter, capsys):
+    """Test that the function report is printed for a callable."""
+    reporter.add_func(square)
+    reporter.set_hit(square)
+    reporter.print_func_report(square)
+
+    assert "Function square:" in capsys.readouterr().out
+
+def test_func_rates_computed_on_read(reporter):
+    """Test that both per-function rates reflect hits and misses."""
+    reporter.add_func(square)
+    reporter.set_hit(square)
+    reporter.set_miss(square)
+
+    stats = reporter.get(square)
+    assert stats["total"] == 2
+    assert stats["hit_rate"] == 0.5
+    assert stats["miss_rate"] == 0.5
+
+def test_del_func_keeps_other_funcs(reporter):
+    """Test that removing a function keeps the stats of the others."""
+    names = ["first", "second", "third"]
+    for name in names:
+        reporter[name] = {"hits": len(name), "misses": 1, "total": len(name) + 1}
+
+    reporter.del_func("first")
+
+    assert "first" not in reporter
+    assert len(reporter) == 2
+    assert reporter.funcs == {
+        "second": {"hits": 6, "misses": 1, "total": 7, "hit_rate": 6 / 7, "miss_rate": 1 / 7},
+        "third": {"hits": 5, "misses": 1, "total": 6, "hit_rate": 5 / 6, "miss_rate": 1 / 6},
+    }
+
+    # The remaining functions still receive their events
+    reporter.set_hit("third")
+    assert reporter["third"]["hits"] == 6
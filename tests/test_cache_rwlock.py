@@ -0,0 +1,68 @@
+# -------------------------------------------------------------------------------------------------
+# Imports
+# -------------------------------------------------------------------------------------------------
+
+import threading
+
+# Local imports
+from jr_cache_bank.cache.cache_rwlock import RWLock
+
+# -------------------------------------------------------------------------------------------------
+# Tests
+# -------------------------------------------------------------------------------------------------
+
+def test_readers_share_the_lock():
+    """Test that several readers can hold the lock at the same time."""
+    lock: RWLock = RWLock()
+    barrier: threading.Barrier = threading.Barrier(3, timeout=5)
+
+    def reader() -> None:
+        with lock.read_lock():
+            # Only passes if all readers are inside together
+            barrier.wait()
+
+    threads = [threading.Thread(target=reader) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not barrier.broken
+
+def test_writer_excludes_readers():
+    """Test that a writer blocks readers until it releases the lock."""
+    lock: RWLock = RWLock()
+    events: list = []
+
+    def reader() -> None:
+        with lock.read_lock():
+            events.append("read")
+
+    with lock:
+        thread = threading.Thread(target=reader)
+        thread.start()
+        thread.join(timeout=0.1)
+        assert thread.is_alive()
+        events.append("write")
+
+    thread.join()
+    assert events == ["write", "read"]
+
+def test_writers_are_exclusive():
+    """Test that concurrent writers never lose updates."""
+    lock: RWLock = RWLock()
+    counter: list = [0]
+
+    def writer() -> None:
+        for _ in range(1000):
+            with lock.write_lock():
+                value = counter[0]
+                counter[0] = value + 1
+
+    threads = [threading.Thread(target=writer) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert counter[0] == 4000